@@ -2,32 +2,50 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import io
+import bisect
 import json
 import logging
 import os
 import threading
+import time
 import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import ExitStack, asynccontextmanager, closing
 from datetime import datetime
 from queue import Empty, Full, Queue
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
-import matplotlib
 import neurokit2 as nk
 import numpy as np
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.responses import Response, StreamingResponse
-from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 from pydantic import BaseModel, Field
 
 load_dotenv()
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
 
-app = FastAPI()
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI):
+    _start_http_client()
+    start_render_service()
+    start_process_pool(preload_modules=("app",))
+    start_write_behind()
+    start_chunk_wal(_store_wal_chunk, _ship_wal_chunk, _commit_wal_chunks)
+    yield
+    stop_chunk_wal()
+    stop_write_behind()
+    shutdown_render_service()
+    shutdown_executors()
+    _close_http_client()
+    await _close_async_http_client()
+
+
+app = FastAPI(lifespan=_lifespan)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,25 +58,82 @@ BASE_URL = os.getenv("BASE_URL") or DEFAULT_BASE_URL
 
 from supabase import (
     REVIEW_PROCESSING_VERSION,
-    _fetch_latest_recording_id,
-    _fetch_latest_live_preview_row,
-    _fetch_live_preview_row,
-    _fetch_processed_artifact_key,
-    _fetch_processed_record,
+    STORAGE_HEDGE_AFTER_S,
+    _close_async_http_client,
+    _close_http_client,
+    _decode_storage_json,
+    _delete_storage_objects,
+    _fetch_latest_live_preview_row_async,
+    _fetch_latest_recording_id_async,
+    _fetch_live_preview_row_async,
+    _fetch_processed_metadata,
+    _fetch_processed_metadata_async,
     _fetch_recording_by_id,
+    _fetch_recording_by_id_async,
+    _fetch_session_chunk_rows,
+    _fetch_session_chunk_rows_async,
     _fetch_storage_bytes,
+    _fetch_storage_bytes_async,
+    _fetch_storage_json_async,
+    _fetch_storage_objects,
+    _fetch_storage_objects_async,
+    _fetch_storage_range,
     _fetch_storage_json,
     _get_supabase_config,
+    _http_client_metrics,
     _insert_recording_row,
-    _insert_session_chunk_row,
+    _insert_recording_row_async,
+    _insert_session_chunk_rows,
     _sg_now_iso,
+    _start_http_client,
+    _storage_object_exists,
     _update_recording_row,
-    _upsert_live_preview_row,
+    _update_recording_row_async,
+    _upsert_live_preview_row_async,
     _upsert_processed_artifact,
     _upsert_processed_record,
     _upload_storage_bytes,
     _upload_storage_json,
 )
+from executors import (
+    PROCESS_WORKERS,
+    executor_metrics,
+    process_pool_enabled,
+    run_in_pool,
+    shutdown_executors,
+    start_process_pool,
+    submit,
+    submit_process,
+)
+from artifact_format import decode_artifact, encode_artifact, is_binary_artifact
+from chunk_wal import append_chunk, chunk_wal_metrics, chunk_wal_running, drain_chunk_wal, start_chunk_wal, stop_chunk_wal
+from object_cache import object_cache_metrics, object_cached
+from render_service import render_metrics, render_png, render_png_many, shutdown_render_service, start_render_service
+from signal_pyramid import ENVELOPE_FACTORS, build_envelope_pyramid, envelope_buckets, select_envelope_factor
+from shared_arrays import SharedArrayHandle, attached_array, shared_arrays
+from write_behind import (
+    flush_write_behind,
+    queue_chunk_row,
+    queue_live_preview,
+    queue_recording_update,
+    start_write_behind,
+    stop_write_behind,
+    write_behind_metrics,
+)
+from jobs import (
+    JobCancelled,
+    active_job_id,
+    claim_job,
+    get_job,
+    job_event,
+    job_is_terminal,
+    raise_if_job_cancelled,
+    release_job,
+    set_job,
+    subscribe_job_events,
+    unsubscribe_job_events,
+    update_job_details,
+)
 from ui_previews import (
     LIVE_SESSION_STATE,
     LIVE_VISUAL_BUFFER_SAMPLES,
@@ -85,21 +160,48 @@ LAST_CALIBRATION_META = {
     "sample_count": 0,
 }
 
-ANALYSIS_JOBS: Dict[str, Dict[str, Any]] = {}
 DEFAULT_SAMPLE_RATE_HZ = 500
 REVIEW_WINDOW_SECONDS = 10
 REVIEW_ARTIFACT_CACHE: Dict[tuple[str, str, str], Dict[str, Any]] = {}
+# Counted in encoded shard bytes; the decoded lists take a few times that in memory.
+REVIEW_SHARD_CACHE_BYTES = max(0, int(os.getenv("REVIEW_SHARD_CACHE_MB") or 64)) * 1024 * 1024
+REVIEW_SHARD_CACHE: "OrderedDict[tuple[str, str, str, str], tuple[Dict[str, Any], int]]" = OrderedDict()
+REVIEW_SHARD_CACHE_USED_BYTES = 0
+REVIEW_SHARD_CACHE_LOCK = threading.Lock()
+REVIEW_ENVELOPE_MAX_PIXELS = 8192
 VECTOR3D_IMAGE_CACHE: Dict[tuple[str, str, int, float, float, int], str] = {}
 VECTOR3D_PRELOAD_STATE: Dict[tuple[str, str, float, float, int], Dict[str, Any]] = {}
 VECTOR3D_PRELOAD_LOCK = threading.Lock()
 LIVE_EVENT_SUBSCRIBERS: list[Queue[str]] = []
 LIVE_EVENT_SUBSCRIBERS_LOCK = threading.Lock()
 STATIC_REVIEW_PROCESSING_VERSION = "static_review_meanbeat_v1"
+STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE = "static_review_manifest"
 STATIC_REVIEW_PREFIX = "review-static"
 STATIC_REVIEW_WINDOW_SECONDS = 20
 STATIC_REVIEW_WINDOW_SAMPLES = DEFAULT_SAMPLE_RATE_HZ * STATIC_REVIEW_WINDOW_SECONDS
 STATIC_REVIEW_OUTLIER_Z_THRESHOLD = 2.5
-STATIC_REVIEW_IMAGE_CACHE: Dict[str, bytes] = {}
+# Manifests of static review jobs running in this process, so readers see windows between flushes. Finished
+# manifests are read from storage, where the object cache revalidates them against writes by other processes.
+STATIC_REVIEW_MANIFEST_CACHE_SIZE = 64
+STATIC_REVIEW_MANIFEST_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+STATIC_REVIEW_MANIFEST_CACHE_LOCK = threading.Lock()
+# Records whose manifest a static review job or a window recompute is rewriting; the two never overlap.
+STATIC_REVIEW_MANIFEST_WRITERS: set[str] = set()
+STATIC_REVIEW_MANIFEST_WRITERS_CONDITION = threading.Condition()
+STATIC_REVIEW_ON_SESSION_END = (os.getenv("STATIC_REVIEW_ON_SESSION_END") or "").lower() in {"1", "true", "yes"}
+# Windows whose image uploads may still be in flight while later windows render.
+STATIC_REVIEW_UPLOAD_WINDOWS_AHEAD = max(0, int(os.getenv("STATIC_REVIEW_UPLOAD_WINDOWS_AHEAD") or 2))
+STATIC_REVIEW_UPLOAD_ATTEMPTS = 3
+# Running manifests live in STATIC_REVIEW_MANIFEST_CACHE and reach storage every N windows.
+STATIC_REVIEW_MANIFEST_FLUSH_WINDOWS = max(1, int(os.getenv("STATIC_REVIEW_MANIFEST_FLUSH_WINDOWS") or 10))
+# 20-packet chunks carry one second of samples, so 60 chunks make one-minute segment objects.
+SESSION_SEGMENT_CHUNKS = max(2, int(os.getenv("SESSION_SEGMENT_CHUNKS") or 60))
+SESSION_COMPACTIONS: Dict[str, Future] = {}
+SESSION_COMPACTIONS_LOCK = threading.Lock()
+# Small LRU of packet-aligned byte ranges: (object_key, byte_start, byte_end) -> bytes.
+SESSION_RANGE_CACHE_SIZE = 32
+SESSION_RANGE_CACHE: "OrderedDict[tuple[str, int, int], bytes]" = OrderedDict()
+SESSION_RANGE_CACHE_LOCK = threading.Lock()
 
 
 def _normalize_iso_to_sg(value: Optional[str]) -> Optional[str]:
@@ -521,11 +623,12 @@ def _store_session_chunk(
     stats = stats or _validate_packet_payload(payload, context)
     object_key = f"session/{session_id}/chunks/{chunk_index}.bin"
     _upload_storage_bytes(object_key, payload)
-    _insert_session_chunk_row(
+    queue_chunk_row(
         {
             "record_id": record_id,
             "chunk_index": chunk_index,
             "object_key": object_key,
+            "byte_offset": None,
             "byte_length": stats["byte_length"],
             "packet_count": stats["packet_count"],
             "sample_count": stats["sample_count_per_channel"],
@@ -542,6 +645,8 @@ def _store_session_chunk(
         object_key,
         stats["packet_count"],
     )
+    if (chunk_index + 1) % SESSION_SEGMENT_CHUNKS == 0:
+        _queue_session_compaction(record_id, session_id)
     return stats
 
 
@@ -554,13 +659,22 @@ def _finalize_session_upload(
     payload: bytes,
     stats: Dict[str, int],
     context: str,
+    queue_static_review: bool = False,
 ) -> SessionUploadResponse:
     if stats["packet_count"] == 0:
         raise HTTPException(status_code=400, detail="No complete ECG packets received.")
 
     session_object_key = f"session/{session_id}.bin"
     normalized_start_time = _normalize_iso_to_sg(start_time)
+    # Land logged chunks, buffered chunk rows, the last preview and counters first so they cannot overwrite the final values below.
+    try:
+        drain_chunk_wal(record_id)
+    except Exception as exc:
+        # The full binary is in hand; chunks that failed to ship stay in the WAL and the drainer retries them.
+        logger.warning("[%s] wal_drain_failed record_id=%s error=%s", context, record_id, exc)
+    flush_write_behind(record_id)
     _upload_storage_bytes(session_object_key, payload)
+    _clear_packet_range_cache(session_object_key)
     duration_ms = int(stats.get("elapsed_time_ms") or round((stats["sample_count_per_channel"] / 500) * 1000))
     effective_sps = _effective_sps_from_stats(stats)
     resampled_sample_count = (
@@ -593,15 +707,12 @@ def _finalize_session_upload(
             ),
         },
     )
-    try:
-        _process_review_artifacts_for_record(record_id)
-    except Exception as exc:  # pragma: no cover - safeguard
-        logger.error(
-            "[%s] review_processing_failed record_id=%s error=%s",
-            context,
-            record_id,
-            exc,
-        )
+    review_job_id = _enqueue_session_post_processing(record_id, "review", context)
+    static_review_job_id = (
+        _enqueue_session_post_processing(record_id, "static_review", context)
+        if queue_static_review
+        else None
+    )
     response = SessionUploadResponse(
         record_id=record_id,
         session_object_key=session_object_key,
@@ -609,6 +720,8 @@ def _finalize_session_upload(
         packet_count=stats["packet_count"],
         sample_count_per_channel=stats["sample_count_per_channel"],
         duration_ms=duration_ms,
+        review_job_id=review_job_id,
+        static_review_job_id=static_review_job_id,
     )
     state = LIVE_SESSION_STATE.get(record_id)
     if state is not None:
@@ -636,15 +749,40 @@ def _finalize_session_upload(
                 }
             )
     logger.info(
-        "[%s] response record_id=%s session_object_key=%s duration_ms=%s",
+        "[%s] response record_id=%s session_object_key=%s duration_ms=%s review_job_id=%s static_review_job_id=%s",
         context,
         response.record_id,
         response.session_object_key,
         response.duration_ms,
+        review_job_id,
+        static_review_job_id,
     )
     return response
 
 
+def _enqueue_session_post_processing(record_id: str, job_type: str, context: str) -> Optional[str]:
+    # The session binary was just replaced, so any in-flight job for this record is stale.
+    if job_type == "review":
+        job_id, _, superseded_job_id = claim_job("review", record_id, {"resample": True}, force=True)
+        _clear_review_caches_for_record(record_id)
+        set_job(job_id, status="queued", record_id=record_id, details={"resample": True}, error=None)
+        submit("jobs", _review_processing_job, job_id, record_id, True)
+    else:
+        job_id, _, superseded_job_id = claim_job("static_review", record_id, {"max_windows": None}, force=True)
+        _forget_static_manifest(record_id)
+        set_job(job_id, status="queued", record_id=record_id, details={"max_windows": None, "force": True}, error=None)
+        submit("jobs", _static_review_job, job_id, record_id, None, True)
+    logger.info(
+        "[%s] post_processing_queued record_id=%s job_type=%s job_id=%s superseded_job_id=%s",
+        context,
+        record_id,
+        job_type,
+        job_id,
+        superseded_job_id,
+    )
+    return job_id
+
+
 def _refresh_live_session_state(
     *,
     data: bytes,
@@ -784,10 +922,10 @@ def _refresh_live_session_state(
     }
 
 
-def _persist_live_preview_state(record_id: str, context: str = "SESSION_ADD") -> None:
+def _live_preview_row(record_id: str) -> Optional[Dict[str, Any]]:
     state = LIVE_SESSION_STATE.get(record_id)
     if not state:
-        return
+        return None
     preview_ch2 = list(state.get("preview_ch2") or [])
     preview_ch3 = list(state.get("preview_ch3") or [])
     preview_ch4 = list(state.get("preview_ch4") or [])
@@ -798,24 +936,29 @@ def _persist_live_preview_state(record_id: str, context: str = "SESSION_ADD") ->
         if isinstance(visual_snapshot, dict)
         else None
     ) or _sg_now_iso()
+    return {
+        "record_id": record_id,
+        "ch2_preview": preview_ch2[-buffer_samples:],
+        "ch3_preview": preview_ch3[-buffer_samples:],
+        "ch4_preview": preview_ch4[-buffer_samples:],
+        "sample_count": int(state.get("total_samples_received") or 0),
+        "elapsed_time_ms": int(state.get("elapsed_time_ms") or 0),
+        "updated_at": updated_at,
+    }
+
 
+def _persist_live_preview_state(record_id: str, context: str = "SESSION_ADD") -> None:
+    state = LIVE_SESSION_STATE.get(record_id)
+    if not state:
+        return
     try:
-        _upsert_live_preview_row(
-            {
-                "record_id": record_id,
-                "ch2_preview": preview_ch2[-buffer_samples:],
-                "ch3_preview": preview_ch3[-buffer_samples:],
-                "ch4_preview": preview_ch4[-buffer_samples:],
-                "sample_count": int(state.get("total_samples_received") or 0),
-                "elapsed_time_ms": int(state.get("elapsed_time_ms") or 0),
-                "updated_at": updated_at,
-            }
-        )
+        # Coalesced per record: only the latest buffer is written, at most every LIVE_PREVIEW_PERSIST_INTERVAL_S.
+        queue_live_preview(record_id, _live_preview_row)
     except Exception as exc:  # pragma: no cover - best effort
         logger.warning("[%s] live_preview_upsert_failed record_id=%s error=%s", context, record_id, exc)
 
     try:
-        _update_recording_row(
+        queue_recording_update(
             record_id,
             {
                 "packet_count": int(state.get("total_packets_received") or 0),
@@ -856,6 +999,31 @@ def _persist_session_chunk_and_live_state(
         return
     _persist_live_preview_state(record_id, context="SESSION_ADD")
 
+
+def _store_wal_chunk(entry: Dict[str, Any], payload: bytes) -> None:
+    # Unlike the background-task path, failures propagate so the WAL keeps the segment and retries it.
+    _store_session_chunk(
+        record_id=entry["record_id"],
+        session_id=entry["session_id"],
+        payload=payload,
+        chunk_index=int(entry["chunk_index"]),
+        context="SESSION_WAL",
+        stats=entry["stats"],
+    )
+    # A chunk retried after end_session must not overwrite the final counters.
+    if (LIVE_SESSION_STATE.get(entry["record_id"]) or {}).get("is_active", True):
+        _persist_live_preview_state(entry["record_id"], context="SESSION_WAL")
+
+
+def _ship_wal_chunk(entry: Dict[str, Any], payload: bytes) -> Future:
+    return submit("upload", _store_wal_chunk, entry, payload)
+
+
+def _commit_wal_chunks(record_id: str) -> None:
+    # The WAL drops a record only once its chunk rows are in the table, not just in the write-behind buffer.
+    flush_write_behind(record_id, chunks_only=True)
+
+
 def _metrics_from_info(
     cleaned: List[float],
     info: Dict[str, Any],
@@ -895,10 +1063,10 @@ def _extract_r_peaks(info: Dict[str, Any]) -> List[int]:
 
 
 def _process_window(
-    window: List[int],
+    window: Union[List[float], np.ndarray],
     sample_rate_hz: int,
 ) -> Dict[str, Any]:
-    if not window:
+    if len(window) == 0:
         return {
             "cleaned": [],
             "info": {},
@@ -1370,13 +1538,13 @@ def _interval_related_epochs(
 def _build_review_section_from_samples(
     object_key: str,
     byte_length: int,
-    samples: List[float],
+    samples: Union[List[float], np.ndarray],
     sample_rate_hz: int,
     include_interval_rows: bool = False,
     window_seconds: int = REVIEW_WINDOW_SECONDS,
 ) -> Dict[str, Any]:
     processed = _process_window(samples, sample_rate_hz)
-    cleaned = processed.get("cleaned", []) or list(samples)
+    cleaned = processed.get("cleaned", []) or np.asarray(samples, dtype=float).tolist()
     r_peaks = processed.get("r_peaks", [])
     signal_markers = _delineate_signal_peaks(cleaned, r_peaks, sample_rate_hz)
     window_samples = sample_rate_hz * window_seconds
@@ -1427,11 +1595,11 @@ def _build_review_artifact(
     record_id: str,
     channel: str,
     calibration_key: str,
-    calibration_bytes: bytes,
-    calibration_samples: List[float],
+    calibration_byte_length: int,
+    calibration_samples: Union[List[float], np.ndarray],
     session_key: str,
-    session_bytes: bytes,
-    session_samples: List[float],
+    session_byte_length: int,
+    session_samples: Union[List[float], np.ndarray],
     sample_rate_hz: int,
 ) -> Dict[str, Any]:
     return {
@@ -1440,14 +1608,14 @@ def _build_review_artifact(
         "sample_rate_hz": sample_rate_hz,
         "calibration": _build_review_section_from_samples(
             calibration_key,
-            len(calibration_bytes),
+            calibration_byte_length,
             calibration_samples,
             sample_rate_hz,
             include_interval_rows=False,
         ),
         "session": _build_review_section_from_samples(
             session_key,
-            len(session_bytes),
+            session_byte_length,
             session_samples,
             sample_rate_hz,
             include_interval_rows=True,
@@ -1455,21 +1623,120 @@ def _build_review_artifact(
     }
 
 
+def _build_review_artifact_from_shared(
+    calibration_handle: SharedArrayHandle,
+    session_handle: SharedArrayHandle,
+    **build_kwargs: Any,
+) -> Dict[str, Any]:
+    # NeuroKit reads the read-only views directly; only the cleaned signals that end up in the artifact become lists.
+    with attached_array(calibration_handle) as calibration_samples, attached_array(session_handle) as session_samples:
+        return _build_review_artifact(
+            calibration_samples=calibration_samples,
+            session_samples=session_samples,
+            **build_kwargs,
+        )
+
+
 def _artifact_type_for_channel(channel: str) -> str:
     return f"review_{channel.lower()}"
 
 
+def _summary_artifact_type_for_channel(channel: str) -> str:
+    return f"{_artifact_type_for_channel(channel)}_summary"
+
+
+def _index_artifact_type_for_channel(channel: str) -> str:
+    return f"{_artifact_type_for_channel(channel)}_index"
+
+
+def _review_shard_key(record_id: str, channel: str, shard: str) -> str:
+    return f"processed/{record_id}/{_artifact_type_for_channel(channel)}/{shard}.npz"
+
+
+def _review_window_shard(section: str, window_index: int) -> str:
+    return f"{section}/{window_index:05d}"
+
+
+def _review_envelope_shard(section: str, factor: int) -> str:
+    return f"{section}/envelope/{factor}"
+
+
+def _build_review_summary(artifact: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "record_id": artifact.get("record_id"),
+        "channel": artifact.get("channel"),
+        "sample_rate_hz": int(artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ),
+        "calibration": _build_review_section_summary(artifact.get("calibration", {})),
+        "session": _build_review_section_summary(artifact.get("session", {})),
+    }
+
+
+def _build_review_index(artifact: Dict[str, Any]) -> Dict[str, Any]:
+    # Constant size whatever the session length: what the window endpoints need besides their window.
+    return {
+        "record_id": artifact.get("record_id"),
+        "channel": artifact.get("channel"),
+        "sample_rate_hz": int(artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ),
+        "calibration": _build_review_section_index(artifact.get("calibration", {})),
+        "session": _build_review_section_index(artifact.get("session", {})),
+    }
+
+
+def _build_review_shards(artifact: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    sample_rate_hz = int(artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
+    shards = {"summary": _build_review_summary(artifact), "index": _build_review_index(artifact)}
+    for section_name in ("calibration", "session"):
+        section = artifact.get(section_name, {})
+        shards[f"{section_name}/intervals"] = {"interval_related_rows": section.get("interval_related_rows", [])}
+        for window_index in range(1, int(section.get("window_count", 1)) + 1):
+            shards[_review_window_shard(section_name, window_index)] = _build_review_window_section(
+                section,
+                sample_rate_hz,
+                window_index,
+            )
+        pyramid = build_envelope_pyramid((section.get("signal", {}) or {}).get("full", []) or [])
+        for factor, level in pyramid["levels"].items():
+            shards[_review_envelope_shard(section_name, int(factor))] = level
+    return shards
+
+
+def _upload_review_shards(record_id: str, channel: str, artifact: Dict[str, Any]) -> int:
+    shards = _build_review_shards(artifact)
+    summary = shards.pop("summary")
+    index = shards.pop("index")
+    uploads = [
+        submit("upload", _upload_storage_bytes, _review_shard_key(record_id, channel, shard), encode_artifact(payload))
+        for shard, payload in shards.items()
+    ]
+    for future in uploads:
+        future.result()
+    # The summary, index and their artifact rows go last, so a registered summary always has its shards in place.
+    summary_key = _review_shard_key(record_id, channel, "summary")
+    index_key = _review_shard_key(record_id, channel, "index")
+    _upload_storage_bytes(summary_key, encode_artifact(summary))
+    _upload_storage_bytes(index_key, encode_artifact(index))
+    _upsert_processed_artifact(record_id, _summary_artifact_type_for_channel(channel), summary_key)
+    _upsert_processed_artifact(record_id, _index_artifact_type_for_channel(channel), index_key)
+    return len(uploads)
+
+
 def _clear_review_caches_for_record(record_id: str) -> None:
     for key in list(REVIEW_ARTIFACT_CACHE.keys()):
         if key[0] == record_id:
             REVIEW_ARTIFACT_CACHE.pop(key, None)
+    _forget_review_shards(record_id)
     for key in list(VECTOR3D_IMAGE_CACHE.keys()):
         if key[0] == record_id:
             VECTOR3D_IMAGE_CACHE.pop(key, None)
 
 
-def _process_review_artifacts_for_record(record_id: str, *, resample: bool = True) -> None:
-    logger.info("[PROCESSING] start record_id=%s resample=%s", record_id, resample)
+def _process_review_artifacts_for_record(
+    record_id: str,
+    *,
+    resample: bool = True,
+    job_id: Optional[str] = None,
+) -> None:
+    logger.info("[PROCESSING] start record_id=%s resample=%s job_id=%s", record_id, resample, job_id)
     _clear_review_caches_for_record(record_id)
     _upsert_processed_record(record_id, status="processing", error_message=None)
     try:
@@ -1483,8 +1750,9 @@ def _process_review_artifacts_for_record(record_id: str, *, resample: bool = Tru
             )
 
         sample_rate_hz = int(record.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
-        session_bytes = _fetch_storage_bytes(session_key)
-        calibration_bytes = _fetch_storage_bytes(calibration_key)
+        update_job_details(job_id, stage="fetching")
+        session_bytes, calibration_bytes = _fetch_recording_binaries(session_key, calibration_key)
+        update_job_details(job_id, stage="decoding")
         session_elapsed_summary = _packet_elapsed_summary(session_bytes)
         calibration_elapsed_summary = _packet_elapsed_summary(calibration_bytes)
         logger.info(
@@ -1525,40 +1793,113 @@ def _process_review_artifacts_for_record(record_id: str, *, resample: bool = Tru
             len(decoded_session.get("CH2", [])),
         )
 
-        for channel in CHANNEL_LABELS:
-            artifact = _build_review_artifact(
-                record_id=record_id,
-                channel=channel,
-                calibration_key=calibration_key,
-                calibration_bytes=calibration_bytes,
-                calibration_samples=decoded_calibration.get(channel, []),
-                session_key=session_key,
-                session_bytes=session_bytes,
-                session_samples=decoded_session.get(channel, []),
-                sample_rate_hz=sample_rate_hz,
-            )
-            object_key = f"processed/{record_id}/{_artifact_type_for_channel(channel)}.json"
-            _upload_storage_json(object_key, artifact)
-            _upsert_processed_artifact(record_id, _artifact_type_for_channel(channel), object_key)
-            REVIEW_ARTIFACT_CACHE[_review_cache_key(record_id, channel)] = artifact
+        build_kwargs = {
+            "record_id": record_id,
+            "calibration_key": calibration_key,
+            "calibration_byte_length": len(calibration_bytes),
+            "session_key": session_key,
+            "session_byte_length": len(session_bytes),
+            "sample_rate_hz": sample_rate_hz,
+        }
+        with ExitStack() as stack:
+            pending_builds: Dict[str, Any] = {}
+            if process_pool_enabled():
+                # Channels are published once and built in parallel; workers attach instead of unpickling lists.
+                share_key = f"{record_id}:{calibration_key}:{session_key}:{len(session_bytes)}:{resample}"
+                calibration_handles = stack.enter_context(shared_arrays(f"calibration:{share_key}", decoded_calibration))
+                session_handles = stack.enter_context(shared_arrays(f"session:{share_key}", decoded_session))
+                for channel in CHANNEL_LABELS:
+                    pending_builds[channel] = submit_process(
+                        _build_review_artifact_from_shared,
+                        calibration_handles[channel],
+                        session_handles[channel],
+                        channel=channel,
+                        **build_kwargs,
+                    )
+                stack.callback(lambda: [future.cancel() for future in pending_builds.values()])
+            for channel_index, channel in enumerate(CHANNEL_LABELS):
+                raise_if_job_cancelled(job_id)
+                update_job_details(
+                    job_id,
+                    stage="building",
+                    channel=channel,
+                    completed_channel_count=channel_index,
+                    target_channel_count=len(CHANNEL_LABELS),
+                )
+                if channel in pending_builds:
+                    artifact = pending_builds[channel].result()
+                else:
+                    artifact = _build_review_artifact(
+                        channel=channel,
+                        calibration_samples=decoded_calibration.get(channel, []),
+                        session_samples=decoded_session.get(channel, []),
+                        **build_kwargs,
+                    )
+                raise_if_job_cancelled(job_id)
+                update_job_details(job_id, stage="uploading", channel=channel)
+                object_key = f"processed/{record_id}/{_artifact_type_for_channel(channel)}.npz"
+                _upload_storage_bytes(object_key, encode_artifact(artifact))
+                _upsert_processed_artifact(record_id, _artifact_type_for_channel(channel), object_key)
+                shard_count = _upload_review_shards(record_id, channel, artifact)
+                logger.info("[PROCESSING] shards_uploaded record_id=%s channel=%s shards=%s", record_id, channel, shard_count)
+                REVIEW_ARTIFACT_CACHE[_review_cache_key(record_id, channel)] = artifact
         _upsert_processed_record(record_id, status="ready", error_message=None)
         logger.info("[PROCESSING] ready record_id=%s resample=%s", record_id, resample)
+    except JobCancelled:
+        logger.info("[PROCESSING] cancelled record_id=%s resample=%s job_id=%s", record_id, resample, job_id)
+        raise
     except Exception as exc:
         _upsert_processed_record(record_id, status="error", error_message=str(exc))
         logger.exception("[PROCESSING] failed record_id=%s resample=%s", record_id, resample)
         raise
 
 
-def _load_review_artifact(record_id: str, channel: str) -> Dict[str, Any]:
-    cache_key = _review_cache_key(record_id, channel)
-    cached = REVIEW_ARTIFACT_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
+def _fetch_recording_binaries(session_key: str, calibration_key: str) -> tuple[bytes, bytes]:
+    objects = _fetch_storage_objects([session_key, calibration_key], hedge_after_s=STORAGE_HEDGE_AFTER_S)
+    return objects[session_key], objects[calibration_key]
+
+
+def _packet_byte_range(start_sample: int, end_sample: int) -> tuple[int, int, int]:
+    # Samples are packed SAMPLES_PER_PACKET per channel per packet, so windows widen to whole packets.
+    first_packet = max(0, start_sample) // SAMPLES_PER_PACKET
+    end_packet = (max(start_sample, end_sample) + SAMPLES_PER_PACKET - 1) // SAMPLES_PER_PACKET
+    return first_packet * PACKET_BYTES, end_packet * PACKET_BYTES, first_packet * SAMPLES_PER_PACKET
+
+
+def _fetch_packet_range(object_key: str, byte_start: int, byte_end: int) -> bytes:
+    cache_key = (object_key, byte_start, byte_end)
+    with SESSION_RANGE_CACHE_LOCK:
+        cached = SESSION_RANGE_CACHE.get(cache_key)
+        if cached is not None:
+            SESSION_RANGE_CACHE.move_to_end(cache_key)
+            return cached
+    payload = _fetch_storage_range(object_key, byte_start, byte_end)
+    with SESSION_RANGE_CACHE_LOCK:
+        SESSION_RANGE_CACHE[cache_key] = payload
+        while len(SESSION_RANGE_CACHE) > SESSION_RANGE_CACHE_SIZE:
+            SESSION_RANGE_CACHE.popitem(last=False)
+    return payload
+
+
+def _clear_packet_range_cache(object_key: str) -> None:
+    with SESSION_RANGE_CACHE_LOCK:
+        for cache_key in [key for key in SESSION_RANGE_CACHE if key[0] == object_key]:
+            SESSION_RANGE_CACHE.pop(cache_key, None)
+
 
-    processed = _fetch_processed_record(record_id)
-    artifact_type = _artifact_type_for_channel(channel)
-    artifact_key = _fetch_processed_artifact_key(record_id, artifact_type)
+def _fetch_sample_window(object_key: str, start_sample: int, end_sample: int) -> Dict[str, List[float]]:
+    byte_start, byte_end, first_sample = _packet_byte_range(start_sample, end_sample)
+    channels = _decode_ads1298_packets(_fetch_packet_range(object_key, byte_start, byte_end))
+    offset = max(0, start_sample) - first_sample
+    return _window_channels(channels, offset, offset + max(0, end_sample - max(0, start_sample)))
 
+
+def _require_review_artifact_key(
+    record_id: str,
+    channel: str,
+    processed: Optional[Dict[str, Any]],
+    artifact_key: Optional[str],
+) -> str:
     if (
         not processed
         or processed.get("status") != "ready"
@@ -1584,30 +1925,259 @@ def _load_review_artifact(record_id: str, channel: str) -> Dict[str, Any]:
                 "processing_version": processed.get("processing_version") if processed else None,
             },
         )
+    return artifact_key
+
+
+def _review_artifact_unavailable(record_id: str, channel: str, artifact_key: str) -> HTTPException:
+    logger.warning(
+        "[REVIEW] artifact_fetch_unavailable record_id=%s channel=%s object_key=%s",
+        record_id,
+        channel,
+        artifact_key,
+    )
+    return HTTPException(
+        status_code=409,
+        detail={
+            "code": "review_artifact_fetch_unavailable",
+            "record_id": record_id,
+            "channel": channel,
+            "artifact_key": artifact_key,
+        },
+    )
+
+
+def _decode_review_artifact(object_key: str, payload: bytes) -> Dict[str, Any]:
+    # Artifacts written before the columnar format are JSON; the zip magic tells them apart.
+    if not is_binary_artifact(payload):
+        return _decode_storage_json(object_key, payload)
+    try:
+        return decode_artifact(payload)
+    except Exception as exc:
+        logger.error("[FETCH] artifact_decode_error object_key=%s error=%s", object_key, exc)
+        raise HTTPException(
+            status_code=502,
+            detail=f"Stored review artifact is invalid for object_key={object_key}: {exc}",
+        ) from exc
+
+
+def _load_review_artifact(record_id: str, channel: str) -> Dict[str, Any]:
+    cache_key = _review_cache_key(record_id, channel)
+    cached = REVIEW_ARTIFACT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    metadata = _fetch_processed_metadata(record_id) or {}
+    artifact_key = _require_review_artifact_key(
+        record_id,
+        channel,
+        metadata.get("processed"),
+        (metadata.get("artifact_keys") or {}).get(_artifact_type_for_channel(channel)),
+    )
     try:
-        artifact = _fetch_storage_json(artifact_key)
+        artifact = _decode_review_artifact(artifact_key, _fetch_storage_bytes(artifact_key))
     except HTTPException as exc:
         if exc.status_code != 502:
             raise
-        logger.warning(
-            "[REVIEW] artifact_fetch_unavailable record_id=%s channel=%s object_key=%s",
-            record_id,
-            channel,
-            artifact_key,
-        )
-        raise HTTPException(
-            status_code=409,
-            detail={
-                "code": "review_artifact_fetch_unavailable",
-                "record_id": record_id,
-                "channel": channel,
-                "artifact_key": artifact_key,
-            },
-        ) from exc
+        raise _review_artifact_unavailable(record_id, channel, artifact_key) from exc
+    REVIEW_ARTIFACT_CACHE[cache_key] = artifact
+    return artifact
+
+
+async def _load_review_artifact_async(record_id: str, channel: str) -> Dict[str, Any]:
+    cache_key = _review_cache_key(record_id, channel)
+    cached = REVIEW_ARTIFACT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    metadata = await _fetch_processed_metadata_async(record_id) or {}
+    artifact_key = _require_review_artifact_key(
+        record_id,
+        channel,
+        metadata.get("processed"),
+        (metadata.get("artifact_keys") or {}).get(_artifact_type_for_channel(channel)),
+    )
+    try:
+        payload = await _fetch_storage_bytes_async(artifact_key)
+        # Channel artifacts run to megabytes; decode them off the event loop.
+        artifact = await run_in_pool("cpu", _decode_review_artifact, artifact_key, payload)
+    except HTTPException as exc:
+        if exc.status_code != 502:
+            raise
+        raise _review_artifact_unavailable(record_id, channel, artifact_key) from exc
     REVIEW_ARTIFACT_CACHE[cache_key] = artifact
     return artifact
 
 
+def _load_review_artifacts(record_id: str, channels: List[str]) -> Dict[str, Dict[str, Any]]:
+    missing = [channel for channel in channels if _review_cache_key(record_id, channel) not in REVIEW_ARTIFACT_CACHE]
+    if len(missing) > 1:
+        # Resolve metadata once, then fetch the channel artifacts side by side.
+        _fetch_processed_metadata(record_id)
+        futures = {channel: submit("io", _load_review_artifact, record_id, channel) for channel in missing}
+        for future in futures.values():
+            future.result()
+    return {channel: _load_review_artifact(record_id, channel) for channel in channels}
+
+
+async def _load_review_shard_async(record_id: str, channel: str, shard: str) -> Optional[Dict[str, Any]]:
+    cache_key = (*_review_cache_key(record_id, channel), shard)
+    with REVIEW_SHARD_CACHE_LOCK:
+        cached = REVIEW_SHARD_CACHE.get(cache_key)
+        if cached is not None:
+            REVIEW_SHARD_CACHE.move_to_end(cache_key)
+            return cached[0]
+
+    metadata = await _fetch_processed_metadata_async(record_id) or {}
+    artifact_keys = metadata.get("artifact_keys") or {}
+    _require_review_artifact_key(
+        record_id,
+        channel,
+        metadata.get("processed"),
+        artifact_keys.get(_artifact_type_for_channel(channel)),
+    )
+    if not artifact_keys.get(_summary_artifact_type_for_channel(channel)):
+        # Built before sharding; callers fall back to the full channel artifact.
+        return None
+    object_key = _review_shard_key(record_id, channel, shard)
+    try:
+        payload = await _fetch_storage_bytes_async(object_key)
+        loaded = await run_in_pool("cpu", _decode_review_artifact, object_key, payload)
+    except HTTPException as exc:
+        if exc.status_code != 502:
+            raise
+        raise _review_artifact_unavailable(record_id, channel, object_key) from exc
+    _remember_review_shard(cache_key, loaded, len(payload))
+    return loaded
+
+
+def _remember_review_shard(cache_key: tuple[str, str, str, str], shard: Dict[str, Any], size: int) -> None:
+    global REVIEW_SHARD_CACHE_USED_BYTES
+    with REVIEW_SHARD_CACHE_LOCK:
+        previous = REVIEW_SHARD_CACHE.pop(cache_key, None)
+        if previous is not None:
+            REVIEW_SHARD_CACHE_USED_BYTES -= previous[1]
+        REVIEW_SHARD_CACHE[cache_key] = (shard, size)
+        REVIEW_SHARD_CACHE_USED_BYTES += size
+        while REVIEW_SHARD_CACHE_USED_BYTES > REVIEW_SHARD_CACHE_BYTES and REVIEW_SHARD_CACHE:
+            _, (_, evicted_size) = REVIEW_SHARD_CACHE.popitem(last=False)
+            REVIEW_SHARD_CACHE_USED_BYTES -= evicted_size
+
+
+def _forget_review_shards(record_id: str) -> None:
+    global REVIEW_SHARD_CACHE_USED_BYTES
+    with REVIEW_SHARD_CACHE_LOCK:
+        for key in [key for key in REVIEW_SHARD_CACHE if key[0] == record_id]:
+            REVIEW_SHARD_CACHE_USED_BYTES -= REVIEW_SHARD_CACHE.pop(key)[1]
+
+
+async def _load_review_index_async(record_id: str, channel: str) -> Optional[Dict[str, Any]]:
+    metadata = await _fetch_processed_metadata_async(record_id) or {}
+    # Shards written before the index fall back to the summary, which holds everything the index does.
+    has_index = bool((metadata.get("artifact_keys") or {}).get(_index_artifact_type_for_channel(channel)))
+    return await _load_review_shard_async(record_id, channel, "index" if has_index else "summary")
+
+
+async def _load_review_window_async(
+    record_id: str,
+    channel: str,
+    section: str,
+    window_index: int,
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    index = await _load_review_index_async(record_id, channel)
+    if index is None:
+        artifact = await _load_review_artifact_async(record_id, channel)
+        index = _build_review_summary(artifact)
+        window = await run_in_pool(
+            "cpu",
+            _build_review_window_section,
+            artifact.get(section, {}),
+            index["sample_rate_hz"],
+            window_index,
+        )
+        return index, window
+    window_count = int(index[section].get("window_count", 1))
+    bounded_window_index = max(1, min(window_index, window_count))
+    window = await _load_review_shard_async(record_id, channel, _review_window_shard(section, bounded_window_index))
+    return index, window
+
+
+async def _load_review_interval_rows_async(
+    record_id: str,
+    channel: str,
+    section: str,
+    index: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    if "interval_related_rows" in index[section]:
+        # A summary, from the full artifact or written before the index.
+        return index[section]["interval_related_rows"]
+    intervals = await _load_review_shard_async(record_id, channel, f"{section}/intervals")
+    return (intervals or {}).get("interval_related_rows", [])
+
+
+async def _load_review_envelope_async(
+    record_id: str,
+    channel: str,
+    section: str,
+) -> tuple[Dict[str, Any], Dict[str, Any], Optional[List[float]]]:
+    index = await _load_review_index_async(record_id, channel)
+    if index is not None:
+        if "envelope" in index[section]:
+            # Levels are fetched one at a time once a factor is picked.
+            return index, {**index[section]["envelope"], "levels": {}}, None
+        # Written before per-level shards: the whole pyramid sits in one shard.
+        return index, await _load_review_shard_async(record_id, channel, f"{section}/envelope"), None
+    # Built before sharding: derive the pyramid from the full artifact once and keep it with the shards.
+    artifact = await _load_review_artifact_async(record_id, channel)
+    signal = (artifact.get(section, {}).get("signal", {}) or {}).get("full", []) or []
+    cache_key = (*_review_cache_key(record_id, channel), f"{section}/envelope")
+    with REVIEW_SHARD_CACHE_LOCK:
+        cached = REVIEW_SHARD_CACHE.get(cache_key)
+    if cached is not None:
+        return _build_review_summary(artifact), cached[0], signal
+    pyramid = await run_in_pool("cpu", build_envelope_pyramid, signal)
+    # Sized as its encoded shard would be: a min and a max float64 per bucket.
+    bucket_count = sum(len(level["min"]) for level in pyramid["levels"].values())
+    _remember_review_shard(cache_key, pyramid, 2 * 8 * bucket_count)
+    return _build_review_summary(artifact), pyramid, signal
+
+
+async def _load_review_envelope_level_async(
+    record_id: str,
+    channel: str,
+    section: str,
+    pyramid: Dict[str, Any],
+    factor: int,
+) -> Dict[str, Any]:
+    if str(factor) in pyramid["levels"]:
+        return pyramid
+    level = await _load_review_shard_async(record_id, channel, _review_envelope_shard(section, factor))
+    return {**pyramid, "levels": {str(factor): level}}
+
+
+async def _load_review_signal_range_async(
+    record_id: str,
+    channel: str,
+    section: str,
+    sample_rate_hz: int,
+    start: int,
+    end: int,
+) -> List[float]:
+    if end <= start:
+        return []
+    window_samples = sample_rate_hz * REVIEW_WINDOW_SECONDS
+    first_window = start // window_samples + 1
+    last_window = (end - 1) // window_samples + 1
+    windows = await asyncio.gather(
+        *(
+            _load_review_shard_async(record_id, channel, _review_window_shard(section, window_index))
+            for window_index in range(first_window, last_window + 1)
+        )
+    )
+    signal = [value for window in windows for value in window["signal"]["full"]]
+    offset = (first_window - 1) * window_samples
+    return signal[start - offset : end - offset]
+
+
 def _slice_signal_markers_for_window(
     signal_markers: Optional[Dict[str, List[int]]],
     start_index: int,
@@ -1623,6 +2193,22 @@ def _slice_signal_markers_for_window(
     return sliced
 
 
+def _build_review_section_index(section: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "meta": section.get("meta", {}),
+        "beat_count_total": section.get("beat_count_total", 0),
+        "beat_count_included": section.get("beat_count_included", 0),
+        "beat_count_excluded": section.get("beat_count_excluded", 0),
+        "excluded_reason_counts": section.get("excluded_reason_counts", {}),
+        "window_count": section.get("window_count", 1),
+        "interval_related": section.get("interval_related"),
+        "envelope": {
+            "sample_count": len((section.get("signal", {}) or {}).get("full", []) or []),
+            "factors": list(ENVELOPE_FACTORS),
+        },
+    }
+
+
 def _build_review_section_summary(section: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "meta": section.get("meta", {}),
@@ -1643,10 +2229,10 @@ def _build_review_window_section(
     window_index: int,
     window_seconds: int = REVIEW_WINDOW_SECONDS,
 ) -> Dict[str, Any]:
-    signal = list((section.get("signal", {}) or {}).get("full", []) or [])
+    signal = (section.get("signal", {}) or {}).get("full", []) or []
     signal_markers = (section.get("signal", {}) or {}).get("markers", {}) or {}
-    r_peaks = list((section.get("signal", {}) or {}).get("r_peaks", []) or [])
-    beats = list((section.get("beats", {}) or {}).get("items", []) or [])
+    r_peaks = (section.get("signal", {}) or {}).get("r_peaks", []) or []
+    beats = (section.get("beats", {}) or {}).get("items", []) or []
     window_samples = max(1, sample_rate_hz * window_seconds)
     window_count = max(1, (len(signal) + window_samples - 1) // window_samples)
     bounded_window_index = max(1, min(window_index, window_count))
@@ -1735,18 +2321,13 @@ def _build_review_section(
 
 
 
-def _set_job(job_id: str, **fields: Any) -> None:
-    job = ANALYSIS_JOBS.get(job_id, {})
-    job.update(fields)
-    ANALYSIS_JOBS[job_id] = job
-
-
 class SessionAnalysisStartRequest(BaseModel):
     record_id: str = Field(..., description="Supabase ecg_recordings.id")
 
 
 class ReviewProcessRequest(BaseModel):
     resample: bool = True
+    force: bool = False
 
 
 class StaticReviewProcessRequest(BaseModel):
@@ -1792,6 +2373,8 @@ class SessionUploadResponse(BaseModel):
     packet_count: int
     sample_count_per_channel: int
     duration_ms: int
+    review_job_id: Optional[str] = None
+    static_review_job_id: Optional[str] = None
 
 
 class SessionChunkResponse(BaseModel):
@@ -1910,6 +2493,19 @@ class ReviewWindowResponse(BaseModel):
     window: ReviewWindowSection
 
 
+class ReviewEnvelopeResponse(BaseModel):
+    record_id: str
+    channel: str
+    section: str
+    sample_rate_hz: int
+    sample_count: int
+    factor: int
+    start_sample: int
+    end_sample: int
+    min: List[float]
+    max: List[float]
+
+
 class ReviewSessionWindowResponse(BaseModel):
     record_id: str
     channel: str
@@ -2026,6 +2622,26 @@ class SessionAnalysisJob(BaseModel):
     record_id: str
     details: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    coalesced: bool = False
+    superseded_job_id: Optional[str] = None
+
+
+def _session_analysis_job_response(
+    job_id: str,
+    job: Dict[str, Any],
+    *,
+    coalesced: bool = False,
+    superseded_job_id: Optional[str] = None,
+) -> SessionAnalysisJob:
+    return SessionAnalysisJob(
+        job_id=job_id,
+        status=job.get("status", "unknown"),
+        record_id=job.get("record_id", ""),
+        details=job.get("details"),
+        error=job.get("error"),
+        coalesced=coalesced,
+        superseded_job_id=superseded_job_id,
+    )
 
 
 @app.get("/health")
@@ -2033,13 +2649,25 @@ def health() -> Dict[str, str]:
     return {"status": "ok", "base_url": BASE_URL}
 
 
+@app.get("/metrics")
+def metrics() -> Dict[str, Any]:
+    return {
+        "executors": executor_metrics(),
+        "object_cache": object_cache_metrics(),
+        "render": render_metrics(),
+        "supabase_http": _http_client_metrics(),
+        "write_behind": write_behind_metrics(),
+        "chunk_wal": chunk_wal_metrics(),
+    }
+
+
 
 @app.post("/calibration_completion", response_model=CalibrationCompletionResponse)
 async def calibration_completion(request: Request) -> CalibrationCompletionResponse:
     data = await request.body()
     run_id = request.headers.get("X-Run-Id") or f"calibration_{uuid4().hex}"
     user_id = request.headers.get("X-User-Id")
-    result = _handle_calibration_payload(data=data, run_id=run_id, user_id=user_id)
+    result = await run_in_pool("cpu", _handle_calibration_payload, data=data, run_id=run_id, user_id=user_id)
     return CalibrationCompletionResponse(**result)
 
 
@@ -2072,10 +2700,14 @@ async def session_live(record_id: Optional[str] = None) -> LiveSessionSnapshotRe
 async def session_live_visual(
     record_id: Optional[str] = None,
 ) -> LiveSessionVisualResponse:
+    return await _build_session_live_visual(record_id)
+
+
+async def _build_session_live_visual(record_id: Optional[str]) -> LiveSessionVisualResponse:
     persisted_preview = None
     selected_record_id = record_id or latest_live_record_id()
     if not selected_record_id:
-        persisted_preview = _fetch_latest_live_preview_row()
+        persisted_preview = await _fetch_latest_live_preview_row_async()
         selected_record_id = persisted_preview.get("record_id") if persisted_preview else None
     if not selected_record_id:
         raise HTTPException(status_code=404, detail="No live session visualization available.")
@@ -2086,7 +2718,7 @@ async def session_live_visual(
         not isinstance(snapshot, dict)
         or int(snapshot.get("buffer_samples") or 0) <= 0
     ):
-        latest_persisted_preview = _fetch_latest_live_preview_row()
+        latest_persisted_preview = await _fetch_latest_live_preview_row_async()
         latest_persisted_record_id = latest_persisted_preview.get("record_id") if latest_persisted_preview else None
         if (
             latest_persisted_preview
@@ -2101,7 +2733,7 @@ async def session_live_visual(
             state = LIVE_SESSION_STATE.get(selected_record_id)
             snapshot = state.get("visual_snapshot") if state else None
     if not isinstance(snapshot, dict):
-        persisted_preview = persisted_preview or _fetch_live_preview_row(selected_record_id)
+        persisted_preview = persisted_preview or await _fetch_live_preview_row_async(selected_record_id)
         if persisted_preview:
             payload = trim_live_visual_snapshot(
                 {
@@ -2201,6 +2833,10 @@ async def session_live_events(request: Request, record_id: Optional[str] = None)
 
 @app.post("/session/start", response_model=SessionStartResponse)
 async def session_start(payload: SessionStartRequest) -> SessionStartResponse:
+    return await _start_session_record(payload)
+
+
+async def _start_session_record(payload: SessionStartRequest) -> SessionStartResponse:
     config = _get_supabase_config()
     session_object_key = f"session/{payload.session_id}.bin"
     normalized_start_time = _normalize_iso_to_sg(payload.start_time)
@@ -2213,31 +2849,34 @@ async def session_start(payload: SessionStartRequest) -> SessionStartResponse:
     )
     record_id = payload.record_id
     if record_id:
-        record = _fetch_recording_by_id(record_id)
-        _update_recording_row(
-            record_id,
-            {
-                "user_id": payload.user_id,
-                "bucket": config["bucket"],
-                "session_object_key": session_object_key,
-                "calibration_object_key": payload.calibration_object_key,
-                "encoding": "ads1298_24be_mv",
-                "sample_rate_hz": 500,
-                "channels": 3,
-                "start_time": normalized_start_time,
-                "notes": json.dumps(
-                    {
-                        "channel_labels": CHANNEL_LABELS,
-                        "packet_bytes": PACKET_BYTES,
-                        "samples_per_packet": SAMPLES_PER_PACKET,
-                        "encoding": "ads1298_24be_mv",
-                    }
-                ),
-            },
+        # The PATCH matches no rows for an unknown id, so it can overlap the lookup that 404s.
+        record, _ = await asyncio.gather(
+            _fetch_recording_by_id_async(record_id),
+            _update_recording_row_async(
+                record_id,
+                {
+                    "user_id": payload.user_id,
+                    "bucket": config["bucket"],
+                    "session_object_key": session_object_key,
+                    "calibration_object_key": payload.calibration_object_key,
+                    "encoding": "ads1298_24be_mv",
+                    "sample_rate_hz": 500,
+                    "channels": 3,
+                    "start_time": normalized_start_time,
+                    "notes": json.dumps(
+                        {
+                            "channel_labels": CHANNEL_LABELS,
+                            "packet_bytes": PACKET_BYTES,
+                            "samples_per_packet": SAMPLES_PER_PACKET,
+                            "encoding": "ads1298_24be_mv",
+                        }
+                    ),
+                },
+            ),
         )
         response_record_id = str(record.get("id"))
     else:
-        record = _insert_recording_row(
+        record = await _insert_recording_row_async(
             {
                 "user_id": payload.user_id,
                 "bucket": config["bucket"],
@@ -2282,7 +2921,7 @@ async def session_start(payload: SessionStartRequest) -> SessionStartResponse:
         "ended_at": None,
     }
     try:
-        _upsert_live_preview_row(
+        await _upsert_live_preview_row_async(
             {
                 "record_id": response.record_id,
                 "ch2_preview": [],
@@ -2345,14 +2984,23 @@ async def add_to_session(request: Request, background_tasks: BackgroundTasks) ->
             chunk_index,
             exc,
         )
-    background_tasks.add_task(
-        _persist_session_chunk_and_live_state,
-        record_id=record_id,
-        session_id=session_id,
-        payload=payload,
-        chunk_index=chunk_index,
-        stats=stats,
-    )
+    if chunk_wal_running():
+        # Acknowledge once the chunk is fsynced locally; the WAL drainer ships it to storage.
+        await run_in_pool(
+            "io",
+            append_chunk,
+            {"record_id": record_id, "session_id": session_id, "chunk_index": chunk_index, "stats": stats},
+            payload,
+        )
+    else:
+        background_tasks.add_task(
+            _persist_session_chunk_and_live_state,
+            record_id=record_id,
+            session_id=session_id,
+            payload=payload,
+            chunk_index=chunk_index,
+            stats=stats,
+        )
     return SessionChunkResponse(
         record_id=record_id,
         session_id=session_id,
@@ -2363,6 +3011,180 @@ async def add_to_session(request: Request, background_tasks: BackgroundTasks) ->
     )
 
 
+def _ordered_session_chunks(
+    rows: List[Dict[str, Any]],
+    session_id: str,
+    expected_chunk_count: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    session_prefix = f"session/{session_id}/"
+    by_index: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        # Rows from an earlier session on the same record point at another session's objects.
+        if not str(row.get("object_key") or "").startswith(session_prefix):
+            continue
+        by_index.setdefault(int(row["chunk_index"]), row)
+    chunk_count = max(expected_chunk_count or 0, max(by_index, default=-1) + 1)
+    missing = [index for index in range(chunk_count) if index not in by_index]
+    if missing or not by_index:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "session_chunks_missing",
+                "session_id": session_id,
+                "stored_chunk_count": len(by_index),
+                "missing_chunk_indices": missing,
+            },
+        )
+    return [by_index[index] for index in range(chunk_count)]
+
+
+def _session_chunk_payloads(
+    rows: List[Dict[str, Any]],
+    objects: Dict[str, bytes],
+) -> tuple[List[bytes], List[int]]:
+    # Compacted rows share a segment object and point into it; the others own their whole object.
+    payloads: List[bytes] = []
+    mismatched: List[int] = []
+    for row in rows:
+        data = objects[row["object_key"]]
+        if row.get("byte_offset") is not None:
+            start = int(row["byte_offset"])
+            data = data[start : start + int(row["byte_length"])]
+        if row.get("byte_length") is not None and int(row["byte_length"]) != len(data):
+            mismatched.append(int(row["chunk_index"]))
+        payloads.append(data)
+    return payloads, mismatched
+
+
+def _session_segment_key(session_id: str, first_index: int, last_index: int) -> str:
+    return f"session/{session_id}/segments/{first_index:06d}-{last_index:06d}.bin"
+
+
+def _compact_session_chunks(record_id: str, session_id: str) -> int:
+    flush_write_behind(record_id)
+    chunk_prefix = f"session/{session_id}/chunks/"
+    session_prefix = f"session/{session_id}/"
+    by_index = {
+        int(row["chunk_index"]): row
+        for row in _fetch_session_chunk_rows(record_id)
+        if str(row.get("object_key") or "").startswith(session_prefix)
+    }
+    segments_written = 0
+    for first_index in range(0, max(by_index, default=-1) + 2 - SESSION_SEGMENT_CHUNKS, SESSION_SEGMENT_CHUNKS):
+        rows = [by_index.get(index) for index in range(first_index, first_index + SESSION_SEGMENT_CHUNKS)]
+        # Only whole segments are compacted; gaps are still in flight and get picked up by a later pass.
+        if any(row is None for row in rows):
+            continue
+        loose_keys = [row["object_key"] for row in rows if row["object_key"].startswith(chunk_prefix)]
+        if not loose_keys:
+            continue
+        objects = _fetch_storage_objects([row["object_key"] for row in rows], hedge_after_s=STORAGE_HEDGE_AFTER_S)
+        payloads, mismatched = _session_chunk_payloads(rows, objects)
+        if mismatched:
+            logger.warning(
+                "[COMPACT] length_mismatch record_id=%s session_id=%s chunk_indices=%s",
+                record_id,
+                session_id,
+                mismatched,
+            )
+            continue
+        segment_key = _session_segment_key(session_id, first_index, first_index + SESSION_SEGMENT_CHUNKS - 1)
+        _upload_storage_bytes(segment_key, b"".join(payloads))
+        index_rows = []
+        byte_offset = 0
+        for row, payload in zip(rows, payloads):
+            index_rows.append(
+                {
+                    "record_id": record_id,
+                    "chunk_index": int(row["chunk_index"]),
+                    "object_key": segment_key,
+                    "byte_offset": byte_offset,
+                    "byte_length": len(payload),
+                }
+            )
+            byte_offset += len(payload)
+        # Repoint the rows before deleting, so a reader always finds the bytes behind a row.
+        _insert_session_chunk_rows(index_rows)
+        _delete_storage_objects(loose_keys)
+        segments_written += 1
+        logger.info(
+            "[COMPACT] segment_written record_id=%s segment=%s chunks=%s bytes=%s removed_objects=%s",
+            record_id,
+            segment_key,
+            len(rows),
+            byte_offset,
+            len(loose_keys),
+        )
+    return segments_written
+
+
+def _run_session_compaction(record_id: str, session_id: str) -> None:
+    try:
+        _compact_session_chunks(record_id, session_id)
+    except Exception:
+        # Chunks stay readable as loose objects; the next segment boundary retries.
+        logger.exception("[COMPACT] failed record_id=%s session_id=%s", record_id, session_id)
+
+
+def _queue_session_compaction(record_id: str, session_id: str) -> None:
+    with SESSION_COMPACTIONS_LOCK:
+        running = SESSION_COMPACTIONS.get(record_id)
+        if running is not None and not running.done():
+            return
+        future = submit("compaction", _run_session_compaction, record_id, session_id)
+        SESSION_COMPACTIONS[record_id] = future
+
+    def forget(done: Future) -> None:
+        with SESSION_COMPACTIONS_LOCK:
+            if SESSION_COMPACTIONS.get(record_id) is done:
+                SESSION_COMPACTIONS.pop(record_id, None)
+
+    future.add_done_callback(forget)
+
+
+async def _assemble_session_payload(
+    record_id: str,
+    session_id: str,
+    tail: bytes,
+    expected_chunk_count: Optional[int],
+) -> bytes:
+    # Chunks may still be sitting in the WAL, and their rows in the write-behind buffer.
+    await run_in_pool("io", drain_chunk_wal, record_id)
+    await run_in_pool("io", flush_write_behind, record_id)
+    # A compaction deletes chunk objects after repointing their rows; let it finish before reading the rows.
+    compaction = SESSION_COMPACTIONS.get(record_id)
+    if compaction is not None:
+        await asyncio.wrap_future(compaction)
+    rows = _ordered_session_chunks(await _fetch_session_chunk_rows_async(record_id), session_id, expected_chunk_count)
+    started_at = time.perf_counter()
+    objects = await _fetch_storage_objects_async(
+        [row["object_key"] for row in rows],
+        hedge_after_s=STORAGE_HEDGE_AFTER_S,
+    )
+    payloads, mismatched = _session_chunk_payloads(rows, objects)
+    if mismatched:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "session_chunk_length_mismatch",
+                "session_id": session_id,
+                "chunk_indices": mismatched,
+            },
+        )
+    assembled = b"".join([*payloads, tail])
+    logger.info(
+        "[SESSION_END] assembled record_id=%s session_id=%s chunks=%s objects=%s tail_bytes=%s total_bytes=%s fetch_ms=%.1f",
+        record_id,
+        session_id,
+        len(rows),
+        len(objects),
+        len(tail),
+        len(assembled),
+        (time.perf_counter() - started_at) * 1000.0,
+    )
+    return assembled
+
+
 @app.post("/end_session", response_model=SessionUploadResponse)
 async def end_session(request: Request) -> SessionUploadResponse:
     payload = await request.body()
@@ -2381,8 +3203,26 @@ async def end_session(request: Request) -> SessionUploadResponse:
             status_code=400,
             detail="Missing X-Record-Id, X-Session-Id, or X-User-Id header.",
         )
+    end_mode = (request.headers.get("X-End-Mode") or "upload").lower()
+    if end_mode == "assemble":
+        chunk_count_header = request.headers.get("X-Chunk-Count")
+        try:
+            expected_chunk_count = int(chunk_count_header) if chunk_count_header else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid X-Chunk-Count header.")
+        payload = await _assemble_session_payload(record_id, session_id, payload, expected_chunk_count)
+    elif end_mode != "upload":
+        raise HTTPException(status_code=400, detail="X-End-Mode must be upload or assemble.")
     stats = _validate_packet_payload(payload, "SESSION_END")
-    return _finalize_session_upload(
+    static_review_header = (request.headers.get("X-Static-Review") or "").lower()
+    queue_static_review = (
+        static_review_header in {"1", "true", "yes"}
+        if static_review_header
+        else STATIC_REVIEW_ON_SESSION_END
+    )
+    return await run_in_pool(
+        "io",
+        _finalize_session_upload,
         record_id=record_id,
         session_id=session_id,
         user_id=user_id,
@@ -2390,14 +3230,15 @@ async def end_session(request: Request) -> SessionUploadResponse:
         payload=payload,
         stats=stats,
         context="SESSION_END",
+        queue_static_review=queue_static_review,
     )
 
 def _session_analysis_job(job_id: str, record_id: str) -> None:
     logger.info("[JOB] start job_id=%s record_id=%s", job_id, record_id)
-    _set_job(job_id, status="running")
+    set_job(job_id, status="running")
     try:
         record = _fetch_recording_by_id(record_id)
-        _set_job(job_id, status="fetched", details=record)
+        set_job(job_id, status="fetched", details=record)
         logger.info(
             "[JOB] fetched job_id=%s record_id=%s session_object_key=%s calibration_object_key=%s",
             job_id,
@@ -2414,8 +3255,7 @@ def _session_analysis_job(job_id: str, record_id: str) -> None:
                 detail="Missing session_object_key or calibration_object_key in record.",
             )
 
-        session_bytes = _fetch_storage_bytes(session_key)
-        calibration_bytes = _fetch_storage_bytes(calibration_key)
+        session_bytes, calibration_bytes = _fetch_recording_binaries(session_key, calibration_key)
         session_channels = _decode_ads1298_packets(session_bytes)
         calibration_channels = _decode_ads1298_packets(calibration_bytes)
         sample_rate_hz = int(record.get("sample_rate_hz") or 500)
@@ -2435,7 +3275,7 @@ def _session_analysis_job(job_id: str, record_id: str) -> None:
             },
         }
 
-        _set_job(job_id, status="decoded", details=details)
+        set_job(job_id, status="decoded", details=details)
         logger.info(
             "[JOB] decoded job_id=%s channels=%s session_bytes=%s calibration_bytes=%s",
             job_id,
@@ -2444,7 +3284,7 @@ def _session_analysis_job(job_id: str, record_id: str) -> None:
             len(calibration_bytes),
         )
     except HTTPException as exc:
-        _set_job(job_id, status="error", error=exc.detail)
+        set_job(job_id, status="error", error=exc.detail)
         logger.error(
             "[JOB] error job_id=%s record_id=%s detail=%s",
             job_id,
@@ -2452,17 +3292,19 @@ def _session_analysis_job(job_id: str, record_id: str) -> None:
             exc.detail,
         )
     except Exception as exc:  # pragma: no cover - safeguard
-        _set_job(job_id, status="error", error=str(exc))
+        set_job(job_id, status="error", error=str(exc))
         logger.exception(
             "[JOB] unexpected_error job_id=%s record_id=%s",
             job_id,
             record_id,
         )
+    finally:
+        release_job(job_id)
 
 
 def _review_processing_job(job_id: str, record_id: str, resample: bool) -> None:
     logger.info("[REVIEW_PROCESS] start job_id=%s record_id=%s resample=%s", job_id, record_id, resample)
-    _set_job(
+    set_job(
         job_id,
         status="running",
         record_id=record_id,
@@ -2470,8 +3312,8 @@ def _review_processing_job(job_id: str, record_id: str, resample: bool) -> None:
         error=None,
     )
     try:
-        _process_review_artifacts_for_record(record_id, resample=resample)
-        _set_job(
+        _process_review_artifacts_for_record(record_id, resample=resample, job_id=job_id)
+        set_job(
             job_id,
             status="ready",
             record_id=record_id,
@@ -2479,8 +3321,10 @@ def _review_processing_job(job_id: str, record_id: str, resample: bool) -> None:
             error=None,
         )
         logger.info("[REVIEW_PROCESS] ready job_id=%s record_id=%s resample=%s", job_id, record_id, resample)
+    except JobCancelled:
+        logger.info("[REVIEW_PROCESS] cancelled job_id=%s record_id=%s resample=%s", job_id, record_id, resample)
     except Exception as exc:
-        _set_job(
+        set_job(
             job_id,
             status="error",
             record_id=record_id,
@@ -2488,6 +3332,8 @@ def _review_processing_job(job_id: str, record_id: str, resample: bool) -> None:
             error=str(exc),
         )
         logger.exception("[REVIEW_PROCESS] failed job_id=%s record_id=%s resample=%s", job_id, record_id, resample)
+    finally:
+        release_job(job_id)
 
 
 def _static_review_manifest_key(record_id: str) -> str:
@@ -2498,22 +3344,79 @@ def _static_review_window_prefix(record_id: str, window_index: int) -> str:
     return f"{STATIC_REVIEW_PREFIX}/{record_id}/windows/window_{window_index:04d}"
 
 
+def _cache_static_manifest(record_id: str, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    snapshot = {**manifest, "windows": list(manifest.get("windows") or [])}
+    with STATIC_REVIEW_MANIFEST_CACHE_LOCK:
+        STATIC_REVIEW_MANIFEST_CACHE[record_id] = snapshot
+        STATIC_REVIEW_MANIFEST_CACHE.move_to_end(record_id)
+        while len(STATIC_REVIEW_MANIFEST_CACHE) > STATIC_REVIEW_MANIFEST_CACHE_SIZE:
+            STATIC_REVIEW_MANIFEST_CACHE.popitem(last=False)
+    return snapshot
+
+
+def _cached_static_manifest(record_id: str) -> Optional[Dict[str, Any]]:
+    with STATIC_REVIEW_MANIFEST_CACHE_LOCK:
+        cached = STATIC_REVIEW_MANIFEST_CACHE.get(record_id)
+        if cached is not None:
+            STATIC_REVIEW_MANIFEST_CACHE.move_to_end(record_id)
+        return cached
+
+
+def _forget_static_manifest(record_id: str) -> None:
+    with STATIC_REVIEW_MANIFEST_CACHE_LOCK:
+        STATIC_REVIEW_MANIFEST_CACHE.pop(record_id, None)
+
+
+def _claim_static_manifest_writer(record_id: str, *, wait: bool) -> bool:
+    with STATIC_REVIEW_MANIFEST_WRITERS_CONDITION:
+        while record_id in STATIC_REVIEW_MANIFEST_WRITERS:
+            if not wait:
+                return False
+            STATIC_REVIEW_MANIFEST_WRITERS_CONDITION.wait()
+        STATIC_REVIEW_MANIFEST_WRITERS.add(record_id)
+        return True
+
+
+def _release_static_manifest_writer(record_id: str) -> None:
+    with STATIC_REVIEW_MANIFEST_WRITERS_CONDITION:
+        STATIC_REVIEW_MANIFEST_WRITERS.discard(record_id)
+        STATIC_REVIEW_MANIFEST_WRITERS_CONDITION.notify_all()
+
+
 def _upload_static_manifest(record_id: str, manifest: Dict[str, Any]) -> None:
     _upload_storage_json(_static_review_manifest_key(record_id), manifest)
+    _cache_static_manifest(record_id, manifest)
+
+
+def _static_review_manifest_not_found(record_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={
+            "code": "static_review_manifest_not_found",
+            "record_id": record_id,
+            "manifest_key": _static_review_manifest_key(record_id),
+        },
+    )
 
 
 def _load_static_review_manifest(record_id: str) -> Dict[str, Any]:
+    cached = _cached_static_manifest(record_id)
+    if cached is not None:
+        return cached
     try:
         return _fetch_storage_json(_static_review_manifest_key(record_id))
     except HTTPException as exc:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "code": "static_review_manifest_not_found",
-                "record_id": record_id,
-                "manifest_key": _static_review_manifest_key(record_id),
-            },
-        ) from exc
+        raise _static_review_manifest_not_found(record_id) from exc
+
+
+async def _load_static_review_manifest_async(record_id: str) -> Dict[str, Any]:
+    cached = _cached_static_manifest(record_id)
+    if cached is not None:
+        return cached
+    try:
+        return await _fetch_storage_json_async(_static_review_manifest_key(record_id))
+    except HTTPException as exc:
+        raise _static_review_manifest_not_found(record_id) from exc
 
 
 def _clean_ecg_series(samples: List[float], sample_rate_hz: int) -> np.ndarray:
@@ -2683,118 +3586,50 @@ def _window_channels(channels: Dict[str, List[float]], start: int, end: int) ->
     return {channel: list(channels.get(channel, [])[start:end]) for channel in CHANNEL_LABELS}
 
 
-def _plot_to_png_bytes(fig: plt.Figure) -> bytes:
-    buffer = io.BytesIO()
-    fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
-    payload = buffer.getvalue()
-    try:
-        from PIL import Image
-
-        image = Image.open(io.BytesIO(payload))
-        optimized = io.BytesIO()
-        image.save(optimized, format="PNG", optimize=True)
-        payload = optimized.getvalue()
-    except Exception:
-        pass
-    return payload
-
-
-def _safe_series(values: List[float]) -> np.ndarray:
-    return np.asarray(values, dtype=float)
-
-
-def _finite_axis_limit(*arrays: np.ndarray, default: float = 0.25) -> float:
-    finite_values: List[float] = []
-    for array in arrays:
-        finite = np.asarray(array, dtype=float)
-        finite = finite[np.isfinite(finite)]
-        if finite.size:
-            finite_values.append(float(np.max(np.abs(finite))))
-    max_abs = max(finite_values) if finite_values else default
-    return max(default, max_abs * 1.15)
+def _upload_static_review_image(object_key: str, payload: bytes) -> str:
+    attempt = 1
+    while True:
+        try:
+            _upload_storage_bytes(object_key, payload)
+            return object_key
+        except HTTPException as exc:
+            if attempt >= STATIC_REVIEW_UPLOAD_ATTEMPTS:
+                raise
+            logger.warning(
+                "[STATIC_REVIEW] image_upload_retry object_key=%s attempt=%s error=%s",
+                object_key,
+                attempt,
+                exc.detail,
+            )
+            time.sleep(0.5 * 2 ** (attempt - 1))
+            attempt += 1
 
 
-def _make_waveform_compare_png(
-    calibration: Dict[str, Any],
-    session: Dict[str, Any],
-    channel: str,
-    window_label: str,
-) -> bytes:
-    cal_x = _safe_series(calibration["epoch_axis"])
-    ses_x = _safe_series(session["epoch_axis"])
-    cal_y = _safe_series(calibration["mean_beats"][channel])
-    ses_y = _safe_series(session["mean_beats"][channel])
-    y_limit = _finite_axis_limit(cal_y, ses_y, default=0.15)
-    fig, ax = plt.subplots(figsize=(5.6, 4.2))
-    ax.plot(cal_x, cal_y, color="#8a8f98", linewidth=1.6, label="Calibration")
-    ax.plot(ses_x, ses_y, color="#d13f3f", linewidth=1.6, label="Session window")
-    ax.axhline(0, color="#607080", linewidth=0.8, alpha=0.35)
-    ax.axvline(0, color="#607080", linewidth=0.8, alpha=0.35)
-    ax.set_ylim(-y_limit, y_limit)
-    ax.set_title(f"{channel} representative mean beat\\n{window_label}", fontsize=11)
-    ax.set_xlabel("Aligned beat axis (s)")
-    ax.set_ylabel("mV")
-    ax.grid(True, alpha=0.22)
-    ax.legend(loc="upper right", fontsize=8)
-    return _plot_to_png_bytes(fig)
-
-
-def _make_2d_vcg_compare_png(
-    calibration: Dict[str, Any],
-    session: Dict[str, Any],
-    plane: str,
-    x_channel: str,
-    y_channel: str,
-    window_label: str,
-) -> bytes:
-    cal_x = _safe_series(calibration["mean_beats"][x_channel])
-    cal_y = _safe_series(calibration["mean_beats"][y_channel])
-    ses_x = _safe_series(session["mean_beats"][x_channel])
-    ses_y = _safe_series(session["mean_beats"][y_channel])
-    limit = _finite_axis_limit(cal_x, cal_y, ses_x, ses_y, default=0.15)
-    fig, ax = plt.subplots(figsize=(5.6, 4.2))
-    ax.plot(cal_x, cal_y, color="#8a8f98", linewidth=1.5, label="Calibration")
-    ax.plot(ses_x, ses_y, color="#d13f3f", linewidth=1.5, label="Session window")
-    ax.axhline(0, color="#607080", linewidth=0.8, alpha=0.35)
-    ax.axvline(0, color="#607080", linewidth=0.8, alpha=0.35)
-    ax.set_xlim(-limit, limit)
-    ax.set_ylim(-limit, limit)
-    ax.set_aspect("equal", adjustable="box")
-    ax.set_title(f"{plane} VCG-style comparison\\n{window_label}", fontsize=11)
-    ax.set_xlabel(f"{x_channel} (mV)")
-    ax.set_ylabel(f"{y_channel} (mV)")
-    ax.grid(True, alpha=0.22)
-    ax.legend(loc="upper right", fontsize=8)
-    return _plot_to_png_bytes(fig)
-
-
-def _make_3d_vcg_compare_png(
-    calibration: Dict[str, Any],
-    session: Dict[str, Any],
+def _start_static_review_window_images(
+    record_id: str,
+    window_index: int,
     window_label: str,
-) -> bytes:
-    cal_x = _safe_series(calibration["mean_beats"]["CH2"])
-    cal_y = _safe_series(calibration["mean_beats"]["CH4"])
-    cal_z = _safe_series(calibration["mean_beats"]["CH3"])
-    ses_x = _safe_series(session["mean_beats"]["CH2"])
-    ses_y = _safe_series(session["mean_beats"]["CH4"])
-    ses_z = _safe_series(session["mean_beats"]["CH3"])
-    limit = _finite_axis_limit(cal_x, cal_y, cal_z, ses_x, ses_y, ses_z, default=0.15)
-    fig = plt.figure(figsize=(5.6, 4.2))
-    ax = fig.add_subplot(111, projection="3d")
-    ax.plot(cal_x, cal_y, cal_z, color="#8a8f98", linewidth=1.3, label="Calibration")
-    ax.plot(ses_x, ses_y, ses_z, color="#d13f3f", linewidth=1.3, label="Session window")
-    ax.set_xlim(-limit, limit)
-    ax.set_ylim(-limit, limit)
-    ax.set_zlim(-limit, limit)
-    ax.set_xlabel("CH2")
-    ax.set_ylabel("CH4")
-    ax.set_zlabel("CH3")
-    ax.set_title(f"3D VCG-style comparison\\n{window_label}", fontsize=11)
-    ax.view_init(elev=24, azim=42)
-    ax.legend(loc="upper left", fontsize=8)
-    return _plot_to_png_bytes(fig)
+    calibration_result: Dict[str, Any],
+    session_result: Dict[str, Any],
+) -> Dict[str, Future]:
+    prefix = _static_review_window_prefix(record_id, window_index)
+    calibration = {"epoch_axis": calibration_result["epoch_axis"], "mean_beats": calibration_result["mean_beats"]}
+    session = {"epoch_axis": session_result["epoch_axis"], "mean_beats": session_result["mean_beats"]}
+    compare = {"calibration": calibration, "session": session, "window_label": window_label}
+    render_specs = {
+        "ch2": ("waveform_compare", {**compare, "channel": "CH2"}),
+        "ch3": ("waveform_compare", {**compare, "channel": "CH3"}),
+        "ch4": ("waveform_compare", {**compare, "channel": "CH4"}),
+        "frontal": ("vcg2d_compare", {**compare, "plane": "Frontal Plane", "x_channel": "CH2", "y_channel": "CH3"}),
+        "transverse": ("vcg2d_compare", {**compare, "plane": "Transverse Plane", "x_channel": "CH2", "y_channel": "CH4"}),
+        "sagittal": ("vcg2d_compare", {**compare, "plane": "Sagittal Plane", "x_channel": "CH4", "y_channel": "CH3"}),
+        "vcg3d": ("vcg3d_compare", compare),
+    }
+    image_payloads = dict(zip(render_specs, render_png_many(list(render_specs.values()))))
+    return {
+        name: submit("upload", _upload_static_review_image, f"{prefix}/{name}.png", payload)
+        for name, payload in image_payloads.items()
+    }
 
 
 def _generate_static_review_window_images(
@@ -2804,37 +3639,218 @@ def _generate_static_review_window_images(
     calibration_result: Dict[str, Any],
     session_result: Dict[str, Any],
 ) -> Dict[str, str]:
-    prefix = _static_review_window_prefix(record_id, window_index)
-    image_payloads = {
-        "ch2": _make_waveform_compare_png(calibration_result, session_result, "CH2", window_label),
-        "ch3": _make_waveform_compare_png(calibration_result, session_result, "CH3", window_label),
-        "ch4": _make_waveform_compare_png(calibration_result, session_result, "CH4", window_label),
-        "frontal": _make_2d_vcg_compare_png(calibration_result, session_result, "Frontal Plane", "CH2", "CH3", window_label),
-        "transverse": _make_2d_vcg_compare_png(calibration_result, session_result, "Transverse Plane", "CH2", "CH4", window_label),
-        "sagittal": _make_2d_vcg_compare_png(calibration_result, session_result, "Sagittal Plane", "CH4", "CH3", window_label),
-        "vcg3d": _make_3d_vcg_compare_png(calibration_result, session_result, window_label),
+    uploads = _start_static_review_window_images(record_id, window_index, window_label, calibration_result, session_result)
+    return {name: future.result() for name, future in uploads.items()}
+
+
+def _static_review_session_result(session_window: Dict[str, List[float]], sample_rate_hz: int) -> Dict[str, Any]:
+    session_segmentation = segmentation_timestamps_fromCH4(session_window["CH4"], sample_rate_hz)
+    return raw20s_to_meanbeat(session_window, session_segmentation, sample_rate_hz)
+
+
+def _static_review_calibration_result(calibration_window: Dict[str, List[float]], sample_rate_hz: int) -> Dict[str, Any]:
+    calibration_segmentation = segmentation_timestamps_fromCH4(calibration_window["CH4"], sample_rate_hz)
+    return raw20s_to_meanbeat(calibration_window, calibration_segmentation, sample_rate_hz)
+
+
+class PendingWindowEntry(NamedTuple):
+    entry: Dict[str, Any]
+    uploads: Dict[str, Future]
+    error: Optional[Exception]
+    session_result: Optional[Dict[str, Any]]
+
+
+def _start_static_review_window_entry(
+    record_id: str,
+    zero_index: int,
+    window_samples: int,
+    sample_rate_hz: int,
+    calibration_result: Dict[str, Any],
+    window_result: Any,
+) -> PendingWindowEntry:
+    start = zero_index * window_samples
+    end = start + window_samples
+    window_index = zero_index + 1
+    start_sec = start / sample_rate_hz
+    end_sec = end / sample_rate_hz
+    window_label = f"Window {window_index} | {start_sec:.0f}s - {end_sec:.0f}s"
+    entry = {
+        "window_index": window_index,
+        "start_sample": start,
+        "end_sample": end,
+        "start_sec": start_sec,
+        "end_sec": end_sec,
+    }
+    try:
+        if isinstance(window_result, Exception):
+            raise window_result
+        uploads = _start_static_review_window_images(
+            record_id=record_id,
+            window_index=window_index,
+            window_label=window_label,
+            calibration_result=calibration_result,
+            session_result=window_result,
+        )
+        return PendingWindowEntry(entry, uploads, None, window_result)
+    except Exception as exc:
+        return PendingWindowEntry(entry, {}, exc, None)
+
+
+def _finish_static_review_window_entry(record_id: str, pending: PendingWindowEntry) -> Dict[str, Any]:
+    try:
+        if pending.error is not None:
+            raise pending.error
+        images = {name: future.result() for name, future in pending.uploads.items()}
+        return {
+            **pending.entry,
+            "status": "ready",
+            "images": images,
+            "raw_beat_counts": pending.session_result.get("raw_beat_counts", {}),
+            "kept_beat_counts": pending.session_result.get("kept_beat_counts", {}),
+        }
+    except Exception as exc:
+        logger.exception("[STATIC_REVIEW] window_failed record_id=%s window=%s", record_id, pending.entry["window_index"])
+        return {**pending.entry, "status": "error", "error": str(exc), "images": {}}
+
+
+def _static_review_window_entry(
+    record_id: str,
+    zero_index: int,
+    window_samples: int,
+    sample_rate_hz: int,
+    calibration_result: Dict[str, Any],
+    window_result: Any,
+) -> Dict[str, Any]:
+    pending = _start_static_review_window_entry(
+        record_id,
+        zero_index,
+        window_samples,
+        sample_rate_hz,
+        calibration_result,
+        window_result,
+    )
+    return _finish_static_review_window_entry(record_id, pending)
+
+
+def _static_review_session_result_from_shared(
+    handles: Dict[str, SharedArrayHandle],
+    start: int,
+    end: int,
+    sample_rate_hz: int,
+) -> Dict[str, Any]:
+    session_window: Dict[str, List[float]] = {}
+    for channel in CHANNEL_LABELS:
+        with attached_array(handles[channel]) as samples:
+            session_window[channel] = samples[start:end].tolist()
+    return _static_review_session_result(session_window, sample_rate_hz)
+
+
+def _iter_static_review_session_results(
+    share_key: str,
+    session_channels: Dict[str, List[float]],
+    zero_indices: List[int],
+    window_samples: int,
+    sample_rate_hz: int,
+) -> Iterator[tuple[int, Any]]:
+    if not process_pool_enabled():
+        for zero_index in zero_indices:
+            start = zero_index * window_samples
+            try:
+                result: Any = _static_review_session_result(
+                    _window_channels(session_channels, start, start + window_samples),
+                    sample_rate_hz,
+                )
+            except Exception as exc:
+                result = exc
+            yield zero_index, result
+        return
+
+    # Keep a few windows ahead in the process pool while this thread renders and uploads.
+    lookahead = max(1, PROCESS_WORKERS) * 2
+    remaining = iter(zero_indices)
+    pending: Dict[int, Any] = {}
+    with shared_arrays(share_key, session_channels) as handles:
+        try:
+            for zero_index in zero_indices:
+                while len(pending) < lookahead:
+                    next_index = next(remaining, None)
+                    if next_index is None:
+                        break
+                    next_start = next_index * window_samples
+                    pending[next_index] = submit_process(
+                        _static_review_session_result_from_shared,
+                        handles,
+                        next_start,
+                        next_start + window_samples,
+                        sample_rate_hz,
+                    )
+                try:
+                    result = pending.pop(zero_index).result()
+                except Exception as exc:
+                    result = exc
+                yield zero_index, result
+        finally:
+            for future in pending.values():
+                future.cancel()
+
+
+def _reusable_static_review_windows(
+    existing: Optional[Dict[str, Any]],
+    *,
+    session_key: str,
+    calibration_key: str,
+    session_byte_length: int,
+    sample_rate_hz: int,
+    window_samples: int,
+    target_window_count: int,
+) -> Dict[int, Dict[str, Any]]:
+    if not existing or existing.get("processing_version") != STATIC_REVIEW_PROCESSING_VERSION:
+        return {}
+    if (
+        existing.get("session_object_key") != session_key
+        or existing.get("calibration_object_key") != calibration_key
+        or existing.get("sample_rate_hz") != sample_rate_hz
+        or existing.get("window_samples") != window_samples
+        or existing.get("session_byte_length", session_byte_length) != session_byte_length
+    ):
+        return {}
+    candidates: Dict[int, Dict[str, Any]] = {}
+    for window in existing.get("windows") or []:
+        window_index = int(window.get("window_index") or 0)
+        if window.get("status") == "ready" and window.get("images") and 1 <= window_index <= target_window_count:
+            candidates[window_index] = window
+    unverified = sorted(
+        {
+            object_key
+            for window in candidates.values()
+            for object_key in window["images"].values()
+            if not object_cached(object_key)
+        }
+    )
+    checks = {object_key: submit("io", _storage_object_exists, object_key) for object_key in unverified}
+    present = {object_key for object_key, future in checks.items() if future.result()}
+    return {
+        window_index: window
+        for window_index, window in candidates.items()
+        if all(object_cached(object_key) or object_key in present for object_key in window["images"].values())
     }
-    image_keys: Dict[str, str] = {}
-    for name, payload in image_payloads.items():
-        object_key = f"{prefix}/{name}.png"
-        _upload_storage_bytes(object_key, payload)
-        STATIC_REVIEW_IMAGE_CACHE[object_key] = payload
-        image_keys[name] = object_key
-    return image_keys
 
 
 def _static_review_job(job_id: str, record_id: str, max_windows: Optional[int] = None, force: bool = False) -> None:
     logger.info("[STATIC_REVIEW] start job_id=%s record_id=%s max_windows=%s force=%s", job_id, record_id, max_windows, force)
-    _set_job(job_id, status="running", record_id=record_id, details={"completed_window_count": 0}, error=None)
+    # Waits out a superseded job or a window recompute that is still writing this record's manifest.
+    _claim_static_manifest_writer(record_id, wait=True)
+    set_job(job_id, status="running", record_id=record_id, details={"completed_window_count": 0}, error=None)
     try:
+        existing: Optional[Dict[str, Any]] = None
         if not force:
             try:
                 existing = _load_static_review_manifest(record_id)
-                if existing.get("processing_version") == STATIC_REVIEW_PROCESSING_VERSION and existing.get("status") == "ready":
-                    _set_job(job_id, status="ready", record_id=record_id, details=existing, error=None)
-                    return
             except HTTPException:
-                pass
+                existing = None
+            if existing and existing.get("processing_version") == STATIC_REVIEW_PROCESSING_VERSION and existing.get("status") == "ready":
+                set_job(job_id, status="ready", record_id=record_id, details=existing, error=None)
+                return
 
         record = _fetch_recording_by_id(record_id)
         session_key = record.get("session_object_key")
@@ -2844,14 +3860,15 @@ def _static_review_job(job_id: str, record_id: str, max_windows: Optional[int] =
 
         sample_rate_hz = int(record.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
         window_samples = sample_rate_hz * STATIC_REVIEW_WINDOW_SECONDS
-        session_bytes = _fetch_storage_bytes(session_key)
-        calibration_bytes = _fetch_storage_bytes(calibration_key)
+        update_job_details(job_id, stage="fetching")
+        session_bytes, calibration_bytes = _fetch_recording_binaries(session_key, calibration_key)
         session_channels = _decode_ads1298_packets(session_bytes)
         calibration_channels = _decode_ads1298_packets(calibration_bytes)
 
-        calibration_window = _window_channels(calibration_channels, 0, window_samples)
-        calibration_segmentation = segmentation_timestamps_fromCH4(calibration_window["CH4"], sample_rate_hz)
-        calibration_result = raw20s_to_meanbeat(calibration_window, calibration_segmentation, sample_rate_hz)
+        calibration_result = _static_review_calibration_result(
+            _window_channels(calibration_channels, 0, window_samples),
+            sample_rate_hz,
+        )
 
         total_window_count = min(len(session_channels.get("CH2", [])), len(session_channels.get("CH3", [])), len(session_channels.get("CH4", []))) // window_samples
         if max_windows is not None and max_windows > 0:
@@ -2859,6 +3876,15 @@ def _static_review_job(job_id: str, record_id: str, max_windows: Optional[int] =
         else:
             total_to_process = total_window_count
 
+        reused_windows = _reusable_static_review_windows(
+            existing,
+            session_key=session_key,
+            calibration_key=calibration_key,
+            session_byte_length=len(session_bytes),
+            sample_rate_hz=sample_rate_hz,
+            window_samples=window_samples,
+            target_window_count=total_to_process,
+        )
         manifest: Dict[str, Any] = {
             "record_id": record_id,
             "status": "running",
@@ -2868,77 +3894,102 @@ def _static_review_job(job_id: str, record_id: str, max_windows: Optional[int] =
             "window_samples": window_samples,
             "total_window_count": total_window_count,
             "target_window_count": total_to_process,
-            "completed_window_count": 0,
+            "completed_window_count": len(reused_windows),
+            "reused_window_count": len(reused_windows),
             "calibration_object_key": calibration_key,
             "session_object_key": session_key,
+            "session_byte_length": len(session_bytes),
             "manifest_object_key": _static_review_manifest_key(record_id),
-            "windows": [],
-            "created_at": _sg_now_iso(),
+            "windows": [reused_windows[index] for index in sorted(reused_windows)],
+            "created_at": (existing or {}).get("created_at") if reused_windows else _sg_now_iso(),
             "updated_at": _sg_now_iso(),
         }
         _upload_static_manifest(record_id, manifest)
+        if reused_windows:
+            logger.info(
+                "[STATIC_REVIEW] resume job_id=%s record_id=%s reused_windows=%s target_windows=%s",
+                job_id,
+                record_id,
+                len(reused_windows),
+                total_to_process,
+            )
 
-        for zero_index in range(total_to_process):
-            start = zero_index * window_samples
-            end = start + window_samples
-            window_index = zero_index + 1
-            start_sec = start / sample_rate_hz
-            end_sec = end / sample_rate_hz
-            window_label = f"Window {window_index} | {start_sec:.0f}s - {end_sec:.0f}s"
-            try:
-                session_window = _window_channels(session_channels, start, end)
-                session_segmentation = segmentation_timestamps_fromCH4(session_window["CH4"], sample_rate_hz)
-                session_result = raw20s_to_meanbeat(session_window, session_segmentation, sample_rate_hz)
-                images = _generate_static_review_window_images(
-                    record_id=record_id,
-                    window_index=window_index,
-                    window_label=window_label,
-                    calibration_result=calibration_result,
-                    session_result=session_result,
-                )
-                window_entry = {
-                    "window_index": window_index,
-                    "start_sample": start,
-                    "end_sample": end,
-                    "start_sec": start_sec,
-                    "end_sec": end_sec,
-                    "status": "ready",
-                    "images": images,
-                    "raw_beat_counts": session_result.get("raw_beat_counts", {}),
-                    "kept_beat_counts": session_result.get("kept_beat_counts", {}),
-                }
-            except Exception as exc:
-                logger.exception("[STATIC_REVIEW] window_failed record_id=%s window=%s", record_id, window_index)
-                window_entry = {
-                    "window_index": window_index,
-                    "start_sample": start,
-                    "end_sample": end,
-                    "start_sec": start_sec,
-                    "end_sec": end_sec,
-                    "status": "error",
-                    "error": str(exc),
-                    "images": {},
-                }
-            manifest["windows"].append(window_entry)
-            manifest["completed_window_count"] = len([item for item in manifest["windows"] if item.get("status") == "ready"])
+        window_results = _iter_static_review_session_results(
+            f"static:{record_id}:{session_key}:{len(session_bytes)}",
+            session_channels,
+            [zero_index for zero_index in range(total_to_process) if zero_index + 1 not in reused_windows],
+            window_samples,
+            sample_rate_hz,
+        )
+        unflushed_windows = 0
+
+        def record_window(pending: PendingWindowEntry) -> None:
+            nonlocal unflushed_windows
+            # A window enters the manifest only once all of its images are stored.
+            window_entry = _finish_static_review_window_entry(record_id, pending)
+            raise_if_job_cancelled(job_id)
+            bisect.insort(manifest["windows"], window_entry, key=lambda item: item.get("window_index", 0))
+            if window_entry["status"] == "ready":
+                manifest["completed_window_count"] += 1
             manifest["updated_at"] = _sg_now_iso()
-            _upload_static_manifest(record_id, manifest)
-            _set_job(
+            unflushed_windows += 1
+            if unflushed_windows >= STATIC_REVIEW_MANIFEST_FLUSH_WINDOWS:
+                _upload_static_manifest(record_id, manifest)
+                unflushed_windows = 0
+            else:
+                _cache_static_manifest(record_id, manifest)
+            set_job(
                 job_id,
                 status="running",
                 record_id=record_id,
                 details={
+                    "stage": "rendering",
+                    "window_index": window_entry["window_index"],
                     "completed_window_count": manifest["completed_window_count"],
                     "target_window_count": total_to_process,
                 },
                 error=None,
             )
 
+        # Uploads for earlier windows run on the `upload` pool while later windows render.
+        pending_windows: deque[PendingWindowEntry] = deque()
+        try:
+            with closing(window_results):
+                for zero_index, window_result in window_results:
+                    raise_if_job_cancelled(job_id)
+                    pending_windows.append(
+                        _start_static_review_window_entry(
+                            record_id,
+                            zero_index,
+                            window_samples,
+                            sample_rate_hz,
+                            calibration_result,
+                            window_result,
+                        )
+                    )
+                    while len(pending_windows) > STATIC_REVIEW_UPLOAD_WINDOWS_AHEAD:
+                        record_window(pending_windows.popleft())
+            while pending_windows:
+                record_window(pending_windows.popleft())
+        finally:
+            for pending in pending_windows:
+                for future in pending.uploads.values():
+                    future.cancel()
+
         manifest["status"] = "ready"
         manifest["updated_at"] = _sg_now_iso()
         _upload_static_manifest(record_id, manifest)
-        _set_job(job_id, status="ready", record_id=record_id, details=manifest, error=None)
+        _upsert_processed_artifact(
+            record_id,
+            STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE,
+            _static_review_manifest_key(record_id),
+            processing_version=STATIC_REVIEW_PROCESSING_VERSION,
+        )
+        _forget_static_manifest(record_id)
+        set_job(job_id, status="ready", record_id=record_id, details=manifest, error=None)
         logger.info("[STATIC_REVIEW] ready job_id=%s record_id=%s windows=%s", job_id, record_id, total_to_process)
+    except JobCancelled:
+        logger.info("[STATIC_REVIEW] cancelled job_id=%s record_id=%s", job_id, record_id)
     except Exception as exc:
         logger.exception("[STATIC_REVIEW] failed job_id=%s record_id=%s", job_id, record_id)
         try:
@@ -2949,7 +4000,116 @@ def _static_review_job(job_id: str, record_id: str, max_windows: Optional[int] =
             _upload_static_manifest(record_id, manifest)
         except Exception:
             pass
-        _set_job(job_id, status="error", record_id=record_id, details={"record_id": record_id}, error=str(exc))
+        _forget_static_manifest(record_id)
+        set_job(job_id, status="error", record_id=record_id, details={"record_id": record_id}, error=str(exc))
+    finally:
+        _release_static_manifest_writer(record_id)
+        release_job(job_id)
+
+
+def _recompute_static_review_window(record_id: str, window_index: int) -> Dict[str, Any]:
+    job_id = active_job_id("static_review", record_id)
+    if job_id is not None or not _claim_static_manifest_writer(record_id, wait=False):
+        raise HTTPException(
+            status_code=409,
+            detail={"code": "static_review_busy", "record_id": record_id, "job_id": job_id},
+        )
+    try:
+        return _rewrite_static_review_window(record_id, window_index)
+    finally:
+        _release_static_manifest_writer(record_id)
+
+
+def _rewrite_static_review_window(record_id: str, window_index: int) -> Dict[str, Any]:
+    manifest = _load_static_review_manifest(record_id)
+    if manifest.get("processing_version") != STATIC_REVIEW_PROCESSING_VERSION or manifest.get("status") == "running":
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "static_review_not_ready",
+                "record_id": record_id,
+                "status": manifest.get("status"),
+                "processing_version": manifest.get("processing_version"),
+            },
+        )
+    if not 1 <= window_index <= int(manifest.get("total_window_count") or 0):
+        raise HTTPException(status_code=404, detail="Static review window not found.")
+    sample_rate_hz = int(manifest.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
+    window_samples = int(manifest.get("window_samples") or sample_rate_hz * STATIC_REVIEW_WINDOW_SECONDS)
+    start = (window_index - 1) * window_samples
+
+    # Only the packets behind this window and the calibration window are fetched.
+    calibration_future = submit("io", _fetch_sample_window, manifest["calibration_object_key"], 0, window_samples)
+    session_window = _fetch_sample_window(manifest["session_object_key"], start, start + window_samples)
+    calibration_result = _static_review_calibration_result(calibration_future.result(), sample_rate_hz)
+    try:
+        window_result: Any = _static_review_session_result(session_window, sample_rate_hz)
+    except Exception as exc:
+        window_result = exc
+    window_entry = _static_review_window_entry(
+        record_id,
+        window_index - 1,
+        window_samples,
+        sample_rate_hz,
+        calibration_result,
+        window_result,
+    )
+
+    windows = [item for item in manifest.get("windows") or [] if item.get("window_index") != window_index]
+    windows.append(window_entry)
+    windows.sort(key=lambda item: item.get("window_index", 0))
+    _upload_static_manifest(
+        record_id,
+        {
+            **manifest,
+            "windows": windows,
+            "completed_window_count": len([item for item in windows if item.get("status") == "ready"]),
+            "updated_at": _sg_now_iso(),
+        },
+    )
+    logger.info(
+        "[STATIC_REVIEW] window_recomputed record_id=%s window=%s status=%s",
+        record_id,
+        window_index,
+        window_entry["status"],
+    )
+    return window_entry
+
+
+def _job_event_stream_response(request: Request, job_id: str) -> StreamingResponse:
+    if get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    subscriber = subscribe_job_events(job_id)
+
+    async def stream():
+        try:
+            job = get_job(job_id) or {}
+            yield f"event: job\ndata: {json.dumps(job_event(job_id, job), default=str)}\n\n".encode("utf-8")
+            if job_is_terminal(job):
+                return
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    payload = await asyncio.to_thread(subscriber.get, True, 15.0)
+                except Empty:
+                    yield b": keep-alive\n\n"
+                    continue
+                yield f"event: job\ndata: {payload}\n\n".encode("utf-8")
+                if job_is_terminal(json.loads(payload)):
+                    break
+        finally:
+            unsubscribe_job_events(job_id, subscriber)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @app.post("/session_analysis/start", response_model=SessionAnalysisJob)
@@ -2958,25 +4118,23 @@ async def session_analysis_start(
     background_tasks: BackgroundTasks,
     request: Request,
 ) -> SessionAnalysisJob:
-    job_id = uuid4().hex
-    _set_job(job_id, status="queued", record_id=payload.record_id)
-    background_tasks.add_task(_session_analysis_job, job_id, payload.record_id)
+    job_id, created, _ = claim_job("session_analysis", payload.record_id)
+    if created:
+        set_job(job_id, status="queued", record_id=payload.record_id)
+        background_tasks.add_task(_session_analysis_job, job_id, payload.record_id)
     logger.info(
-        "[API] %s record_id=%s job_id=%s",
+        "[API] %s record_id=%s job_id=%s coalesced=%s",
         request.url.path,
         payload.record_id,
         job_id,
+        not created,
     )
-    return SessionAnalysisJob(
-        job_id=job_id,
-        status="queued",
-        record_id=payload.record_id,
-    )
+    return _session_analysis_job_response(job_id, get_job(job_id) or {}, coalesced=not created)
 
 
 @app.get("/session_analysis/status/{job_id}", response_model=SessionAnalysisJob)
 async def session_analysis_status(job_id: str) -> SessionAnalysisJob:
-    job = ANALYSIS_JOBS.get(job_id)
+    job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
     logger.info(
@@ -2985,13 +4143,7 @@ async def session_analysis_status(job_id: str) -> SessionAnalysisJob:
         job_id,
         job.get("status", "unknown"),
     )
-    return SessionAnalysisJob(
-        job_id=job_id,
-        status=job.get("status", "unknown"),
-        record_id=job.get("record_id", ""),
-        details=job.get("details"),
-        error=job.get("error"),
-    )
+    return _session_analysis_job_response(job_id, job)
 
 
 @app.post("/review/{record_id}/process", response_model=SessionAnalysisJob)
@@ -3000,9 +4152,22 @@ async def review_process_start(
     payload: ReviewProcessRequest,
     background_tasks: BackgroundTasks,
 ) -> SessionAnalysisJob:
-    job_id = uuid4().hex
+    job_id, created, superseded_job_id = claim_job(
+        "review",
+        record_id,
+        {"resample": payload.resample},
+        force=payload.force,
+    )
+    if not created:
+        logger.info(
+            "[REVIEW_PROCESS] coalesced job_id=%s record_id=%s resample=%s",
+            job_id,
+            record_id,
+            payload.resample,
+        )
+        return _session_analysis_job_response(job_id, get_job(job_id) or {}, coalesced=True)
     _clear_review_caches_for_record(record_id)
-    _set_job(
+    set_job(
         job_id,
         status="queued",
         record_id=record_id,
@@ -3011,23 +4176,22 @@ async def review_process_start(
     )
     background_tasks.add_task(_review_processing_job, job_id, record_id, payload.resample)
     logger.info(
-        "[REVIEW_PROCESS] queued job_id=%s record_id=%s resample=%s",
+        "[REVIEW_PROCESS] queued job_id=%s record_id=%s resample=%s superseded_job_id=%s",
         job_id,
         record_id,
         payload.resample,
+        superseded_job_id,
     )
-    return SessionAnalysisJob(
-        job_id=job_id,
-        status="queued",
-        record_id=record_id,
-        details={"resample": payload.resample},
-        error=None,
+    return _session_analysis_job_response(
+        job_id,
+        get_job(job_id) or {},
+        superseded_job_id=superseded_job_id,
     )
 
 
 @app.get("/review/process/{job_id}", response_model=SessionAnalysisJob)
 async def review_process_status(job_id: str) -> SessionAnalysisJob:
-    job = ANALYSIS_JOBS.get(job_id)
+    job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
     logger.info(
@@ -3037,23 +4201,22 @@ async def review_process_status(job_id: str) -> SessionAnalysisJob:
         job.get("status", "unknown"),
         job.get("details"),
     )
-    return SessionAnalysisJob(
-        job_id=job_id,
-        status=job.get("status", "unknown"),
-        record_id=job.get("record_id", ""),
-        details=job.get("details"),
-        error=job.get("error"),
-    )
+    return _session_analysis_job_response(job_id, job)
+
+
+@app.get("/review/process/{job_id}/events")
+async def review_process_events(request: Request, job_id: str) -> StreamingResponse:
+    return _job_event_stream_response(request, job_id)
 
 
 @app.get("/review_static/{record_id}/manifest")
 async def static_review_manifest(record_id: str) -> Dict[str, Any]:
-    return _load_static_review_manifest(record_id)
+    return await _load_static_review_manifest_async(record_id)
 
 
 @app.get("/review_static/latest", response_model=LatestRecordResponse)
 async def static_review_latest_record() -> LatestRecordResponse:
-    latest_id = _fetch_latest_recording_id()
+    latest_id = await _fetch_latest_recording_id_async()
     if not latest_id:
         raise HTTPException(status_code=404, detail="No ECG recordings available yet.")
     return LatestRecordResponse(record_id=latest_id)
@@ -3065,8 +4228,21 @@ async def static_review_process_start(
     payload: StaticReviewProcessRequest,
     background_tasks: BackgroundTasks,
 ) -> SessionAnalysisJob:
-    job_id = uuid4().hex
-    _set_job(
+    job_id, created, superseded_job_id = claim_job(
+        "static_review",
+        record_id,
+        {"max_windows": payload.max_windows},
+        force=payload.force,
+    )
+    if not created:
+        logger.info(
+            "[STATIC_REVIEW] coalesced job_id=%s record_id=%s max_windows=%s",
+            job_id,
+            record_id,
+            payload.max_windows,
+        )
+        return _session_analysis_job_response(job_id, get_job(job_id) or {}, coalesced=True)
+    set_job(
         job_id,
         status="queued",
         record_id=record_id,
@@ -3074,27 +4250,29 @@ async def static_review_process_start(
         error=None,
     )
     background_tasks.add_task(_static_review_job, job_id, record_id, payload.max_windows, payload.force)
-    return SessionAnalysisJob(
-        job_id=job_id,
-        status="queued",
-        record_id=record_id,
-        details={"max_windows": payload.max_windows, "force": payload.force},
-        error=None,
+    return _session_analysis_job_response(
+        job_id,
+        get_job(job_id) or {},
+        superseded_job_id=superseded_job_id,
     )
 
 
 @app.get("/review_static/process/{job_id}", response_model=SessionAnalysisJob)
 async def static_review_process_status(job_id: str) -> SessionAnalysisJob:
-    job = ANALYSIS_JOBS.get(job_id)
+    job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
-    return SessionAnalysisJob(
-        job_id=job_id,
-        status=job.get("status", "unknown"),
-        record_id=job.get("record_id", ""),
-        details=job.get("details"),
-        error=job.get("error"),
-    )
+    return _session_analysis_job_response(job_id, job)
+
+
+@app.get("/review_static/process/{job_id}/events")
+async def static_review_process_events(request: Request, job_id: str) -> StreamingResponse:
+    return _job_event_stream_response(request, job_id)
+
+
+@app.post("/review_static/{record_id}/windows/{window_index}")
+async def static_review_window_process(record_id: str, window_index: int) -> Dict[str, Any]:
+    return await run_in_pool("cpu", _recompute_static_review_window, record_id, window_index)
 
 
 @app.get("/review_static/{record_id}/image")
@@ -3102,10 +4280,7 @@ async def static_review_image(record_id: str, object_key: str) -> Response:
     expected_prefix = f"{STATIC_REVIEW_PREFIX}/{record_id}/"
     if not object_key.startswith(expected_prefix) or not object_key.endswith(".png"):
         raise HTTPException(status_code=400, detail="Invalid static review image key.")
-    payload = STATIC_REVIEW_IMAGE_CACHE.get(object_key)
-    if payload is None:
-        payload = _fetch_storage_bytes(object_key)
-        STATIC_REVIEW_IMAGE_CACHE[object_key] = payload
+    payload = await _fetch_storage_bytes_async(object_key)
     return Response(
         content=payload,
         media_type="image/png",
@@ -3115,7 +4290,7 @@ async def static_review_image(record_id: str, object_key: str) -> Response:
 
 @app.get("/review/latest", response_model=ReviewSummaryResponse)
 async def review_latest(channel: str = "CH2") -> ReviewSummaryResponse:
-    latest_id = _fetch_latest_recording_id()
+    latest_id = await _fetch_latest_recording_id_async()
     if not latest_id:
         raise HTTPException(status_code=404, detail="No recordings found.")
     return await review_record(latest_id, channel=channel)
@@ -3135,10 +4310,20 @@ async def review_record(
         record_id,
         selected_channel,
     )
-    artifact = _load_review_artifact(record_id, selected_channel)
-    calibration_section = artifact.get("calibration", {})
-    session_section = artifact.get("session", {})
-    sample_rate_hz = int(artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
+    summary = await _load_review_shard_async(record_id, selected_channel, "summary")
+    if summary is None:
+        summary = _build_review_summary(await _load_review_artifact_async(record_id, selected_channel))
+    return await run_in_pool("cpu", _build_review_summary_response, record_id, selected_channel, summary)
+
+
+def _build_review_summary_response(
+    record_id: str,
+    selected_channel: str,
+    summary: Dict[str, Any],
+) -> ReviewSummaryResponse:
+    calibration_section = summary["calibration"]
+    session_section = summary["session"]
+    sample_rate_hz = summary["sample_rate_hz"]
 
     logger.info(
         "[REVIEW] summary record_id=%s channel=%s calibration_beats=%s session_beats=%s session_windows=%s session_intervals=%s",
@@ -3153,8 +4338,8 @@ async def review_record(
         record_id=record_id,
         channel=selected_channel,
         sample_rate_hz=sample_rate_hz,
-        calibration=ReviewSectionSummary(**_build_review_section_summary(calibration_section)),
-        session=ReviewSectionSummary(**_build_review_section_summary(session_section)),
+        calibration=ReviewSectionSummary(**calibration_section),
+        session=ReviewSectionSummary(**session_section),
     )
 
 
@@ -3179,13 +4364,25 @@ async def review_window(
         selected_section,
         window_index,
     )
-    artifact = _load_review_artifact(record_id, selected_channel)
-    sample_rate_hz = int(artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
-    section_payload = _build_review_window_section(
-        artifact.get(selected_section, {}),
-        sample_rate_hz,
-        window_index,
+    index, window = await _load_review_window_async(record_id, selected_channel, selected_section, window_index)
+    return await run_in_pool(
+        "cpu",
+        _build_review_window_response,
+        record_id,
+        selected_channel,
+        selected_section,
+        index["sample_rate_hz"],
+        window,
     )
+
+
+def _build_review_window_response(
+    record_id: str,
+    selected_channel: str,
+    selected_section: str,
+    sample_rate_hz: int,
+    section_payload: Dict[str, Any],
+) -> ReviewWindowResponse:
     logger.info(
         "[REVIEW] window response record_id=%s channel=%s section=%s window=%s/%s samples=%s beats=%s",
         record_id,
@@ -3221,41 +4418,43 @@ async def review_session_window(
         selected_channel,
         session_window_index,
     )
-    artifact = _load_review_artifact(record_id, selected_channel)
-    sample_rate_hz = int(artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
-    session_section = artifact.get("session", {})
-    signal = session_section.get("signal", {}).get("full", []) or []
-    window_samples = sample_rate_hz * REVIEW_WINDOW_SECONDS
-    window_count = max(1, (len(signal) + window_samples - 1) // window_samples)
-    bounded_window_index = max(1, min(session_window_index, window_count))
-    start_index = (bounded_window_index - 1) * window_samples
-    end_index = min(len(signal), start_index + window_samples)
-    session_beats = session_section.get("beats", {}).get("items", []) or []
+    index, window = await _load_review_window_async(record_id, selected_channel, "session", session_window_index)
+    interval_rows = await _load_review_interval_rows_async(record_id, selected_channel, "session", index)
+    return await run_in_pool(
+        "cpu",
+        _build_review_session_window_response,
+        record_id,
+        selected_channel,
+        index,
+        window,
+        interval_rows,
+    )
+
+
+def _build_review_session_window_response(
+    record_id: str,
+    selected_channel: str,
+    index: Dict[str, Any],
+    window: Dict[str, Any],
+    interval_rows: List[Dict[str, Any]],
+) -> ReviewSessionWindowResponse:
+    sample_rate_hz = index["sample_rate_hz"]
+    # Section-wide counts from the index, interval rows from their shard; signal, markers and beats from the window.
     session_window = {
-        **session_section,
-        "signal": {
-            **(session_section.get("signal", {}) or {}),
-            "full": signal[start_index:end_index],
-            "r_peaks": [
-                peak - start_index
-                for peak in (session_section.get("signal", {}).get("r_peaks", []) or [])
-                if start_index <= peak < end_index
-            ],
-        },
-        "beats": {
-            "count": len([beat for beat in session_beats if beat.get("window_index") == bounded_window_index]),
-            "items": [beat for beat in session_beats if beat.get("window_index") == bounded_window_index],
-        },
-        "window_count": window_count,
-        "window_start_sample": start_index + 1 if signal else 1,
-        "window_end_sample": end_index,
+        **index["session"],
+        "interval_related_rows": interval_rows,
+        "signal": window["signal"],
+        "beats": window["beats"],
+        "window_count": window["window_count"],
+        "window_start_sample": window["window_start_sample"],
+        "window_end_sample": window["window_end_sample"],
     }
     logger.info(
         "[REVIEW] session_window response record_id=%s channel=%s session_window=%s/%s session_window_samples=%s session_beats=%s",
         record_id,
         selected_channel,
-        bounded_window_index,
-        window_count,
+        window["window_index"],
+        window["window_count"],
         len(session_window["signal"]["full"]),
         session_window["beats"]["count"],
     )
@@ -3267,6 +4466,72 @@ async def review_session_window(
     )
 
 
+@app.get("/review/{record_id}/envelope", response_model=ReviewEnvelopeResponse)
+async def review_envelope(
+    record_id: str,
+    section: str = "session",
+    channel: str = "CH2",
+    start_sample: int = 0,
+    end_sample: Optional[int] = None,
+    pixel_width: int = 1000,
+) -> ReviewEnvelopeResponse:
+    selected_channel = (channel or "CH2").upper()
+    selected_section = (section or "session").lower()
+    if selected_channel not in CHANNEL_LABELS:
+        raise HTTPException(status_code=400, detail="Invalid channel.")
+    if selected_section not in {"calibration", "session"}:
+        raise HTTPException(status_code=400, detail="Invalid section.")
+    pixel_width = max(1, min(pixel_width, REVIEW_ENVELOPE_MAX_PIXELS))
+
+    index, pyramid, signal = await _load_review_envelope_async(record_id, selected_channel, selected_section)
+    sample_count = int(pyramid["sample_count"])
+    start = max(0, min(start_sample, sample_count))
+    end = sample_count if end_sample is None else max(start, min(end_sample, sample_count))
+    factor = select_envelope_factor(pyramid, start, end, pixel_width)
+    if factor > 1:
+        pyramid = await _load_review_envelope_level_async(
+            record_id,
+            selected_channel,
+            selected_section,
+            pyramid,
+            factor,
+        )
+        envelope = envelope_buckets(pyramid, factor, start, end)
+    else:
+        # Zoomed in past the finest level: raw samples, which are their own min and max.
+        if signal is None:
+            signal = await _load_review_signal_range_async(
+                record_id,
+                selected_channel,
+                selected_section,
+                index["sample_rate_hz"],
+                start,
+                end,
+            )
+        else:
+            signal = signal[start:end]
+        envelope = {"factor": 1, "start_sample": start, "end_sample": end, "min": signal, "max": signal}
+    logger.info(
+        "[REVIEW] envelope record_id=%s channel=%s section=%s range=%s-%s pixel_width=%s factor=%s buckets=%s",
+        record_id,
+        selected_channel,
+        selected_section,
+        start,
+        end,
+        pixel_width,
+        envelope["factor"],
+        len(envelope["min"]),
+    )
+    return ReviewEnvelopeResponse(
+        record_id=record_id,
+        channel=selected_channel,
+        section=selected_section,
+        sample_rate_hz=index["sample_rate_hz"],
+        sample_count=sample_count,
+        **envelope,
+    )
+
+
 def _get_vector_beat_payload(
     record_id: str,
     section: str,
@@ -3276,9 +4541,10 @@ def _get_vector_beat_payload(
     if selected_section not in {"calibration", "session"}:
         raise HTTPException(status_code=400, detail="Invalid section.")
 
-    lead_x_artifact = _load_review_artifact(record_id, "CH2")
-    lead_z_artifact = _load_review_artifact(record_id, "CH3")
-    lead_y_artifact = _load_review_artifact(record_id, "CH4")
+    artifacts = _load_review_artifacts(record_id, ["CH2", "CH3", "CH4"])
+    lead_x_artifact = artifacts["CH2"]
+    lead_z_artifact = artifacts["CH3"]
+    lead_y_artifact = artifacts["CH4"]
     sample_rate_hz = int(lead_x_artifact.get("sample_rate_hz") or DEFAULT_SAMPLE_RATE_HZ)
 
     lead_x_section = lead_x_artifact.get(selected_section, {})
@@ -3317,95 +4583,6 @@ def _get_vector_beat_payload(
     }
 
 
-def _render_vector3d_png(
-    lead_x: List[float],
-    lead_y: List[float],
-    lead_z: List[float],
-    markers: BeatMarkers,
-    progress_percent: int,
-    y_min_mv: float,
-    y_max_mv: float,
-) -> str:
-    count = min(len(lead_x), len(lead_y), len(lead_z))
-    if count <= 0:
-        raise HTTPException(status_code=404, detail="No vector samples available for 3D rendering.")
-
-    bounded_progress = max(1, min(progress_percent, 100))
-    visible_count = max(1, min(count, int(round((count * bounded_progress) / 100.0))))
-    x = lead_x[:visible_count]
-    y = lead_y[:visible_count]
-    z = lead_z[:visible_count]
-
-    fig = plt.figure(figsize=(8.4, 6.6), dpi=160)
-    fig.patch.set_facecolor("#f5fafc")
-    ax = fig.add_subplot(111, projection="3d")
-    ax.set_facecolor("#f8fbfd")
-    # Draw the origin axes first with lower z-order so the beat path can sit above them.
-    ax.plot([y_min_mv, y_max_mv], [0, 0], [0, 0], color="#dc2626", linewidth=1.2, alpha=0.72, zorder=1)
-    ax.plot([0, 0], [y_min_mv, y_max_mv], [0, 0], color="#2563eb", linewidth=1.2, alpha=0.72, zorder=1)
-    ax.plot([0, 0], [0, 0], [y_min_mv, y_max_mv], color="#16a34a", linewidth=1.2, alpha=0.72, zorder=1)
-    ax.plot(x, y, z, color="#0c6c7e", linewidth=2.0, solid_capstyle="round", zorder=3)
-
-    marker_specs = {
-        "P": "#1f7aec",
-        "Q": "#9a3412",
-        "R": "#b91c1c",
-        "S": "#0f766e",
-        "T": "#6d28d9",
-    }
-    for label, color in marker_specs.items():
-        positions = getattr(markers, label, []) or []
-        for position in positions:
-            if position >= visible_count:
-                continue
-            ax.scatter(
-                [lead_x[position]],
-                [lead_y[position]],
-                [lead_z[position]],
-                color=color,
-                s=34,
-                edgecolors="#ffffff",
-                linewidths=0.75,
-                depthshade=False,
-                zorder=4,
-            )
-            ax.text(
-                lead_x[position],
-                lead_y[position],
-                lead_z[position],
-                f" {label}",
-                color=color,
-                fontsize=9,
-            )
-
-    ax.set_xlim(y_min_mv, y_max_mv)
-    ax.set_ylim(y_min_mv, y_max_mv)
-    ax.set_zlim(y_min_mv, y_max_mv)
-    ax.set_xlabel("Lead I / CH2 (mV)", labelpad=12)
-    ax.set_ylabel("Lead III / CH4 (mV)", labelpad=12)
-    ax.set_zlabel("Lead II / CH3 (mV)", labelpad=10)
-    ax.set_box_aspect((1, 1, 1))
-    ax.view_init(elev=22, azim=-58)
-    ax.grid(True, alpha=0.25)
-    ax.set_title("3D beat morphology", pad=14)
-    tick_color = (0.28, 0.39, 0.49, 0.9)
-    for axis in (ax.xaxis, ax.yaxis, ax.zaxis):
-        axis.pane.set_facecolor((0.972, 0.984, 0.992, 0.72))
-        axis.pane.set_edgecolor((0.74, 0.82, 0.88, 0.9))
-        axis._axinfo["grid"]["color"] = (0.64, 0.73, 0.8, 0.25)
-        axis._axinfo["grid"]["linewidth"] = 0.8
-    ax.xaxis.label.set_color(tick_color)
-    ax.yaxis.label.set_color(tick_color)
-    ax.zaxis.label.set_color(tick_color)
-    ax.tick_params(colors=tick_color, labelsize=8)
-
-    buffer = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buffer, format="png", bbox_inches="tight", facecolor=fig.get_facecolor())
-    plt.close(fig)
-    return base64.b64encode(buffer.getvalue()).decode("ascii")
-
-
 def _vector3d_cache_key(
     record_id: str,
     section: str,
@@ -3461,59 +4638,48 @@ def _build_vector3d_image_for_beat(
         return cached
 
     payload = _get_vector_beat_payload(record_id, section, beat_index)
-    image_png_base64 = _render_vector3d_png(
+    if min(len(payload["lead_x"]), len(payload["lead_y"]), len(payload["lead_z"])) <= 0:
+        raise HTTPException(status_code=404, detail="No vector samples available for 3D rendering.")
+    image_png = render_png(
+        "vector3d",
         lead_x=payload["lead_x"],
         lead_y=payload["lead_y"],
         lead_z=payload["lead_z"],
-        markers=payload["markers"],
+        markers=payload["markers"].model_dump(),
         progress_percent=progress_percent,
         y_min_mv=y_min_mv,
         y_max_mv=y_max_mv,
     )
+    image_png_base64 = base64.b64encode(image_png).decode("ascii")
     VECTOR3D_IMAGE_CACHE[cache_key] = image_png_base64
     return image_png_base64
 
 
+def _finish_vector3d_preload(preload_key: tuple[str, str, float, float, int]) -> None:
+    with VECTOR3D_PRELOAD_LOCK:
+        state = VECTOR3D_PRELOAD_STATE.get(preload_key)
+        if state is not None:
+            state["running"] = False
+
+
 def _warm_vector3d_cache(
+    preload_key: tuple[str, str, float, float, int],
     record_id: str,
     section: str,
-    beat_count: int,
+    beat_order: List[int],
+    position: int,
     y_min_mv: float,
     y_max_mv: float,
     progress_percent: int,
-    start_beat_index: int,
 ) -> None:
-    preload_key = _vector3d_preload_key(
-        record_id=record_id,
-        section=section,
-        y_min_mv=y_min_mv,
-        y_max_mv=y_max_mv,
-        progress_percent=progress_percent,
-    )
     try:
-        if beat_count <= 0:
-            return
-        bounded_start = max(1, min(start_beat_index, beat_count))
-        beat_order = list(range(bounded_start, beat_count + 1)) + list(range(1, bounded_start))
-        for offset, beat_number in enumerate(beat_order, start=1):
-            _build_vector3d_image_for_beat(
-                record_id=record_id,
-                section=section,
-                beat_index=beat_number,
-                y_min_mv=y_min_mv,
-                y_max_mv=y_max_mv,
-                progress_percent=progress_percent,
-            )
-            with VECTOR3D_PRELOAD_LOCK:
-                state = VECTOR3D_PRELOAD_STATE.get(preload_key)
-                if state is not None:
-                    state["ready_count"] = max(state.get("ready_count", 0), offset)
-        logger.info(
-            "[VECTOR3D] preload_ready record_id=%s section=%s total=%s progress=%s",
-            record_id,
-            section,
-            beat_count,
-            progress_percent,
+        _build_vector3d_image_for_beat(
+            record_id=record_id,
+            section=section,
+            beat_index=beat_order[position],
+            y_min_mv=y_min_mv,
+            y_max_mv=y_max_mv,
+            progress_percent=progress_percent,
         )
     except Exception as exc:
         logger.error(
@@ -3523,11 +4689,44 @@ def _warm_vector3d_cache(
             progress_percent,
             exc,
         )
-    finally:
-        with VECTOR3D_PRELOAD_LOCK:
-            state = VECTOR3D_PRELOAD_STATE.get(preload_key)
-            if state is not None:
-                state["running"] = False
+        _finish_vector3d_preload(preload_key)
+        return
+    with VECTOR3D_PRELOAD_LOCK:
+        state = VECTOR3D_PRELOAD_STATE.get(preload_key)
+        if state is not None:
+            state["ready_count"] = max(state.get("ready_count", 0), position + 1)
+    if position + 1 >= len(beat_order):
+        logger.info(
+            "[VECTOR3D] preload_ready record_id=%s section=%s total=%s progress=%s",
+            record_id,
+            section,
+            len(beat_order),
+            progress_percent,
+        )
+        _finish_vector3d_preload(preload_key)
+        return
+    _submit_vector3d_preload_step(
+        preload_key,
+        record_id,
+        section,
+        beat_order,
+        position + 1,
+        y_min_mv,
+        y_max_mv,
+        progress_percent,
+    )
+
+
+def _submit_vector3d_preload_step(
+    preload_key: tuple[str, str, float, float, int],
+    *args: Any,
+) -> None:
+    # Each beat is its own render-pool task, so interactive renders interleave with the warm-up.
+    try:
+        submit("render", _warm_vector3d_cache, preload_key, *args)
+    except RuntimeError as exc:
+        logger.info("[VECTOR3D] preload_stopped preload_key=%s error=%s", preload_key, exc)
+        _finish_vector3d_preload(preload_key)
 
 
 def _schedule_vector3d_preload(
@@ -3539,6 +4738,8 @@ def _schedule_vector3d_preload(
     progress_percent: int,
     start_beat_index: int,
 ) -> None:
+    if beat_count <= 0:
+        return
     preload_key = _vector3d_preload_key(
         record_id=record_id,
         section=section,
@@ -3555,20 +4756,27 @@ def _schedule_vector3d_preload(
             "beat_count": beat_count,
             "ready_count": state.get("ready_count", 0) if state else 0,
         }
-    worker = threading.Thread(
-        target=_warm_vector3d_cache,
-        kwargs={
-            "record_id": record_id,
-            "section": section,
-            "beat_count": beat_count,
-            "y_min_mv": y_min_mv,
-            "y_max_mv": y_max_mv,
-            "progress_percent": progress_percent,
-            "start_beat_index": start_beat_index,
-        },
-        daemon=True,
+    bounded_start = max(1, min(start_beat_index, beat_count))
+    beat_order = list(range(bounded_start, beat_count + 1)) + list(range(1, bounded_start))
+    _submit_vector3d_preload_step(
+        preload_key,
+        record_id,
+        section,
+        beat_order,
+        0,
+        y_min_mv,
+        y_max_mv,
+        progress_percent,
     )
-    worker.start()
+
+
+async def _load_vector_beat_payload(record_id: str, section: str, beat_index: int) -> Dict[str, Any]:
+    # One metadata round trip serves all three channel loads.
+    await _fetch_processed_metadata_async(record_id)
+    await asyncio.gather(
+        *(_load_review_artifact_async(record_id, channel) for channel in CHANNEL_LABELS)
+    )
+    return await run_in_pool("cpu", _get_vector_beat_payload, record_id, section, beat_index)
 
 
 @app.get("/review/{record_id}/vector_beat", response_model=VectorBeatResponse)
@@ -3577,7 +4785,7 @@ async def review_vector_beat(
     section: str = "calibration",
     beat_index: int = 1,
 ) -> VectorBeatResponse:
-    payload = _get_vector_beat_payload(record_id, section, beat_index)
+    payload = await _load_vector_beat_payload(record_id, section, beat_index)
 
     logger.info(
         "[VECTOR] response record_id=%s section=%s beat_index=%s samples=%s excluded=%s",
@@ -3621,11 +4829,13 @@ async def review_vector3d_beat(
     y_min_mv: float = -0.3,
     y_max_mv: float = 0.6,
 ) -> Vector3DBeatResponse:
-    payload = _get_vector_beat_payload(record_id, section, beat_index)
+    payload = await _load_vector_beat_payload(record_id, section, beat_index)
     bounded_progress = max(1, min(progress_percent, 100))
     if y_max_mv <= y_min_mv:
         raise HTTPException(status_code=400, detail="y_max_mv must be greater than y_min_mv.")
-    image_png_base64 = _build_vector3d_image_for_beat(
+    image_png_base64 = await run_in_pool(
+        "render",
+        _build_vector3d_image_for_beat,
         record_id=record_id,
         section=payload["selected_section"],
         beat_index=payload["beat_index"],
@@ -3682,7 +4892,7 @@ async def review_vector3d_preload(
 ) -> Dict[str, Any]:
     if y_max_mv <= y_min_mv:
         raise HTTPException(status_code=400, detail="y_max_mv must be greater than y_min_mv.")
-    payload = _get_vector_beat_payload(record_id, section, start_beat_index)
+    payload = await _load_vector_beat_payload(record_id, section, start_beat_index)
     bounded_progress = max(1, min(progress_percent, 100))
     _schedule_vector3d_preload(
         record_id=record_id,
@@ -0,0 +1,136 @@
+import io
+import json
+import zipfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Binary artifacts are npz archives: numeric columns as .npy members plus a JSON header
+# holding everything else, with column references where the large lists used to be.
+ARTIFACT_FORMAT = "ecg-columnar"
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_HEADER_MEMBER = "header.json"
+ARTIFACT_ZIP_MAGIC = b"PK\x03\x04"
+# Shorter numeric lists stay inline in the header; a .npy member costs about 128 bytes of framing.
+ARTIFACT_MIN_COLUMN_VALUES = 32
+COLUMN_KEY = "__column__"
+RAGGED_KEY = "__ragged__"
+TABLE_KEY = "__table__"
+INT32_MIN = -(2**31)
+INT32_MAX = 2**31 - 1
+
+
+def is_binary_artifact(payload: bytes) -> bool:
+    return payload[:4] == ARTIFACT_ZIP_MAGIC
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _numeric_array(values: List[Any]) -> Optional[np.ndarray]:
+    if not all(_is_number(value) for value in values):
+        return None
+    if all(isinstance(value, int) for value in values):
+        if values and (min(values) < INT32_MIN or max(values) > INT32_MAX):
+            return np.asarray(values, dtype=np.int64)
+        return np.asarray(values, dtype=np.int32)
+    return np.asarray(values, dtype=np.float32)
+
+
+def _add_column(columns: Dict[str, np.ndarray], array: np.ndarray) -> Dict[str, str]:
+    name = str(len(columns))
+    columns[name] = array
+    return {COLUMN_KEY: name}
+
+
+def _encode_list(values: List[Any], columns: Dict[str, np.ndarray]) -> Any:
+    if len(values) >= ARTIFACT_MIN_COLUMN_VALUES:
+        array = _numeric_array(values)
+        if array is not None:
+            return _add_column(columns, array)
+    if len(values) > 1 and all(isinstance(value, dict) for value in values):
+        keys = list(values[0])
+        if all(list(value) == keys for value in values):
+            # Records sharing one key set are stored field by field, so per-beat numbers become columns.
+            return {
+                TABLE_KEY: {
+                    "length": len(values),
+                    "fields": {key: _encode_list([value[key] for value in values], columns) for key in keys},
+                }
+            }
+    if values and all(isinstance(value, list) for value in values):
+        flat = [item for value in values for item in value]
+        if len(flat) >= ARTIFACT_MIN_COLUMN_VALUES:
+            array = _numeric_array(flat)
+            if array is not None:
+                offsets = np.cumsum([0, *(len(value) for value in values)], dtype=np.int64)
+                return {
+                    RAGGED_KEY: {
+                        "values": _add_column(columns, array)[COLUMN_KEY],
+                        "offsets": _add_column(columns, offsets)[COLUMN_KEY],
+                    }
+                }
+    return [_encode_node(value, columns) for value in values]
+
+
+def _encode_node(node: Any, columns: Dict[str, np.ndarray]) -> Any:
+    if isinstance(node, dict):
+        return {key: _encode_node(value, columns) for key, value in node.items()}
+    if isinstance(node, list):
+        return _encode_list(node, columns)
+    return node
+
+
+def encode_artifact(artifact: Dict[str, Any]) -> bytes:
+    columns: Dict[str, np.ndarray] = {}
+    header = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_FORMAT_VERSION,
+        "artifact": _encode_node(artifact, columns),
+    }
+    buffer = io.BytesIO()
+    # Stored, not deflated: float columns barely compress and inflating would cost more than the bytes saved.
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr(ARTIFACT_HEADER_MEMBER, json.dumps(header, separators=(",", ":")))
+        for name, array in columns.items():
+            with archive.open(f"{name}.npy", "w") as member:
+                np.lib.format.write_array(member, array, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _decode_node(node: Any, columns: Dict[str, List[Any]]) -> Any:
+    if isinstance(node, list):
+        return [_decode_node(value, columns) for value in node]
+    if not isinstance(node, dict):
+        return node
+    if COLUMN_KEY in node:
+        return columns[node[COLUMN_KEY]]
+    if RAGGED_KEY in node:
+        values = columns[node[RAGGED_KEY]["values"]]
+        offsets = columns[node[RAGGED_KEY]["offsets"]]
+        return [values[start:end] for start, end in zip(offsets, offsets[1:])]
+    if TABLE_KEY in node:
+        length = node[TABLE_KEY]["length"]
+        fields = {key: _decode_node(value, columns) for key, value in node[TABLE_KEY]["fields"].items()}
+        return [{key: values[index] for key, values in fields.items()} for index in range(length)]
+    return {key: _decode_node(value, columns) for key, value in node.items()}
+
+
+def load_artifact_columns(payload: bytes) -> tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        header = json.loads(archive.read(ARTIFACT_HEADER_MEMBER))
+        if header.get("format") != ARTIFACT_FORMAT or header.get("version") != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format {header.get('format')!r} v{header.get('version')!r}")
+        columns = {}
+        for member in archive.namelist():
+            if member.endswith(".npy"):
+                with archive.open(member) as handle:
+                    columns[member[: -len(".npy")]] = np.lib.format.read_array(handle, allow_pickle=False)
+    return header["artifact"], columns
+
+
+def decode_artifact(payload: bytes) -> Dict[str, Any]:
+    encoded, arrays = load_artifact_columns(payload)
+    # One tolist() per column is a single C pass; the response models and slicing code work on plain lists.
+    return _decode_node(encoded, {name: array.tolist() for name, array in arrays.items()})
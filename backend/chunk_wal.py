@@ -0,0 +1,362 @@
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger("ecg-backend")
+
+CHUNK_WAL_ENABLED = (os.getenv("CHUNK_WAL_ENABLED") or "true").lower() in {"1", "true", "yes"}
+CHUNK_WAL_DIR = Path(os.getenv("CHUNK_WAL_DIR") or Path(__file__).resolve().parent / "chunk-wal")
+CHUNK_WAL_SEGMENT_BYTES = max(1, int(os.getenv("CHUNK_WAL_SEGMENT_MB") or 16)) * 1024 * 1024
+CHUNK_WAL_DRAIN_INTERVAL_S = max(0.05, float(os.getenv("CHUNK_WAL_DRAIN_INTERVAL_S") or 0.5))
+# A segment that keeps failing backs off exponentially and is moved to quarantine after this many attempts.
+CHUNK_WAL_MAX_ATTEMPTS = max(1, int(os.getenv("CHUNK_WAL_MAX_ATTEMPTS") or 10))
+CHUNK_WAL_MAX_BACKOFF_S = 60.0
+# header length, payload length, CRC32 over header and payload.
+CHUNK_WAL_RECORD_HEADER = struct.Struct("<III")
+
+ChunkStore = Callable[[Dict[str, Any], bytes], None]
+ChunkShipper = Callable[[Dict[str, Any], bytes], Optional[Future]]
+ChunkCommit = Callable[[str], None]
+
+CHUNK_WAL_LOCK = threading.Lock()
+# Held by whoever is fsyncing; appenders that arrive meanwhile are covered by the next single fsync.
+CHUNK_WAL_SYNC_LOCK = threading.Lock()
+# Serializes draining so the drainer thread and a forced drain never ship one segment twice.
+CHUNK_WAL_DRAIN_LOCK = threading.Lock()
+CHUNK_WAL_FD: Optional[int] = None
+# Held for the life of the WAL: segments are only safe to replay when one process owns the directory.
+CHUNK_WAL_DIR_LOCK_FD: Optional[int] = None
+CHUNK_WAL_SEGMENT: Optional[Path] = None
+CHUNK_WAL_SEGMENT_SIZE = 0
+CHUNK_WAL_NEXT_SEQUENCE = 0
+CHUNK_WAL_WRITTEN = 0
+CHUNK_WAL_SYNCED = 0
+CHUNK_WAL_STORE: Optional[ChunkStore] = None
+CHUNK_WAL_SHIP: Optional[ChunkShipper] = None
+# Makes everything `store` did for a record durable (its buffered chunk rows) before the WAL forgets the record.
+CHUNK_WAL_COMMIT: Optional[ChunkCommit] = None
+# Per closed segment: failed attempts, when it may be retried, and records already shipped by a scoped drain.
+CHUNK_WAL_SEGMENT_STATE: Dict[str, Dict[str, Any]] = {}
+CHUNK_WAL_STATE_LOCK = threading.Lock()
+CHUNK_WAL_STOP = threading.Event()
+CHUNK_WAL_WAKE = threading.Event()
+CHUNK_WAL_THREAD: Optional[threading.Thread] = None
+CHUNK_WAL_METRICS: Dict[str, float] = {
+    "appended": 0,
+    "appended_bytes": 0,
+    "fsyncs": 0,
+    "total_fsync_ms": 0.0,
+    "segments_shipped": 0,
+    "records_shipped": 0,
+    "segments_replayed": 0,
+    "ship_failures": 0,
+    "segments_quarantined": 0,
+    "torn_bytes_dropped": 0,
+}
+
+
+def chunk_wal_running() -> bool:
+    return CHUNK_WAL_THREAD is not None and CHUNK_WAL_THREAD.is_alive()
+
+
+def _segment_path(sequence: int) -> Path:
+    return CHUNK_WAL_DIR / f"wal-{sequence:012d}.log"
+
+
+def _quarantine_dir() -> Path:
+    return CHUNK_WAL_DIR / "quarantine"
+
+
+def _closed_segments() -> List[Path]:
+    with CHUNK_WAL_LOCK:
+        active = CHUNK_WAL_SEGMENT
+    return sorted(path for path in CHUNK_WAL_DIR.glob("wal-*.log") if path != active)
+
+
+def _lock_wal_dir() -> None:
+    global CHUNK_WAL_DIR_LOCK_FD
+    fd = os.open(CHUNK_WAL_DIR / "wal.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        raise RuntimeError(
+            f"Chunk WAL directory {CHUNK_WAL_DIR} is in use by another process. "
+            "Give each worker its own CHUNK_WAL_DIR or set CHUNK_WAL_ENABLED=false."
+        ) from None
+    CHUNK_WAL_DIR_LOCK_FD = fd
+
+
+def _unlock_wal_dir() -> None:
+    global CHUNK_WAL_DIR_LOCK_FD
+    fd, CHUNK_WAL_DIR_LOCK_FD = CHUNK_WAL_DIR_LOCK_FD, None
+    if fd is None:
+        return
+    if fcntl is None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    os.close(fd)
+
+
+def _open_segment() -> None:
+    global CHUNK_WAL_FD, CHUNK_WAL_SEGMENT, CHUNK_WAL_SEGMENT_SIZE, CHUNK_WAL_NEXT_SEQUENCE
+    while True:
+        CHUNK_WAL_SEGMENT = _segment_path(CHUNK_WAL_NEXT_SEQUENCE)
+        CHUNK_WAL_NEXT_SEQUENCE += 1
+        try:
+            # Never append to a segment this process did not create.
+            CHUNK_WAL_FD = os.open(CHUNK_WAL_SEGMENT, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND, 0o644)
+            break
+        except FileExistsError:
+            continue
+    CHUNK_WAL_SEGMENT_SIZE = 0
+
+
+def _close_segment() -> None:
+    global CHUNK_WAL_FD, CHUNK_WAL_SEGMENT, CHUNK_WAL_SYNCED
+    if CHUNK_WAL_FD is None:
+        return
+    os.fsync(CHUNK_WAL_FD)
+    os.close(CHUNK_WAL_FD)
+    CHUNK_WAL_SYNCED = max(CHUNK_WAL_SYNCED, CHUNK_WAL_WRITTEN)
+    if CHUNK_WAL_SEGMENT_SIZE == 0 and CHUNK_WAL_SEGMENT is not None:
+        CHUNK_WAL_SEGMENT.unlink(missing_ok=True)
+    CHUNK_WAL_FD = None
+    CHUNK_WAL_SEGMENT = None
+
+
+def _rotate_segment() -> None:
+    # Caller holds CHUNK_WAL_LOCK.
+    _close_segment()
+    _open_segment()
+
+
+def append_chunk(entry: Dict[str, Any], payload: bytes) -> None:
+    global CHUNK_WAL_WRITTEN, CHUNK_WAL_SEGMENT_SIZE, CHUNK_WAL_SYNCED
+    header = json.dumps(entry, separators=(",", ":")).encode("utf-8")
+    crc = zlib.crc32(payload, zlib.crc32(header))
+    record = CHUNK_WAL_RECORD_HEADER.pack(len(header), len(payload), crc) + header + payload
+    with CHUNK_WAL_LOCK:
+        if CHUNK_WAL_FD is None:
+            raise RuntimeError("Chunk WAL is not running.")
+        if CHUNK_WAL_SEGMENT_SIZE and CHUNK_WAL_SEGMENT_SIZE + len(record) > CHUNK_WAL_SEGMENT_BYTES:
+            _rotate_segment()
+        os.write(CHUNK_WAL_FD, record)
+        CHUNK_WAL_SEGMENT_SIZE += len(record)
+        CHUNK_WAL_WRITTEN += 1
+        CHUNK_WAL_METRICS["appended"] += 1
+        CHUNK_WAL_METRICS["appended_bytes"] += len(record)
+        token = CHUNK_WAL_WRITTEN
+    # Group commit: the first waiter fsyncs everything written so far; the rest find themselves covered.
+    with CHUNK_WAL_SYNC_LOCK:
+        if CHUNK_WAL_SYNCED >= token:
+            return
+        started_at = time.perf_counter()
+        with CHUNK_WAL_LOCK:
+            target = CHUNK_WAL_WRITTEN
+            os.fsync(CHUNK_WAL_FD)
+            CHUNK_WAL_SYNCED = max(CHUNK_WAL_SYNCED, target)
+            CHUNK_WAL_METRICS["fsyncs"] += 1
+            CHUNK_WAL_METRICS["total_fsync_ms"] += (time.perf_counter() - started_at) * 1000.0
+
+
+def _read_segment(path: Path) -> Iterator[Tuple[Dict[str, Any], bytes]]:
+    data = path.read_bytes()
+    offset = 0
+    while offset + CHUNK_WAL_RECORD_HEADER.size <= len(data):
+        header_length, payload_length, crc = CHUNK_WAL_RECORD_HEADER.unpack_from(data, offset)
+        start = offset + CHUNK_WAL_RECORD_HEADER.size
+        end = start + header_length + payload_length
+        if end > len(data) or zlib.crc32(data[start:end]) != crc:
+            break
+        yield json.loads(data[start : start + header_length]), data[start + header_length : end]
+        offset = end
+    if offset < len(data):
+        # A crash mid-append leaves a torn record; everything before it was acknowledged and is intact.
+        logger.warning("[WAL] torn_tail segment=%s dropped_bytes=%s", path.name, len(data) - offset)
+        CHUNK_WAL_METRICS["torn_bytes_dropped"] += len(data) - offset
+
+
+def _segment_state(path: Path) -> Dict[str, Any]:
+    # Caller holds CHUNK_WAL_STATE_LOCK.
+    return CHUNK_WAL_SEGMENT_STATE.setdefault(path.name, {"failures": 0, "retry_at": 0.0, "shipped_records": set()})
+
+
+def _ship_segment(path: Path) -> None:
+    with CHUNK_WAL_STATE_LOCK:
+        shipped_records = set(_segment_state(path)["shipped_records"])
+    records = [(entry, payload) for entry, payload in _read_segment(path) if entry.get("record_id") not in shipped_records]
+    futures = [CHUNK_WAL_SHIP(entry, payload) for entry, payload in records]
+    # Wait for every chunk before raising, so a retry never races uploads still in flight.
+    error: Optional[BaseException] = None
+    for future in futures:
+        if future is None:
+            continue
+        try:
+            future.result()
+        except Exception as exc:
+            error = error or exc
+    if error is not None:
+        raise error
+    _commit_records(entry.get("record_id") for entry, _ in records)
+    # Chunk uploads and rows are idempotent, so a segment that failed halfway is simply shipped again.
+    path.unlink()
+    with CHUNK_WAL_STATE_LOCK:
+        CHUNK_WAL_SEGMENT_STATE.pop(path.name, None)
+    CHUNK_WAL_METRICS["segments_shipped"] += 1
+    CHUNK_WAL_METRICS["records_shipped"] += len(records)
+    logger.info("[WAL] segment_shipped segment=%s records=%s", path.name, len(records))
+
+
+def _commit_records(record_ids: Iterable[Optional[str]]) -> None:
+    if CHUNK_WAL_COMMIT is None:
+        return
+    for record_id in dict.fromkeys(record_id for record_id in record_ids if record_id):
+        CHUNK_WAL_COMMIT(record_id)
+
+
+def _segment_failed(path: Path, exc: Exception) -> None:
+    CHUNK_WAL_METRICS["ship_failures"] += 1
+    with CHUNK_WAL_STATE_LOCK:
+        state = _segment_state(path)
+        state["failures"] += 1
+        failures = state["failures"]
+        state["retry_at"] = time.monotonic() + min(CHUNK_WAL_MAX_BACKOFF_S, CHUNK_WAL_DRAIN_INTERVAL_S * 2 ** (failures - 1))
+        if failures >= CHUNK_WAL_MAX_ATTEMPTS:
+            CHUNK_WAL_SEGMENT_STATE.pop(path.name, None)
+    if failures < CHUNK_WAL_MAX_ATTEMPTS:
+        logger.warning("[WAL] segment_ship_failed segment=%s attempt=%s error=%s", path.name, failures, exc)
+        return
+    # Out of the drain path so one bad segment cannot hold up the rest; move it back to the WAL directory to replay it.
+    quarantine = _quarantine_dir()
+    quarantine.mkdir(exist_ok=True)
+    path.replace(quarantine / path.name)
+    CHUNK_WAL_METRICS["segments_quarantined"] += 1
+    logger.error("[WAL] segment_quarantined segment=%s attempts=%s error=%s", path.name, failures, exc)
+
+
+def _drain_record(record_id: str) -> None:
+    for path in _closed_segments():
+        with CHUNK_WAL_STATE_LOCK:
+            if record_id in _segment_state(path)["shipped_records"]:
+                continue
+        try:
+            records = [(entry, payload) for entry, payload in _read_segment(path) if entry.get("record_id") == record_id]
+        except FileNotFoundError:
+            # The drainer shipped and removed it meanwhile.
+            continue
+        # On the calling thread, so a request never waits on a pool that may be busy with other records' chunks.
+        for entry, payload in records:
+            CHUNK_WAL_STORE(entry, payload)
+        _commit_records([record_id] if records else [])
+        with CHUNK_WAL_STATE_LOCK:
+            _segment_state(path)["shipped_records"].add(record_id)
+        CHUNK_WAL_METRICS["records_shipped"] += len(records)
+
+
+def drain_chunk_wal(record_id: Optional[str] = None) -> None:
+    if CHUNK_WAL_SHIP is None:
+        return
+    with CHUNK_WAL_LOCK:
+        if CHUNK_WAL_FD is not None and CHUNK_WAL_SEGMENT_SIZE:
+            _rotate_segment()
+    if record_id is not None:
+        # Only this record's chunks, and its failures are its own.
+        _drain_record(record_id)
+        return
+    with CHUNK_WAL_DRAIN_LOCK:
+        now = time.monotonic()
+        for path in _closed_segments():
+            with CHUNK_WAL_STATE_LOCK:
+                if _segment_state(path)["retry_at"] > now:
+                    continue
+            try:
+                _ship_segment(path)
+            except Exception as exc:
+                _segment_failed(path, exc)
+
+
+def _drain_loop() -> None:
+    while not CHUNK_WAL_STOP.is_set():
+        CHUNK_WAL_WAKE.wait(CHUNK_WAL_DRAIN_INTERVAL_S)
+        CHUNK_WAL_WAKE.clear()
+        try:
+            drain_chunk_wal()
+        except Exception as exc:
+            logger.warning("[WAL] drain_failed error=%s", exc)
+            CHUNK_WAL_STOP.wait(CHUNK_WAL_DRAIN_INTERVAL_S)
+
+
+def start_chunk_wal(
+    store: ChunkStore,
+    ship: Optional[ChunkShipper] = None,
+    commit: Optional[ChunkCommit] = None,
+) -> None:
+    # `store` lands one chunk synchronously; the drainer uses `ship` to run it on a pool, or `store` inline.
+    global CHUNK_WAL_STORE, CHUNK_WAL_SHIP, CHUNK_WAL_COMMIT, CHUNK_WAL_THREAD, CHUNK_WAL_NEXT_SEQUENCE
+    if not CHUNK_WAL_ENABLED or chunk_wal_running():
+        return
+    CHUNK_WAL_DIR.mkdir(parents=True, exist_ok=True)
+    _lock_wal_dir()
+    CHUNK_WAL_STORE = store
+    CHUNK_WAL_SHIP = ship or store
+    CHUNK_WAL_COMMIT = commit
+    with CHUNK_WAL_STATE_LOCK:
+        CHUNK_WAL_SEGMENT_STATE.clear()
+    existing = sorted(CHUNK_WAL_DIR.glob("wal-*.log"))
+    with CHUNK_WAL_LOCK:
+        CHUNK_WAL_NEXT_SEQUENCE = int(existing[-1].stem.split("-")[1]) + 1 if existing else 0
+        _open_segment()
+    if existing:
+        # Segments left by a previous process hold acknowledged chunks that never reached storage;
+        # the first drain ships them before anything new.
+        CHUNK_WAL_METRICS["segments_replayed"] += len(existing)
+        logger.info("[WAL] replay segments=%s", len(existing))
+    CHUNK_WAL_STOP.clear()
+    CHUNK_WAL_THREAD = threading.Thread(target=_drain_loop, name="ecg-chunk-wal", daemon=True)
+    CHUNK_WAL_THREAD.start()
+    CHUNK_WAL_WAKE.set()
+
+
+def stop_chunk_wal() -> None:
+    global CHUNK_WAL_THREAD, CHUNK_WAL_STORE, CHUNK_WAL_SHIP, CHUNK_WAL_COMMIT
+    thread, CHUNK_WAL_THREAD = CHUNK_WAL_THREAD, None
+    if thread is None:
+        return
+    CHUNK_WAL_STOP.set()
+    CHUNK_WAL_WAKE.set()
+    thread.join(timeout=CHUNK_WAL_DRAIN_INTERVAL_S + 30)
+    # Segments that still fail stay on disk and are replayed on the next start.
+    drain_chunk_wal()
+    with CHUNK_WAL_LOCK:
+        _close_segment()
+    _unlock_wal_dir()
+    CHUNK_WAL_STORE = None
+    CHUNK_WAL_SHIP = None
+    CHUNK_WAL_COMMIT = None
+
+
+def chunk_wal_metrics() -> Dict[str, Any]:
+    snapshot: Dict[str, Any] = {
+        key: round(value, 3) if isinstance(value, float) else value for key, value in CHUNK_WAL_METRICS.items()
+    }
+    snapshot["running"] = chunk_wal_running()
+    snapshot["pending_segments"] = len(list(CHUNK_WAL_DIR.glob("wal-*.log"))) if CHUNK_WAL_DIR.is_dir() else 0
+    snapshot["quarantined_segments"] = len(list(_quarantine_dir().glob("wal-*.log"))) if _quarantine_dir().is_dir() else 0
+    snapshot["records_per_fsync"] = round(snapshot["appended"] / snapshot["fsyncs"], 2) if snapshot["fsyncs"] else 0.0
+    return snapshot
@@ -0,0 +1,204 @@
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger("ecg-backend")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name) or default))
+    except ValueError:
+        return default
+
+
+# Render threads only prepare specs and wait on render_service worker processes.
+# Workers may block on io (and jobs, compaction and render workers on upload), but io workers never block on
+# another pool, so the pools cannot end up waiting on each other.
+EXECUTOR_POOL_SIZES: Dict[str, int] = {
+    "io": _env_int("EXECUTOR_IO_WORKERS", 16),
+    "cpu": _env_int("EXECUTOR_CPU_WORKERS", os.cpu_count() or 2),
+    "render": _env_int("EXECUTOR_RENDER_WORKERS", 4),
+    "jobs": _env_int("EXECUTOR_JOB_WORKERS", 2),
+    "upload": _env_int("EXECUTOR_UPLOAD_WORKERS", 8),
+    "compaction": _env_int("EXECUTOR_COMPACTION_WORKERS", 2),
+}
+EXECUTOR_POOLS: Dict[str, ThreadPoolExecutor] = {}
+EXECUTOR_METRICS: Dict[str, Dict[str, float]] = {}
+EXECUTOR_LOCK = threading.Lock()
+EXECUTOR_THREAD = threading.local()
+# PROCESS_WORKERS=0 keeps channel builds and window processing on the calling thread.
+try:
+    PROCESS_WORKERS = max(0, int(os.getenv("PROCESS_WORKERS") or min(3, os.cpu_count() or 1)))
+except ValueError:
+    PROCESS_WORKERS = 0
+PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+PROCESS_PRELOAD_MODULES: tuple[str, ...] = ()
+
+
+def _empty_metrics(workers: int) -> Dict[str, float]:
+    return {
+        "workers": workers,
+        "submitted": 0,
+        "active": 0,
+        "completed": 0,
+        "failed": 0,
+        "total_wait_ms": 0.0,
+        "total_run_ms": 0.0,
+        "max_run_ms": 0.0,
+    }
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    with EXECUTOR_LOCK:
+        executor = EXECUTOR_POOLS.get(name)
+        if executor is None:
+            if name not in EXECUTOR_POOL_SIZES:
+                raise KeyError(f"Unknown executor pool: {name}")
+            workers = EXECUTOR_POOL_SIZES[name]
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"ecg-{name}")
+            EXECUTOR_POOLS[name] = executor
+            EXECUTOR_METRICS.setdefault(name, _empty_metrics(workers))
+        return executor
+
+
+def submit(name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    executor = get_executor(name)
+    submitted_at = time.perf_counter()
+    with EXECUTOR_LOCK:
+        EXECUTOR_METRICS[name]["submitted"] += 1
+
+    def run() -> Any:
+        started_at = time.perf_counter()
+        with EXECUTOR_LOCK:
+            metrics = EXECUTOR_METRICS[name]
+            metrics["active"] += 1
+            metrics["total_wait_ms"] += (started_at - submitted_at) * 1000.0
+        failed = False
+        EXECUTOR_THREAD.pool = name
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            EXECUTOR_THREAD.pool = None
+            run_ms = (time.perf_counter() - started_at) * 1000.0
+            with EXECUTOR_LOCK:
+                metrics = EXECUTOR_METRICS[name]
+                metrics["active"] -= 1
+                metrics["failed" if failed else "completed"] += 1
+                metrics["total_run_ms"] += run_ms
+                metrics["max_run_ms"] = max(metrics["max_run_ms"], run_ms)
+
+    return executor.submit(run)
+
+
+def current_pool() -> Optional[str]:
+    return getattr(EXECUTOR_THREAD, "pool", None)
+
+
+async def run_in_pool(name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await asyncio.wrap_future(submit(name, fn, *args, **kwargs))
+
+
+def process_pool_enabled() -> bool:
+    return PROCESS_WORKERS > 0
+
+
+def _init_process_worker(preload_modules: Sequence[str]) -> None:
+    for module_name in preload_modules:
+        importlib.import_module(module_name)
+
+
+def _get_process_executor() -> ProcessPoolExecutor:
+    global PROCESS_POOL
+    with EXECUTOR_LOCK:
+        if PROCESS_POOL is None:
+            PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=(PROCESS_PRELOAD_MODULES,),
+            )
+            EXECUTOR_METRICS.setdefault("process", _empty_metrics(PROCESS_WORKERS))
+        return PROCESS_POOL
+
+
+def _reset_process_executor(broken: ProcessPoolExecutor) -> None:
+    global PROCESS_POOL
+    with EXECUTOR_LOCK:
+        if PROCESS_POOL is broken:
+            PROCESS_POOL = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def start_process_pool(preload_modules: Sequence[str] = ()) -> None:
+    global PROCESS_PRELOAD_MODULES
+    if not process_pool_enabled():
+        return
+    PROCESS_PRELOAD_MODULES = tuple(preload_modules)
+    executor = _get_process_executor()
+    # Workers spawn on demand; nudge them all up so imports happen before the first job.
+    for _ in range(PROCESS_WORKERS):
+        executor.submit(os.getpid)
+
+
+def submit_process(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    # Process tasks cannot be wrapped in a closure, so run time here is submit-to-done turnaround.
+    executor = _get_process_executor()
+    try:
+        future = executor.submit(fn, *args, **kwargs)
+    except BrokenProcessPool:
+        logger.warning("[EXECUTOR] process_pool_broken restarting")
+        _reset_process_executor(executor)
+        future = _get_process_executor().submit(fn, *args, **kwargs)
+    submitted_at = time.perf_counter()
+    with EXECUTOR_LOCK:
+        EXECUTOR_METRICS["process"]["submitted"] += 1
+
+    def record(done: Future) -> None:
+        run_ms = (time.perf_counter() - submitted_at) * 1000.0
+        failed = done.cancelled() or done.exception() is not None
+        with EXECUTOR_LOCK:
+            metrics = EXECUTOR_METRICS["process"]
+            metrics["failed" if failed else "completed"] += 1
+            metrics["total_run_ms"] += run_ms
+            metrics["max_run_ms"] = max(metrics["max_run_ms"], run_ms)
+
+    future.add_done_callback(record)
+    return future
+
+
+def executor_metrics() -> Dict[str, Dict[str, float]]:
+    with EXECUTOR_LOCK:
+        snapshot: Dict[str, Dict[str, float]] = {}
+        for name, metrics in EXECUTOR_METRICS.items():
+            finished = metrics["completed"] + metrics["failed"]
+            snapshot[name] = {
+                **{key: round(value, 3) if isinstance(value, float) else value for key, value in metrics.items()},
+                "queued": metrics["submitted"] - finished - metrics["active"],
+                "mean_wait_ms": round(metrics["total_wait_ms"] / metrics["submitted"], 3) if metrics["submitted"] else 0.0,
+                "mean_run_ms": round(metrics["total_run_ms"] / finished, 3) if finished else 0.0,
+            }
+        return snapshot
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    global PROCESS_POOL
+    with EXECUTOR_LOCK:
+        pools: list[tuple[str, Any]] = list(EXECUTOR_POOLS.items())
+        EXECUTOR_POOLS.clear()
+        if PROCESS_POOL is not None:
+            pools.append(("process", PROCESS_POOL))
+            PROCESS_POOL = None
+    for name, executor in pools:
+        logger.info("[EXECUTOR] shutdown pool=%s wait=%s", name, wait)
+        executor.shutdown(wait=wait, cancel_futures=not wait)
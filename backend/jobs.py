@@ -0,0 +1,184 @@
+import json
+import logging
+import threading
+from queue import Full, Queue
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+logger = logging.getLogger("ecg-backend")
+
+ANALYSIS_JOBS: Dict[str, Dict[str, Any]] = {}
+ACTIVE_JOB_KEYS: Dict[Tuple[Any, ...], str] = {}
+ANALYSIS_JOBS_LOCK = threading.RLock()
+TERMINAL_JOB_STATUSES = {"ready", "error", "cancelled", "superseded"}
+JOB_EVENT_SUBSCRIBERS: Dict[str, List[Queue[str]]] = {}
+JOB_EVENT_SUBSCRIBERS_LOCK = threading.Lock()
+JOB_EVENT_QUEUE_SIZE = 32
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def job_key(job_type: str, record_id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+    return (job_type, record_id, tuple(sorted((params or {}).items())))
+
+
+def job_is_terminal(job: Optional[Dict[str, Any]]) -> bool:
+    return bool(job) and job.get("status") in TERMINAL_JOB_STATUSES
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    with ANALYSIS_JOBS_LOCK:
+        job = ANALYSIS_JOBS.get(job_id)
+        return dict(job) if job is not None else None
+
+
+def job_event(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "job_id": job_id,
+        "job_type": job.get("job_type"),
+        "status": job.get("status", "unknown"),
+        "record_id": job.get("record_id", ""),
+        "details": job.get("details"),
+        "error": job.get("error"),
+        "superseded_by": job.get("superseded_by"),
+    }
+
+
+def subscribe_job_events(job_id: str) -> Queue[str]:
+    subscriber: Queue[str] = Queue(maxsize=JOB_EVENT_QUEUE_SIZE)
+    with JOB_EVENT_SUBSCRIBERS_LOCK:
+        JOB_EVENT_SUBSCRIBERS.setdefault(job_id, []).append(subscriber)
+    return subscriber
+
+
+def unsubscribe_job_events(job_id: str, subscriber: Queue[str]) -> None:
+    with JOB_EVENT_SUBSCRIBERS_LOCK:
+        subscribers = JOB_EVENT_SUBSCRIBERS.get(job_id)
+        if subscribers and subscriber in subscribers:
+            subscribers.remove(subscriber)
+        if not subscribers:
+            JOB_EVENT_SUBSCRIBERS.pop(job_id, None)
+
+
+def _publish_job_event(job_id: str, event: Dict[str, Any]) -> None:
+    with JOB_EVENT_SUBSCRIBERS_LOCK:
+        subscribers = list(JOB_EVENT_SUBSCRIBERS.get(job_id) or [])
+    if not subscribers:
+        return
+    payload = json.dumps(event, default=str)
+    for subscriber in subscribers:
+        try:
+            subscriber.put_nowait(payload)
+        except Full:
+            try:
+                subscriber.get_nowait()
+            except Exception:
+                pass
+            try:
+                subscriber.put_nowait(payload)
+            except Full:
+                pass
+
+
+def set_job(job_id: str, **fields: Any) -> None:
+    with ANALYSIS_JOBS_LOCK:
+        job = ANALYSIS_JOBS.get(job_id, {})
+        if job.get("cancel_requested") and fields.get("status") not in TERMINAL_JOB_STATUSES:
+            # A superseded job keeps its terminal status while the worker winds down.
+            fields.pop("status", None)
+        job.update(fields)
+        ANALYSIS_JOBS[job_id] = job
+        event = job_event(job_id, job)
+    _publish_job_event(job_id, event)
+
+
+def update_job_details(job_id: Optional[str], **details: Any) -> None:
+    if not job_id:
+        return
+    with ANALYSIS_JOBS_LOCK:
+        current = ANALYSIS_JOBS.get(job_id, {}).get("details")
+        merged = {**current, **details} if isinstance(current, dict) else dict(details)
+    set_job(job_id, details=merged)
+
+
+def claim_job(
+    job_type: str,
+    record_id: str,
+    params: Optional[Dict[str, Any]] = None,
+    *,
+    force: bool = False,
+) -> Tuple[str, bool, Optional[str]]:
+    key = job_key(job_type, record_id, params)
+    with ANALYSIS_JOBS_LOCK:
+        existing_id = ACTIVE_JOB_KEYS.get(key)
+        existing = ANALYSIS_JOBS.get(existing_id) if existing_id else None
+        superseded_job_id: Optional[str] = None
+        if existing is not None and not job_is_terminal(existing):
+            if not force:
+                existing["coalesced_requests"] = int(existing.get("coalesced_requests") or 0) + 1
+                logger.info(
+                    "[JOB] coalesced job_type=%s record_id=%s job_id=%s requests=%s",
+                    job_type,
+                    record_id,
+                    existing_id,
+                    existing["coalesced_requests"],
+                )
+                return existing_id, False, None
+            superseded_job_id = existing_id
+        job_id = uuid4().hex
+        if superseded_job_id:
+            set_job(
+                superseded_job_id,
+                status="superseded",
+                cancel_requested=True,
+                superseded_by=job_id,
+            )
+            logger.info(
+                "[JOB] superseded job_type=%s record_id=%s job_id=%s superseded_by=%s",
+                job_type,
+                record_id,
+                superseded_job_id,
+                job_id,
+            )
+        ANALYSIS_JOBS[job_id] = {
+            "status": "queued",
+            "record_id": record_id,
+            "job_type": job_type,
+            "job_key": key,
+            "params": dict(params or {}),
+            "coalesced_requests": 0,
+        }
+        ACTIVE_JOB_KEYS[key] = job_id
+        return job_id, True, superseded_job_id
+
+
+def active_job_id(job_type: str, record_id: str) -> Optional[str]:
+    # Any unfinished job of this type for the record, whatever its params.
+    with ANALYSIS_JOBS_LOCK:
+        for key, job_id in ACTIVE_JOB_KEYS.items():
+            if key[:2] == (job_type, record_id) and not job_is_terminal(ANALYSIS_JOBS.get(job_id)):
+                return job_id
+    return None
+
+
+def release_job(job_id: str) -> None:
+    with ANALYSIS_JOBS_LOCK:
+        job = ANALYSIS_JOBS.get(job_id)
+        key = job.get("job_key") if job else None
+        if key is not None and ACTIVE_JOB_KEYS.get(key) == job_id:
+            ACTIVE_JOB_KEYS.pop(key, None)
+
+
+def job_cancel_requested(job_id: Optional[str]) -> bool:
+    if not job_id:
+        return False
+    with ANALYSIS_JOBS_LOCK:
+        job = ANALYSIS_JOBS.get(job_id)
+        return bool(job and job.get("cancel_requested"))
+
+
+def raise_if_job_cancelled(job_id: Optional[str]) -> None:
+    if job_cancel_requested(job_id):
+        raise JobCancelled(job_id)
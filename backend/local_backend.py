@@ -0,0 +1,413 @@
+import asyncio
+import json
+import mmap
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+from zoneinfo import ZoneInfo
+
+import httpx
+
+LOCAL_BACKEND_DIR = Path(os.getenv("LOCAL_BACKEND_DIR") or Path(__file__).resolve().parent / "local-data")
+LOCAL_BACKEND_URL = "http://local-backend"
+
+# Mirrors the tables in ../schema.sql. Keep the two in step when columns change.
+LOCAL_SCHEMA = """
+create table if not exists ecg_recordings (
+  id text primary key,
+  user_id text,
+  bucket text,
+  session_object_key text,
+  calibration_object_key text,
+  encoding text,
+  sample_rate_hz integer,
+  channels integer,
+  sample_count integer,
+  duration_ms integer,
+  elapsed_time_ms integer,
+  effective_sps real,
+  byte_length integer,
+  status text,
+  start_time text,
+  notes text,
+  created_at text not null
+);
+create index if not exists idx_ecg_recordings_created_at on ecg_recordings (created_at desc);
+create index if not exists idx_ecg_recordings_user_id on ecg_recordings (user_id);
+
+create table if not exists ecg_session_chunks (
+  record_id text not null references ecg_recordings(id) on delete cascade,
+  chunk_index integer not null,
+  object_key text not null,
+  byte_offset integer,
+  byte_length integer,
+  packet_count integer,
+  sample_count integer,
+  elapsed_time_ms integer,
+  created_at text not null,
+  primary key (record_id, chunk_index)
+);
+
+create table if not exists ecg_live_preview (
+  record_id text primary key references ecg_recordings(id) on delete cascade,
+  ch2_preview text not null default '[]',
+  ch3_preview text not null default '[]',
+  ch4_preview text not null default '[]',
+  sample_count integer not null default 0,
+  elapsed_time_ms integer not null default 0,
+  updated_at text not null
+);
+create index if not exists idx_ecg_live_preview_updated_at on ecg_live_preview (updated_at desc);
+
+create table if not exists ecg_processed_records (
+  record_id text primary key references ecg_recordings(id) on delete cascade,
+  status text not null,
+  processing_version text not null,
+  updated_at text not null,
+  error_message text
+);
+
+create table if not exists ecg_processed_artifacts (
+  record_id text not null references ecg_recordings(id) on delete cascade,
+  artifact_type text not null,
+  object_key text not null,
+  processing_version text not null,
+  updated_at text not null,
+  primary key (record_id, artifact_type)
+);
+create index if not exists idx_ecg_processed_artifacts_object_key on ecg_processed_artifacts (object_key);
+"""
+# jsonb columns are stored as text and decoded on the way out.
+LOCAL_JSON_COLUMNS = {
+    "ecg_recordings": {"notes"},
+    "ecg_live_preview": {"ch2_preview", "ch3_preview", "ch4_preview"},
+}
+# Columns PostgreSQL fills from defaults that SQLite cannot express.
+LOCAL_GENERATED_COLUMNS = {
+    "ecg_recordings": {"id": "uuid", "created_at": "now"},
+    "ecg_session_chunks": {"created_at": "now"},
+    "ecg_live_preview": {"updated_at": "now"},
+    "ecg_processed_records": {"updated_at": "now"},
+    "ecg_processed_artifacts": {"updated_at": "now"},
+}
+# Child tables reference ecg_recordings(id) through record_id; those keyed by record_id embed as one object.
+LOCAL_EMBED_PARENT = {"ecg_recordings": "id"}
+LOCAL_FILTER_OPERATORS = {"eq": "=", "neq": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+SG_TIMEZONE = ZoneInfo("Asia/Singapore")
+
+
+class LocalBackendError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _split_top_level(value: str) -> List[str]:
+    parts: List[str] = []
+    depth = 0
+    current = ""
+    for char in value:
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current:
+        parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+
+# Serves the subset of the Supabase REST and Storage APIs that supabase.py uses, so every helper
+# runs unchanged against SQLite and the local filesystem.
+class LocalBackendTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    def __init__(self, root: Path = LOCAL_BACKEND_DIR):
+        self.root = Path(root)
+        self.objects_root = self.root / "objects"
+        self.objects_root.mkdir(parents=True, exist_ok=True)
+        self.database_path = self.root / "ecg.sqlite3"
+        self._local = threading.local()
+        self._columns: Dict[str, List[str]] = {}
+        self._primary_keys: Dict[str, List[str]] = {}
+        with closing(self._connect()) as connection:
+            connection.executescript(LOCAL_SCHEMA)
+            for (table,) in connection.execute("select name from sqlite_master where type = 'table'"):
+                info = connection.execute(f"pragma table_info({table})").fetchall()
+                self._columns[table] = [row[1] for row in info]
+                self._primary_keys[table] = [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+        connection.execute("pragma journal_mode = wal")
+        connection.execute("pragma foreign_keys = on")
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; WAL lets readers run alongside the single writer.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        return self._dispatch(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return await asyncio.to_thread(self._dispatch, request)
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        path = unquote(request.url.path)
+        try:
+            if path.startswith("/storage/v1/object/"):
+                return self._storage(request, path[len("/storage/v1/object/") :])
+            if path.startswith("/rest/v1/"):
+                return self._rest(request, path[len("/rest/v1/") :])
+            raise LocalBackendError(404, f"Unknown path {path}")
+        except LocalBackendError as exc:
+            return httpx.Response(exc.status_code, json={"message": str(exc)}, request=request)
+        except sqlite3.IntegrityError as exc:
+            return httpx.Response(409, json={"message": str(exc)}, request=request)
+
+    # Storage -----------------------------------------------------------------
+
+    def _object_path(self, bucket_and_key: str) -> Path:
+        parts = [part for part in bucket_and_key.split("/") if part]
+        if len(parts) < 2 or any(part in {".", ".."} for part in parts):
+            raise LocalBackendError(400, f"Invalid object path {bucket_and_key}")
+        return self.objects_root.joinpath(*parts)
+
+    def _storage(self, request: httpx.Request, bucket_and_key: str) -> httpx.Response:
+        if request.method == "DELETE":
+            return self._delete_objects(request, bucket_and_key.strip("/"))
+        object_path = self._object_path(bucket_and_key)
+        if request.method == "POST":
+            if object_path.exists() and request.headers.get("x-upsert") != "true":
+                raise LocalBackendError(409, "The resource already exists")
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = object_path.with_name(f"{object_path.name}.{uuid.uuid4().hex}.tmp")
+            temp_path.write_bytes(request.content)
+            os.replace(temp_path, object_path)
+            return httpx.Response(200, json={"Key": bucket_and_key}, request=request)
+        if request.method not in {"GET", "HEAD"}:
+            raise LocalBackendError(405, f"Unsupported storage method {request.method}")
+        try:
+            stat = object_path.stat()
+        except FileNotFoundError:
+            raise LocalBackendError(404, "Object not found") from None
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers=headers, request=request)
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={**headers, "Content-Length": str(stat.st_size)}, request=request)
+        start, end = 0, stat.st_size
+        status_code = 200
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("range") or "")
+        if match:
+            start = int(match.group(1))
+            end = min(stat.st_size, int(match.group(2)) + 1) if match.group(2) else stat.st_size
+            if start >= stat.st_size:
+                return httpx.Response(416, headers={"Content-Range": f"bytes */{stat.st_size}"}, request=request)
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{stat.st_size}"
+        return httpx.Response(status_code, headers=headers, content=self._read_object(object_path, start, end), request=request)
+
+    def _delete_objects(self, request: httpx.Request, bucket: str) -> httpx.Response:
+        # Bulk delete takes the keys in the body, like Supabase; missing keys are skipped.
+        deleted = []
+        for object_key in json.loads(request.content or b"{}").get("prefixes") or []:
+            object_path = self._object_path(f"{bucket}/{object_key}")
+            if object_path.is_file():
+                object_path.unlink()
+                deleted.append({"name": object_key, "bucket_id": bucket})
+        return httpx.Response(200, json=deleted, request=request)
+
+    def _read_object(self, object_path: Path, start: int, end: int) -> bytes:
+        if end <= start:
+            return b""
+        # mmap serves ranges straight from the page cache without reading the whole file.
+        with open(object_path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[start:end]
+
+    # REST --------------------------------------------------------------------
+
+    def _table(self, table: str) -> List[str]:
+        columns = self._columns.get(table)
+        if columns is None:
+            raise LocalBackendError(404, f"relation {table} does not exist")
+        return columns
+
+    def _column(self, table: str, column: str) -> str:
+        if column not in self._table(table):
+            raise LocalBackendError(400, f"column {table}.{column} does not exist")
+        return column
+
+    def _condition(self, table: str, column: str, expression: str) -> Tuple[str, List[Any]]:
+        column = self._column(table, column)
+        negate = expression.startswith("not.")
+        if negate:
+            expression = expression[len("not.") :]
+        operator, _, value = expression.partition(".")
+        if operator == "is" and value == "null":
+            clause, params = f"{column} is null", []
+        elif operator == "in":
+            values = _split_top_level(value.strip("()"))
+            clause, params = f"{column} in ({','.join('?' for _ in values)})", values
+        elif operator in LOCAL_FILTER_OPERATORS:
+            clause, params = f"{column} {LOCAL_FILTER_OPERATORS[operator]} ?", [value]
+        else:
+            raise LocalBackendError(400, f"Unsupported filter operator {operator}")
+        return (f"not ({clause})" if negate else clause), params
+
+    def _where(self, table: str, params: httpx.QueryParams) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        values: List[Any] = []
+        for key, expression in params.multi_items():
+            if key in {"select", "order", "limit", "offset", "on_conflict"}:
+                continue
+            if key == "or":
+                alternatives = []
+                for term in _split_top_level(expression.strip("()")):
+                    column, _, condition = term.partition(".")
+                    clause, clause_values = self._condition(table, column, condition)
+                    alternatives.append(clause)
+                    values.extend(clause_values)
+                clauses.append(f"({' or '.join(alternatives)})")
+                continue
+            clause, clause_values = self._condition(table, key, expression)
+            clauses.append(clause)
+            values.extend(clause_values)
+        return (f" where {' and '.join(clauses)}" if clauses else ""), values
+
+    def _decode_row(self, table: str, row: sqlite3.Row, columns: List[str]) -> Dict[str, Any]:
+        json_columns = LOCAL_JSON_COLUMNS.get(table, set())
+        decoded: Dict[str, Any] = {}
+        for column in columns:
+            value = row[column]
+            decoded[column] = json.loads(value) if column in json_columns and value is not None else value
+        return decoded
+
+    def _select(self, table: str, params: httpx.QueryParams) -> List[Dict[str, Any]]:
+        columns: List[str] = []
+        embeds: List[Tuple[str, str]] = []
+        for item in _split_top_level(params.get("select") or "*"):
+            embed = re.fullmatch(r"(\w+)\((.*)\)", item)
+            if embed:
+                embeds.append((embed.group(1), embed.group(2)))
+            elif item == "*":
+                columns.extend(self._table(table))
+            else:
+                columns.append(self._column(table, item))
+        where, values = self._where(table, params)
+        order = ""
+        if params.get("order"):
+            terms = []
+            for term in params["order"].split(","):
+                column, _, direction = term.partition(".")
+                terms.append(f"{self._column(table, column)} {'desc' if direction.startswith('desc') else 'asc'}")
+            order = f" order by {', '.join(terms)}"
+        limit = f" limit {int(params['limit'])}" if params.get("limit") else ""
+        offset = f" offset {int(params['offset'])}" if params.get("offset") else ""
+        parent_key = LOCAL_EMBED_PARENT.get(table)
+        query_columns = list(dict.fromkeys(columns + ([parent_key] if embeds and parent_key else [])))
+        rows = self._connection().execute(
+            f"select {', '.join(query_columns) or 'null'} from {table}{where}{order}{limit}{offset}",
+            values,
+        ).fetchall()
+        results = [self._decode_row(table, row, columns) for row in rows]
+        for embed_table, embed_select in embeds:
+            if parent_key is None or "record_id" not in self._table(embed_table):
+                raise LocalBackendError(400, f"Could not find a relationship between {table} and {embed_table}")
+            one_to_one = self._primary_keys.get(embed_table) == ["record_id"]
+            for result, row in zip(results, rows):
+                children = self._select(
+                    embed_table,
+                    httpx.QueryParams({"select": embed_select, "record_id": f"eq.{row[parent_key]}"}),
+                )
+                result[embed_table] = (children[0] if children else None) if one_to_one else children
+        return results
+
+    def _prepare_row(self, table: str, row: Dict[str, Any], fill_defaults: bool) -> Dict[str, Any]:
+        json_columns = LOCAL_JSON_COLUMNS.get(table, set())
+        prepared = {
+            self._column(table, column): json.dumps(value) if column in json_columns and value is not None else value
+            for column, value in row.items()
+        }
+        if fill_defaults:
+            for column, kind in LOCAL_GENERATED_COLUMNS.get(table, {}).items():
+                if prepared.get(column) is None:
+                    prepared[column] = str(uuid.uuid4()) if kind == "uuid" else datetime.now(SG_TIMEZONE).isoformat()
+        return prepared
+
+    def _returning(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        keys = self._primary_keys[table]
+        returned = []
+        for row in rows:
+            where = " and ".join(f"{key} = ?" for key in keys)
+            found = self._connection().execute(f"select * from {table} where {where}", [row[key] for key in keys]).fetchone()
+            if found is not None:
+                returned.append(self._decode_row(table, found, self._table(table)))
+        return returned
+
+    def _rest(self, request: httpx.Request, table: str) -> httpx.Response:
+        self._table(table)
+        params = request.url.params
+        prefer = request.headers.get("prefer") or ""
+        if request.method == "GET":
+            return httpx.Response(200, json=self._select(table, params), request=request)
+        body = json.loads(request.content or b"null")
+        connection = self._connection()
+        if request.method == "POST":
+            rows = [self._prepare_row(table, row, fill_defaults=True) for row in (body if isinstance(body, list) else [body])]
+            conflict = [self._column(table, column) for column in (params.get("on_conflict") or "").split(",") if column]
+            connection.execute("begin immediate")
+            try:
+                for row in rows:
+                    columns = list(row)
+                    statement = f"insert into {table} ({', '.join(columns)}) values ({', '.join('?' for _ in columns)})"
+                    if conflict:
+                        updates = [column for column in columns if column not in conflict]
+                        action = f"update set {', '.join(f'{column} = excluded.{column}' for column in updates)}" if updates else "nothing"
+                        statement += f" on conflict ({', '.join(conflict)}) do {action}"
+                    connection.execute(statement, [row[column] for column in columns])
+                connection.execute("commit")
+            except Exception:
+                connection.execute("rollback")
+                raise
+            payload = self._returning(table, rows) if "return=representation" in prefer else None
+            return httpx.Response(201, json=payload, request=request) if payload is not None else httpx.Response(201, request=request)
+        if request.method == "PATCH":
+            updates = self._prepare_row(table, body or {}, fill_defaults=False)
+            where, values = self._where(table, params)
+            if not updates:
+                return httpx.Response(204, request=request)
+            connection.execute(
+                f"update {table} set {', '.join(f'{column} = ?' for column in updates)}{where}",
+                [*updates.values(), *values],
+            )
+            return httpx.Response(204, request=request)
+        raise LocalBackendError(405, f"Unsupported method {request.method}")
+
+
+LOCAL_BACKEND_TRANSPORT: Optional[LocalBackendTransport] = None
+LOCAL_BACKEND_LOCK = threading.Lock()
+
+
+def get_local_backend_transport() -> LocalBackendTransport:
+    global LOCAL_BACKEND_TRANSPORT
+    with LOCAL_BACKEND_LOCK:
+        if LOCAL_BACKEND_TRANSPORT is None:
+            LOCAL_BACKEND_TRANSPORT = LocalBackendTransport()
+        return LOCAL_BACKEND_TRANSPORT
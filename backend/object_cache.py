@@ -0,0 +1,239 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+logger = logging.getLogger("ecg-backend")
+
+OBJECT_CACHE_MEMORY_BYTES = max(0, int(os.getenv("OBJECT_CACHE_MEMORY_MB") or 256)) * 1024 * 1024
+OBJECT_CACHE_DISK_BYTES = max(0, int(os.getenv("OBJECT_CACHE_DISK_MB") or 2048)) * 1024 * 1024
+OBJECT_CACHE_DIR = Path(os.getenv("OBJECT_CACHE_DIR") or Path(tempfile.gettempdir()) / "ecg-object-cache")
+# Entries checked against storage this recently are served without a conditional request. Other processes
+# (reprocess.py, other workers) replace objects too, so by default every hit is revalidated with its ETag.
+OBJECT_CACHE_REVALIDATE_S = max(0.0, float(os.getenv("OBJECT_CACHE_REVALIDATE_S") or 0))
+# Uploads under these prefixes are read back soon after (artifacts, review images and manifests); other uploads,
+# like live chunks and session binaries, are rarely read whole and only drop any cached copy.
+OBJECT_CACHE_WRITE_THROUGH_PREFIXES = tuple(
+    prefix.strip()
+    for prefix in (os.getenv("OBJECT_CACHE_WRITE_THROUGH_PREFIXES") or "processed/,review-static/").split(",")
+    if prefix.strip()
+)
+# Large objects (full sessions) would flush the memory tier; they only go to disk.
+OBJECT_CACHE_MEMORY_MAX_ITEM_BYTES = OBJECT_CACHE_MEMORY_BYTES // 8
+
+
+class CachedObject(NamedTuple):
+    payload: bytes
+    etag: Optional[str]
+    validated_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() - self.validated_at < OBJECT_CACHE_REVALIDATE_S
+
+
+class DiskEntry(NamedTuple):
+    etag: Optional[str]
+    length: int
+
+
+MEMORY_CACHE: "OrderedDict[str, CachedObject]" = OrderedDict()
+MEMORY_CACHE_BYTES = 0
+# Disk index in least-recently-used order; rebuilt from the cache directory on first use.
+DISK_INDEX: "OrderedDict[str, DiskEntry]" = OrderedDict()
+DISK_INDEX_BYTES = 0
+DISK_INDEX_LOADED = False
+OBJECT_CACHE_LOCK = threading.RLock()
+OBJECT_CACHE_METRICS: Dict[str, int] = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "revalidated": 0,
+    "misses": 0,
+    "stores": 0,
+    "evictions": 0,
+}
+
+
+def content_etag(payload: bytes) -> str:
+    # Storage reports the MD5 of a single-request upload as its ETag; if it does not, the next read is a plain GET.
+    return f'"{hashlib.md5(payload, usedforsecurity=False).hexdigest()}"'
+
+
+def _disk_path(object_key: str) -> Path:
+    return OBJECT_CACHE_DIR / hashlib.sha256(object_key.encode("utf-8")).hexdigest()
+
+
+def _load_disk_index() -> None:
+    global DISK_INDEX_BYTES, DISK_INDEX_LOADED
+    DISK_INDEX_LOADED = True
+    if not OBJECT_CACHE_DISK_BYTES or not OBJECT_CACHE_DIR.is_dir():
+        return
+    found = []
+    for meta_path in OBJECT_CACHE_DIR.glob("*.json"):
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            data_path = meta_path.with_suffix("")
+            stat = data_path.stat()
+        except (OSError, ValueError):
+            continue
+        if stat.st_size != meta.get("length"):
+            continue
+        found.append((stat.st_mtime, meta["object_key"], DiskEntry(meta.get("etag"), stat.st_size)))
+    for _, object_key, entry in sorted(found):
+        DISK_INDEX[object_key] = entry
+        DISK_INDEX_BYTES += entry.length
+    logger.info("[CACHE] disk_index_loaded dir=%s objects=%s bytes=%s", OBJECT_CACHE_DIR, len(DISK_INDEX), DISK_INDEX_BYTES)
+
+
+def _remember(object_key: str, cached: CachedObject) -> None:
+    global MEMORY_CACHE_BYTES
+    previous = MEMORY_CACHE.pop(object_key, None)
+    if previous is not None:
+        MEMORY_CACHE_BYTES -= len(previous.payload)
+    if len(cached.payload) > OBJECT_CACHE_MEMORY_MAX_ITEM_BYTES:
+        return
+    MEMORY_CACHE[object_key] = cached
+    MEMORY_CACHE_BYTES += len(cached.payload)
+    while MEMORY_CACHE_BYTES > OBJECT_CACHE_MEMORY_BYTES and MEMORY_CACHE:
+        _, evicted = MEMORY_CACHE.popitem(last=False)
+        MEMORY_CACHE_BYTES -= len(evicted.payload)
+        OBJECT_CACHE_METRICS["evictions"] += 1
+
+
+def _drop_disk_entry(object_key: str) -> None:
+    global DISK_INDEX_BYTES
+    entry = DISK_INDEX.pop(object_key, None)
+    if entry is None:
+        return
+    DISK_INDEX_BYTES -= entry.length
+    data_path = _disk_path(object_key)
+    for path in (data_path, data_path.with_suffix(".json")):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("[CACHE] disk_unlink_failed path=%s error=%s", path, exc)
+
+
+def _write_disk(object_key: str, payload: bytes, etag: Optional[str]) -> None:
+    global DISK_INDEX_BYTES
+    if not OBJECT_CACHE_DISK_BYTES or len(payload) > OBJECT_CACHE_DISK_BYTES:
+        return
+    data_path = _disk_path(object_key)
+    try:
+        OBJECT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so readers never see a partial file. Metadata lands last and marks the entry valid.
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        data_tmp = data_path.with_name(data_path.name + suffix)
+        data_tmp.write_bytes(payload)
+        os.replace(data_tmp, data_path)
+        meta_tmp = data_path.with_name(data_path.name + ".json" + suffix)
+        meta = {"object_key": object_key, "etag": etag, "length": len(payload), "md5": content_etag(payload)}
+        meta_tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(meta_tmp, data_path.with_suffix(".json"))
+    except OSError as exc:
+        logger.warning("[CACHE] disk_write_failed object_key=%s error=%s", object_key, exc)
+        return
+    with OBJECT_CACHE_LOCK:
+        previous = DISK_INDEX.pop(object_key, None)
+        if previous is not None:
+            DISK_INDEX_BYTES -= previous.length
+        DISK_INDEX[object_key] = DiskEntry(etag, len(payload))
+        DISK_INDEX_BYTES += len(payload)
+        while DISK_INDEX_BYTES > OBJECT_CACHE_DISK_BYTES and len(DISK_INDEX) > 1:
+            _drop_disk_entry(next(iter(DISK_INDEX)))
+            OBJECT_CACHE_METRICS["evictions"] += 1
+
+
+def lookup_object(object_key: str) -> Optional[CachedObject]:
+    with OBJECT_CACHE_LOCK:
+        if not DISK_INDEX_LOADED:
+            _load_disk_index()
+        cached = MEMORY_CACHE.get(object_key)
+        if object_key in DISK_INDEX:
+            DISK_INDEX.move_to_end(object_key)
+        if cached is not None:
+            MEMORY_CACHE.move_to_end(object_key)
+            OBJECT_CACHE_METRICS["memory_hits"] += 1
+            return cached
+        entry = DISK_INDEX.get(object_key)
+        if entry is None:
+            OBJECT_CACHE_METRICS["misses"] += 1
+            return None
+    data_path = _disk_path(object_key)
+    try:
+        payload = data_path.read_bytes()
+        # Another process sharing the directory may have replaced the entry since this index was built,
+        # so the ETag comes from the metadata on disk, checked against the bytes actually read.
+        meta = json.loads(data_path.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        payload, meta = b"", {}
+    intact = meta.get("length") == len(payload) and meta.get("md5") == content_etag(payload)
+    with OBJECT_CACHE_LOCK:
+        if not intact:
+            _drop_disk_entry(object_key)
+            OBJECT_CACHE_METRICS["misses"] += 1
+            return None
+        OBJECT_CACHE_METRICS["disk_hits"] += 1
+        # Disk entries may predate a restart, so they are revalidated before being trusted.
+        cached = CachedObject(payload, meta.get("etag"), validated_at=float("-inf"))
+        _remember(object_key, cached)
+        return cached
+
+
+def store_object(object_key: str, payload: bytes, etag: Optional[str] = None) -> None:
+    with OBJECT_CACHE_LOCK:
+        if not DISK_INDEX_LOADED:
+            _load_disk_index()
+        _remember(object_key, CachedObject(payload, etag, time.monotonic()))
+        OBJECT_CACHE_METRICS["stores"] += 1
+    _write_disk(object_key, payload, etag)
+
+
+def object_written(object_key: str, payload: bytes) -> None:
+    if object_key.startswith(OBJECT_CACHE_WRITE_THROUGH_PREFIXES):
+        store_object(object_key, payload, content_etag(payload))
+    else:
+        invalidate_object(object_key)
+
+
+def mark_validated(object_key: str, cached: CachedObject) -> None:
+    with OBJECT_CACHE_LOCK:
+        OBJECT_CACHE_METRICS["revalidated"] += 1
+        _remember(object_key, cached._replace(validated_at=time.monotonic()))
+
+
+def invalidate_object(object_key: str) -> None:
+    global MEMORY_CACHE_BYTES
+    with OBJECT_CACHE_LOCK:
+        previous = MEMORY_CACHE.pop(object_key, None)
+        if previous is not None:
+            MEMORY_CACHE_BYTES -= len(previous.payload)
+        _drop_disk_entry(object_key)
+
+
+def object_cached(object_key: str) -> bool:
+    with OBJECT_CACHE_LOCK:
+        if not DISK_INDEX_LOADED:
+            _load_disk_index()
+        return object_key in MEMORY_CACHE or object_key in DISK_INDEX
+
+
+def object_cache_metrics() -> Dict[str, Any]:
+    with OBJECT_CACHE_LOCK:
+        return {
+            **OBJECT_CACHE_METRICS,
+            "memory_objects": len(MEMORY_CACHE),
+            "memory_bytes": MEMORY_CACHE_BYTES,
+            "memory_limit_bytes": OBJECT_CACHE_MEMORY_BYTES,
+            "disk_objects": len(DISK_INDEX),
+            "disk_bytes": DISK_INDEX_BYTES,
+            "disk_limit_bytes": OBJECT_CACHE_DISK_BYTES,
+        }
@@ -0,0 +1,398 @@
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from mpl_toolkits.mplot3d import Axes3D  # noqa: E402,F401
+
+logger = logging.getLogger("ecg-backend")
+
+
+def _env_workers(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name) or default))
+    except ValueError:
+        return default
+
+
+# RENDER_WORKERS=0 renders in-process, serialized behind RENDER_INPROCESS_LOCK.
+RENDER_WORKERS = _env_workers("RENDER_WORKERS", min(4, os.cpu_count() or 1))
+RENDER_QUEUE_SIZE = max(1, _env_workers("RENDER_QUEUE_SIZE", max(1, RENDER_WORKERS) * 4))
+RENDER_POOL: Optional[ProcessPoolExecutor] = None
+RENDER_POOL_LOCK = threading.Lock()
+RENDER_QUEUE_SLOTS = threading.BoundedSemaphore(RENDER_QUEUE_SIZE)
+RENDER_INPROCESS_LOCK = threading.Lock()
+RENDER_INPROCESS_WARMED = False
+RENDER_METRICS: Dict[str, float] = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "pool_restarts": 0,
+    "total_render_ms": 0.0,
+    "max_render_ms": 0.0,
+}
+RENDER_METRICS_LOCK = threading.Lock()
+
+
+def _plot_to_png_bytes(fig: plt.Figure) -> bytes:
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight", facecolor="white")
+    plt.close(fig)
+    payload = buffer.getvalue()
+    try:
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(payload))
+        optimized = io.BytesIO()
+        image.save(optimized, format="PNG", optimize=True)
+        payload = optimized.getvalue()
+    except Exception:
+        pass
+    return payload
+
+
+def _safe_series(values: List[float]) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def _finite_axis_limit(*arrays: np.ndarray, default: float = 0.25) -> float:
+    finite_values: List[float] = []
+    for array in arrays:
+        finite = np.asarray(array, dtype=float)
+        finite = finite[np.isfinite(finite)]
+        if finite.size:
+            finite_values.append(float(np.max(np.abs(finite))))
+    max_abs = max(finite_values) if finite_values else default
+    return max(default, max_abs * 1.15)
+
+
+def _make_waveform_compare_png(
+    calibration: Dict[str, Any],
+    session: Dict[str, Any],
+    channel: str,
+    window_label: str,
+) -> bytes:
+    cal_x = _safe_series(calibration["epoch_axis"])
+    ses_x = _safe_series(session["epoch_axis"])
+    cal_y = _safe_series(calibration["mean_beats"][channel])
+    ses_y = _safe_series(session["mean_beats"][channel])
+    y_limit = _finite_axis_limit(cal_y, ses_y, default=0.15)
+    fig, ax = plt.subplots(figsize=(5.6, 4.2))
+    ax.plot(cal_x, cal_y, color="#8a8f98", linewidth=1.6, label="Calibration")
+    ax.plot(ses_x, ses_y, color="#d13f3f", linewidth=1.6, label="Session window")
+    ax.axhline(0, color="#607080", linewidth=0.8, alpha=0.35)
+    ax.axvline(0, color="#607080", linewidth=0.8, alpha=0.35)
+    ax.set_ylim(-y_limit, y_limit)
+    ax.set_title(f"{channel} representative mean beat\\n{window_label}", fontsize=11)
+    ax.set_xlabel("Aligned beat axis (s)")
+    ax.set_ylabel("mV")
+    ax.grid(True, alpha=0.22)
+    ax.legend(loc="upper right", fontsize=8)
+    return _plot_to_png_bytes(fig)
+
+
+def _make_2d_vcg_compare_png(
+    calibration: Dict[str, Any],
+    session: Dict[str, Any],
+    plane: str,
+    x_channel: str,
+    y_channel: str,
+    window_label: str,
+) -> bytes:
+    cal_x = _safe_series(calibration["mean_beats"][x_channel])
+    cal_y = _safe_series(calibration["mean_beats"][y_channel])
+    ses_x = _safe_series(session["mean_beats"][x_channel])
+    ses_y = _safe_series(session["mean_beats"][y_channel])
+    limit = _finite_axis_limit(cal_x, cal_y, ses_x, ses_y, default=0.15)
+    fig, ax = plt.subplots(figsize=(5.6, 4.2))
+    ax.plot(cal_x, cal_y, color="#8a8f98", linewidth=1.5, label="Calibration")
+    ax.plot(ses_x, ses_y, color="#d13f3f", linewidth=1.5, label="Session window")
+    ax.axhline(0, color="#607080", linewidth=0.8, alpha=0.35)
+    ax.axvline(0, color="#607080", linewidth=0.8, alpha=0.35)
+    ax.set_xlim(-limit, limit)
+    ax.set_ylim(-limit, limit)
+    ax.set_aspect("equal", adjustable="box")
+    ax.set_title(f"{plane} VCG-style comparison\\n{window_label}", fontsize=11)
+    ax.set_xlabel(f"{x_channel} (mV)")
+    ax.set_ylabel(f"{y_channel} (mV)")
+    ax.grid(True, alpha=0.22)
+    ax.legend(loc="upper right", fontsize=8)
+    return _plot_to_png_bytes(fig)
+
+
+def _make_3d_vcg_compare_png(
+    calibration: Dict[str, Any],
+    session: Dict[str, Any],
+    window_label: str,
+) -> bytes:
+    cal_x = _safe_series(calibration["mean_beats"]["CH2"])
+    cal_y = _safe_series(calibration["mean_beats"]["CH4"])
+    cal_z = _safe_series(calibration["mean_beats"]["CH3"])
+    ses_x = _safe_series(session["mean_beats"]["CH2"])
+    ses_y = _safe_series(session["mean_beats"]["CH4"])
+    ses_z = _safe_series(session["mean_beats"]["CH3"])
+    limit = _finite_axis_limit(cal_x, cal_y, cal_z, ses_x, ses_y, ses_z, default=0.15)
+    fig = plt.figure(figsize=(5.6, 4.2))
+    ax = fig.add_subplot(111, projection="3d")
+    ax.plot(cal_x, cal_y, cal_z, color="#8a8f98", linewidth=1.3, label="Calibration")
+    ax.plot(ses_x, ses_y, ses_z, color="#d13f3f", linewidth=1.3, label="Session window")
+    ax.set_xlim(-limit, limit)
+    ax.set_ylim(-limit, limit)
+    ax.set_zlim(-limit, limit)
+    ax.set_xlabel("CH2")
+    ax.set_ylabel("CH4")
+    ax.set_zlabel("CH3")
+    ax.set_title(f"3D VCG-style comparison\\n{window_label}", fontsize=11)
+    ax.view_init(elev=24, azim=42)
+    ax.legend(loc="upper left", fontsize=8)
+    return _plot_to_png_bytes(fig)
+
+
+def _render_vector3d_png(
+    lead_x: List[float],
+    lead_y: List[float],
+    lead_z: List[float],
+    markers: Dict[str, List[int]],
+    progress_percent: int,
+    y_min_mv: float,
+    y_max_mv: float,
+) -> bytes:
+    count = min(len(lead_x), len(lead_y), len(lead_z))
+    if count <= 0:
+        raise ValueError("No vector samples available for 3D rendering.")
+
+    bounded_progress = max(1, min(progress_percent, 100))
+    visible_count = max(1, min(count, int(round((count * bounded_progress) / 100.0))))
+    x = lead_x[:visible_count]
+    y = lead_y[:visible_count]
+    z = lead_z[:visible_count]
+
+    fig = plt.figure(figsize=(8.4, 6.6), dpi=160)
+    fig.patch.set_facecolor("#f5fafc")
+    ax = fig.add_subplot(111, projection="3d")
+    ax.set_facecolor("#f8fbfd")
+    # Draw the origin axes first with lower z-order so the beat path can sit above them.
+    ax.plot([y_min_mv, y_max_mv], [0, 0], [0, 0], color="#dc2626", linewidth=1.2, alpha=0.72, zorder=1)
+    ax.plot([0, 0], [y_min_mv, y_max_mv], [0, 0], color="#2563eb", linewidth=1.2, alpha=0.72, zorder=1)
+    ax.plot([0, 0], [0, 0], [y_min_mv, y_max_mv], color="#16a34a", linewidth=1.2, alpha=0.72, zorder=1)
+    ax.plot(x, y, z, color="#0c6c7e", linewidth=2.0, solid_capstyle="round", zorder=3)
+
+    marker_specs = {
+        "P": "#1f7aec",
+        "Q": "#9a3412",
+        "R": "#b91c1c",
+        "S": "#0f766e",
+        "T": "#6d28d9",
+    }
+    for label, color in marker_specs.items():
+        positions = markers.get(label, []) or []
+        for position in positions:
+            if position >= visible_count:
+                continue
+            ax.scatter(
+                [lead_x[position]],
+                [lead_y[position]],
+                [lead_z[position]],
+                color=color,
+                s=34,
+                edgecolors="#ffffff",
+                linewidths=0.75,
+                depthshade=False,
+                zorder=4,
+            )
+            ax.text(
+                lead_x[position],
+                lead_y[position],
+                lead_z[position],
+                f" {label}",
+                color=color,
+                fontsize=9,
+            )
+
+    ax.set_xlim(y_min_mv, y_max_mv)
+    ax.set_ylim(y_min_mv, y_max_mv)
+    ax.set_zlim(y_min_mv, y_max_mv)
+    ax.set_xlabel("Lead I / CH2 (mV)", labelpad=12)
+    ax.set_ylabel("Lead III / CH4 (mV)", labelpad=12)
+    ax.set_zlabel("Lead II / CH3 (mV)", labelpad=10)
+    ax.set_box_aspect((1, 1, 1))
+    ax.view_init(elev=22, azim=-58)
+    ax.grid(True, alpha=0.25)
+    ax.set_title("3D beat morphology", pad=14)
+    tick_color = (0.28, 0.39, 0.49, 0.9)
+    for axis in (ax.xaxis, ax.yaxis, ax.zaxis):
+        axis.pane.set_facecolor((0.972, 0.984, 0.992, 0.72))
+        axis.pane.set_edgecolor((0.74, 0.82, 0.88, 0.9))
+        axis._axinfo["grid"]["color"] = (0.64, 0.73, 0.8, 0.25)
+        axis._axinfo["grid"]["linewidth"] = 0.8
+    ax.xaxis.label.set_color(tick_color)
+    ax.yaxis.label.set_color(tick_color)
+    ax.zaxis.label.set_color(tick_color)
+    ax.tick_params(colors=tick_color, labelsize=8)
+
+    buffer = io.BytesIO()
+    fig.tight_layout()
+    fig.savefig(buffer, format="png", bbox_inches="tight", facecolor=fig.get_facecolor())
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+RENDERERS: Dict[str, Callable[..., bytes]] = {
+    "waveform_compare": _make_waveform_compare_png,
+    "vcg2d_compare": _make_2d_vcg_compare_png,
+    "vcg3d_compare": _make_3d_vcg_compare_png,
+    "vector3d": _render_vector3d_png,
+}
+
+
+def _warm_render_state() -> None:
+    # Pay the font cache and 3D projection setup once per worker, not on the first request.
+    fig = plt.figure(figsize=(1, 1))
+    ax = fig.add_subplot(111, projection="3d")
+    ax.plot([0.0, 1.0], [0.0, 1.0], [0.0, 1.0])
+    ax.set_title("warm")
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close(fig)
+
+
+def _init_render_worker() -> None:
+    _warm_render_state()
+
+
+def _render_spec(kind: str, spec: Dict[str, Any]) -> Tuple[bytes, float]:
+    started_at = time.perf_counter()
+    payload = RENDERERS[kind](**spec)
+    return payload, (time.perf_counter() - started_at) * 1000.0
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global RENDER_POOL
+    with RENDER_POOL_LOCK:
+        if RENDER_POOL is None:
+            RENDER_POOL = ProcessPoolExecutor(
+                max_workers=RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_render_worker,
+            )
+            logger.info("[RENDER] pool_started workers=%s queue_size=%s", RENDER_WORKERS, RENDER_QUEUE_SIZE)
+        return RENDER_POOL
+
+
+def _reset_render_pool(broken: ProcessPoolExecutor) -> None:
+    global RENDER_POOL
+    with RENDER_POOL_LOCK:
+        if RENDER_POOL is broken:
+            RENDER_POOL = None
+            with RENDER_METRICS_LOCK:
+                RENDER_METRICS["pool_restarts"] += 1
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _record_render(render_ms: Optional[float]) -> None:
+    with RENDER_METRICS_LOCK:
+        if render_ms is None:
+            RENDER_METRICS["failed"] += 1
+            return
+        RENDER_METRICS["completed"] += 1
+        RENDER_METRICS["total_render_ms"] += render_ms
+        RENDER_METRICS["max_render_ms"] = max(RENDER_METRICS["max_render_ms"], render_ms)
+
+
+def _submit_render(kind: str, spec: Dict[str, Any]) -> Future:
+    global RENDER_INPROCESS_WARMED
+    if kind not in RENDERERS:
+        raise KeyError(f"Unknown render kind: {kind}")
+    # Blocks the caller once RENDER_QUEUE_SIZE renders are waiting, instead of queueing without bound.
+    RENDER_QUEUE_SLOTS.acquire()
+    with RENDER_METRICS_LOCK:
+        RENDER_METRICS["submitted"] += 1
+    if RENDER_WORKERS == 0:
+        future: Future = Future()
+        try:
+            with RENDER_INPROCESS_LOCK:
+                if not RENDER_INPROCESS_WARMED:
+                    _warm_render_state()
+                    RENDER_INPROCESS_WARMED = True
+                future.set_result(_render_spec(kind, spec))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            RENDER_QUEUE_SLOTS.release()
+        return future
+    try:
+        future = _get_render_pool().submit(_render_spec, kind, spec)
+    except BaseException:
+        RENDER_QUEUE_SLOTS.release()
+        raise
+    future.add_done_callback(lambda _: RENDER_QUEUE_SLOTS.release())
+    return future
+
+
+def _await_render(kind: str, spec: Dict[str, Any], future: Future) -> bytes:
+    try:
+        payload, render_ms = future.result()
+    except BrokenProcessPool:
+        logger.warning("[RENDER] pool_broken kind=%s retrying", kind)
+        pool = RENDER_POOL
+        if pool is not None:
+            _reset_render_pool(pool)
+        try:
+            payload, render_ms = _submit_render(kind, spec).result()
+        except BaseException:
+            _record_render(None)
+            raise
+    except BaseException:
+        _record_render(None)
+        raise
+    _record_render(render_ms)
+    return payload
+
+
+def render_png(kind: str, **spec: Any) -> bytes:
+    return _await_render(kind, spec, _submit_render(kind, spec))
+
+
+def render_png_many(items: List[Tuple[str, Dict[str, Any]]]) -> List[bytes]:
+    futures = [(kind, spec, _submit_render(kind, spec)) for kind, spec in items]
+    return [_await_render(kind, spec, future) for kind, spec, future in futures]
+
+
+def render_metrics() -> Dict[str, float]:
+    with RENDER_METRICS_LOCK:
+        finished = RENDER_METRICS["completed"] + RENDER_METRICS["failed"]
+        return {
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in RENDER_METRICS.items()},
+            "workers": RENDER_WORKERS,
+            "queue_size": RENDER_QUEUE_SIZE,
+            "in_flight": RENDER_METRICS["submitted"] - finished,
+            "mean_render_ms": round(RENDER_METRICS["total_render_ms"] / RENDER_METRICS["completed"], 3)
+            if RENDER_METRICS["completed"]
+            else 0.0,
+        }
+
+
+def start_render_service() -> None:
+    if RENDER_WORKERS > 0:
+        pool = _get_render_pool()
+        # Worker processes spawn on demand; nudge them all up so the initializer runs before traffic.
+        for _ in range(RENDER_WORKERS):
+            pool.submit(os.getpid)
+
+
+def shutdown_render_service() -> None:
+    global RENDER_POOL
+    with RENDER_POOL_LOCK:
+        pool, RENDER_POOL = RENDER_POOL, None
+    if pool is not None:
+        logger.info("[RENDER] pool_shutdown")
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,285 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+
+import supabase
+from supabase import (
+    REVIEW_PROCESSING_VERSION,
+    SG_TIMEZONE,
+    STORAGE_IO_LIMIT,
+    _fetch_busy_processed_record_ids,
+    _fetch_processable_recording_ids,
+    _fetch_processed_artifact_record_ids,
+    _fetch_processed_record_ids,
+    _sg_now_iso,
+    _upsert_processed_artifact,
+)
+
+logger = logging.getLogger("ecg-backend")
+
+REPROCESS_KINDS = ("review", "static")
+DEFAULT_PROGRESS_FILE = "reprocess_progress.jsonl"
+COMPLETED_STATUSES = {"ready", "skipped"}
+# A review row left in "processing" longer than this was abandoned (server crash, cancelled job) and is picked up again.
+PROCESSING_ABANDONED_AFTER_S = 60 * 60
+
+
+def _current_version(kind: str) -> str:
+    if kind == "review":
+        return REVIEW_PROCESSING_VERSION
+    from app import STATIC_REVIEW_PROCESSING_VERSION
+
+    return STATIC_REVIEW_PROCESSING_VERSION
+
+
+def _error_text(exc: Exception) -> str:
+    if isinstance(exc, HTTPException):
+        return json.dumps(exc.detail, default=str) if not isinstance(exc.detail, str) else exc.detail
+    return str(exc) or exc.__class__.__name__
+
+
+def load_completed(progress_path: Path, versions: Dict[str, str]) -> Set[Tuple[str, str]]:
+    completed: Set[Tuple[str, str]] = set()
+    if not progress_path.exists():
+        return completed
+    with progress_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            kind = entry.get("kind")
+            if (
+                entry.get("status") in COMPLETED_STATUSES
+                and kind in versions
+                and entry.get("processing_version") == versions[kind]
+            ):
+                completed.add((kind, str(entry.get("record_id"))))
+    return completed
+
+
+def find_stale_record_ids(kind: str, include_unprocessed: bool = False, include_processing: bool = False) -> List[str]:
+    if kind == "review":
+        stale = _fetch_processed_record_ids(stale_only=True)
+        if include_unprocessed:
+            processed = set(_fetch_processed_record_ids())
+            stale.extend(record_id for record_id in _fetch_processable_recording_ids() if record_id not in processed)
+        busy: Set[str] = set()
+        if not include_processing:
+            # Left to the server while it is plausibly still working on them.
+            since = datetime.now(SG_TIMEZONE) - timedelta(seconds=PROCESSING_ABANDONED_AFTER_S)
+            busy = set(_fetch_busy_processed_record_ids(since.isoformat()))
+        return [record_id for record_id in dict.fromkeys(stale) if record_id not in busy]
+    from app import STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE
+
+    version = _current_version("static")
+    stale = _fetch_processed_artifact_record_ids(STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE, version, stale_only=True)
+    if include_unprocessed:
+        # Includes manifests written before artifact rows existed; _reprocess_static_record registers current ones.
+        reviewed = set(stale) | set(_fetch_processed_artifact_record_ids(STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE, version))
+        stale.extend(record_id for record_id in _fetch_processable_recording_ids() if record_id not in reviewed)
+    return list(dict.fromkeys(stale))
+
+
+def _init_worker(storage_limit: int, log_level: int) -> None:
+    logging.getLogger().setLevel(log_level)
+    supabase._set_storage_io_limit(storage_limit)
+    import app  # noqa: F401 - warm NeuroKit/matplotlib imports once per worker
+
+
+def _reprocess_static_record(record_id: str) -> str:
+    import app
+    from jobs import claim_job, get_job
+
+    try:
+        manifest = app._load_static_review_manifest(record_id)
+    except HTTPException:
+        manifest = None
+    if (
+        manifest
+        and manifest.get("processing_version") == app.STATIC_REVIEW_PROCESSING_VERSION
+        and manifest.get("status") == "ready"
+    ):
+        # Manifest predates the artifact row; register it instead of re-rendering.
+        _upsert_processed_artifact(
+            record_id,
+            app.STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE,
+            app._static_review_manifest_key(record_id),
+            processing_version=app.STATIC_REVIEW_PROCESSING_VERSION,
+        )
+        return "skipped"
+    job_id, _, _ = claim_job("static_review", record_id, {"max_windows": None})
+    app._static_review_job(job_id, record_id)
+    job = get_job(job_id) or {}
+    if job.get("status") != "ready":
+        raise RuntimeError(job.get("error") or f"static review ended with status={job.get('status')}")
+    return "ready"
+
+
+def reprocess_record(kind: str, record_id: str) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        if kind == "review":
+            import app
+
+            app._process_review_artifacts_for_record(record_id)
+            status = "ready"
+        else:
+            status = _reprocess_static_record(record_id)
+    except Exception as exc:
+        status = "error"
+        error = _error_text(exc)
+    return {
+        "record_id": record_id,
+        "kind": kind,
+        "processing_version": _current_version(kind),
+        "status": status,
+        "error": error,
+        "elapsed_ms": round((time.perf_counter() - started_at) * 1000.0, 1),
+        "finished_at": _sg_now_iso(),
+    }
+
+
+def _throughput(done: int, total: int, started_at: float) -> Dict[str, Any]:
+    elapsed_s = max(time.perf_counter() - started_at, 1e-6)
+    per_minute = done / elapsed_s * 60.0
+    remaining = total - done
+    return {
+        "done": done,
+        "total": total,
+        "elapsed_s": round(elapsed_s, 1),
+        "records_per_minute": round(per_minute, 2),
+        "eta_s": round(remaining / per_minute * 60.0, 1) if per_minute > 0 else None,
+    }
+
+
+def run_reprocess(
+    tasks: Iterable[Tuple[str, str]],
+    *,
+    workers: int,
+    storage_concurrency: int,
+    progress_path: Path,
+    report_every: int = 10,
+) -> Dict[str, Any]:
+    pending = list(tasks)
+    total = len(pending)
+    counts: Dict[str, int] = {"ready": 0, "skipped": 0, "error": 0}
+    started_at = time.perf_counter()
+    if not pending:
+        return {"counts": counts, **_throughput(0, 0, started_at)}
+
+    storage_limit = max(1, storage_concurrency // workers)
+    context = multiprocessing.get_context("spawn")
+    done = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(storage_limit, logging.getLogger().level),
+    ) as pool, progress_path.open("a", encoding="utf-8") as progress:
+        queue = iter(pending)
+        in_flight = set()
+        # Keep a small backlog per worker so the record list is not pickled up front.
+        for kind, record_id in queue:
+            in_flight.add(pool.submit(reprocess_record, kind, record_id))
+            if len(in_flight) >= workers * 2:
+                break
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                progress.write(json.dumps(result) + "\n")
+                progress.flush()
+                done += 1
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+                if result["status"] == "error":
+                    logger.warning(
+                        "[REPROCESS] failed kind=%s record_id=%s error=%s",
+                        result["kind"],
+                        result["record_id"],
+                        result["error"],
+                    )
+                if done % report_every == 0 or done == total:
+                    logger.info("[REPROCESS] progress %s counts=%s", _throughput(done, total, started_at), counts)
+                next_task = next(queue, None)
+                if next_task is not None:
+                    in_flight.add(pool.submit(reprocess_record, *next_task))
+    return {"counts": counts, **_throughput(done, total, started_at)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reprocess records whose stored artifacts predate the current processing version.")
+    parser.add_argument("--kind", choices=[*REPROCESS_KINDS, "all"], default="review")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument(
+        "--storage-concurrency",
+        type=int,
+        default=STORAGE_IO_LIMIT,
+        help="total concurrent storage requests across workers, defaults to SUPABASE_STORAGE_CONCURRENCY",
+    )
+    parser.add_argument("--progress-file", default=DEFAULT_PROGRESS_FILE)
+    parser.add_argument("--record-id", action="append", default=[], help="reprocess only these records")
+    parser.add_argument("--include-unprocessed", action="store_true", help="also process recordings with no processed row")
+    parser.add_argument(
+        "--include-processing",
+        action="store_true",
+        help="also process review rows marked processing within the last hour",
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    kinds = list(REPROCESS_KINDS) if args.kind == "all" else [args.kind]
+    versions = {kind: _current_version(kind) for kind in kinds}
+    progress_path = Path(args.progress_file)
+    completed = load_completed(progress_path, versions)
+
+    tasks: List[Tuple[str, str]] = []
+    for kind in kinds:
+        record_ids = args.record_id or find_stale_record_ids(
+            kind,
+            include_unprocessed=args.include_unprocessed,
+            include_processing=args.include_processing,
+        )
+        stale_count = len(record_ids)
+        record_ids = [record_id for record_id in record_ids if (kind, record_id) not in completed]
+        logger.info(
+            "[REPROCESS] plan kind=%s version=%s stale=%s already_done=%s",
+            kind,
+            versions[kind],
+            stale_count,
+            stale_count - len(record_ids),
+        )
+        tasks.extend((kind, record_id) for record_id in record_ids)
+    if args.limit is not None:
+        tasks = tasks[: max(0, args.limit)]
+
+    if args.dry_run:
+        for kind, record_id in tasks:
+            print(f"{kind}\t{record_id}")
+        return 0
+
+    summary = run_reprocess(
+        tasks,
+        workers=max(1, args.workers),
+        storage_concurrency=max(1, args.storage_concurrency),
+        progress_path=progress_path,
+    )
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["counts"].get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("ecg-backend")
+
+SHARED_ARRAY_DTYPE = "float64"
+
+
+class SharedArrayHandle(NamedTuple):
+    name: str
+    length: int
+    dtype: str = SHARED_ARRAY_DTYPE
+
+
+# Segments created by this process: publish key -> (refcount, handles, owned segments).
+PUBLISHED_ARRAYS: Dict[str, Tuple[int, Dict[str, SharedArrayHandle], Tuple[shared_memory.SharedMemory, ...]]] = {}
+PUBLISHED_ARRAYS_LOCK = threading.Lock()
+
+
+def _create_segment(values: Sequence[float]) -> Tuple[SharedArrayHandle, shared_memory.SharedMemory]:
+    source = np.asarray(values, dtype=SHARED_ARRAY_DTYPE)
+    # Zero-length segments are not allowed, so empty channels still reserve one element.
+    segment = shared_memory.SharedMemory(create=True, size=max(source.nbytes, np.dtype(SHARED_ARRAY_DTYPE).itemsize))
+    target = np.ndarray(source.shape, dtype=SHARED_ARRAY_DTYPE, buffer=segment.buf)
+    target[:] = source
+    del target
+    return SharedArrayHandle(segment.name, int(source.size)), segment
+
+
+def _unlink_segments(segments: Tuple[shared_memory.SharedMemory, ...]) -> None:
+    for segment in segments:
+        try:
+            segment.close()
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as exc:  # pragma: no cover - safeguard
+            logger.warning("[SHARED] unlink_failed name=%s error=%s", segment.name, exc)
+
+
+def publish_arrays(key: str, arrays: Mapping[str, Sequence[float]]) -> Dict[str, SharedArrayHandle]:
+    with PUBLISHED_ARRAYS_LOCK:
+        existing = PUBLISHED_ARRAYS.get(key)
+        if existing is not None:
+            refcount, handles, segments = existing
+            PUBLISHED_ARRAYS[key] = (refcount + 1, handles, segments)
+            return dict(handles)
+        handles: Dict[str, SharedArrayHandle] = {}
+        segments = []
+        try:
+            for label, values in arrays.items():
+                handle, segment = _create_segment(values)
+                handles[label] = handle
+                segments.append(segment)
+        except BaseException:
+            _unlink_segments(tuple(segments))
+            raise
+        PUBLISHED_ARRAYS[key] = (1, handles, tuple(segments))
+    logger.info(
+        "[SHARED] published key=%s arrays=%s bytes=%s",
+        key,
+        len(handles),
+        sum(handle.length for handle in handles.values()) * np.dtype(SHARED_ARRAY_DTYPE).itemsize,
+    )
+    return dict(handles)
+
+
+def release_arrays(key: str) -> None:
+    with PUBLISHED_ARRAYS_LOCK:
+        existing = PUBLISHED_ARRAYS.get(key)
+        if existing is None:
+            return
+        refcount, handles, segments = existing
+        if refcount > 1:
+            PUBLISHED_ARRAYS[key] = (refcount - 1, handles, segments)
+            return
+        PUBLISHED_ARRAYS.pop(key, None)
+    # Attached workers keep their mappings after unlink; only new attaches fail.
+    _unlink_segments(segments)
+
+
+@contextmanager
+def shared_arrays(key: str, arrays: Mapping[str, Sequence[float]]) -> Iterator[Dict[str, SharedArrayHandle]]:
+    handles = publish_arrays(key, arrays)
+    try:
+        yield handles
+    finally:
+        release_arrays(key)
+
+
+@contextmanager
+def attached_array(handle: SharedArrayHandle) -> Iterator[np.ndarray]:
+    segment = shared_memory.SharedMemory(name=handle.name)
+    array: Any = np.ndarray((handle.length,), dtype=handle.dtype, buffer=segment.buf)
+    array.flags.writeable = False
+    try:
+        yield array
+    finally:
+        del array
+        try:
+            segment.close()
+        except BufferError:
+            # A caller kept a view alive; the mapping is dropped when that view is collected.
+            logger.warning("[SHARED] close_deferred name=%s", handle.name)
+
+
+def release_all_arrays() -> None:
+    with PUBLISHED_ARRAYS_LOCK:
+        published = list(PUBLISHED_ARRAYS.values())
+        PUBLISHED_ARRAYS.clear()
+    for _, _, segments in published:
+        _unlink_segments(segments)
+
+
+atexit.register(release_all_arrays)
@@ -0,0 +1,66 @@
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+# Each level folds the previous one by 4, so every factor divides the next.
+ENVELOPE_FACTORS = (4, 16, 64, 256, 1024)
+
+
+def _fold(values: np.ndarray, step: int, reducer: np.ufunc) -> np.ndarray:
+    if not len(values):
+        return values
+    padding = (-len(values)) % step
+    if padding:
+        # Repeating the last value leaves the bucket's min and max unchanged.
+        values = np.concatenate([values, np.full(padding, values[-1])])
+    return reducer.reduce(values.reshape(-1, step), axis=1)
+
+
+def build_envelope_pyramid(samples: Sequence[float]) -> Dict[str, Any]:
+    mins = maxs = np.asarray(samples, dtype=np.float64)
+    levels: Dict[str, Dict[str, List[float]]] = {}
+    previous = 1
+    for factor in ENVELOPE_FACTORS:
+        mins = _fold(mins, factor // previous, np.minimum)
+        maxs = _fold(maxs, factor // previous, np.maximum)
+        levels[str(factor)] = {"min": mins.tolist(), "max": maxs.tolist()}
+        previous = factor
+    return {"sample_count": len(samples), "factors": list(ENVELOPE_FACTORS), "levels": levels}
+
+
+def select_envelope_factor(pyramid: Dict[str, Any], start: int, end: int, pixel_width: int) -> int:
+    # Coarsest level that still gives every pixel its own bucket; 1 means raw samples.
+    selected = 1
+    for factor in pyramid["factors"]:
+        if (end - start) // factor >= pixel_width:
+            selected = factor
+    return selected
+
+
+def envelope_buckets(pyramid: Dict[str, Any], factor: int, start: int, end: int) -> Dict[str, Any]:
+    level = pyramid["levels"][str(factor)]
+    first_bucket = start // factor
+    end_bucket = max(first_bucket, -(-end // factor))
+    return {
+        "factor": factor,
+        "start_sample": first_bucket * factor,
+        "end_sample": min(pyramid["sample_count"], end_bucket * factor),
+        "min": level["min"][first_bucket:end_bucket],
+        "max": level["max"][first_bucket:end_bucket],
+    }
+
+
+def minmax_downsample(values: List[float], target_count: int) -> List[float]:
+    # Emits each bucket's min and max in time order, so peaks survive where every-k-th picking drops them.
+    bucket_count = target_count // 2
+    if bucket_count <= 0 or len(values) <= target_count:
+        return list(values)
+    points: List[float] = []
+    for bucket in range(bucket_count):
+        start = bucket * len(values) // bucket_count
+        end = (bucket + 1) * len(values) // bucket_count
+        chunk = values[start:end]
+        low = min(range(len(chunk)), key=chunk.__getitem__)
+        high = max(range(len(chunk)), key=chunk.__getitem__)
+        points.extend((chunk[low], chunk[high]) if low <= high else (chunk[high], chunk[low]))
+    return points
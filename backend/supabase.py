@@ -1,25 +1,102 @@
+import asyncio
+import importlib.util
 import json
 import logging
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Generator, List, NamedTuple, Optional, Sequence, TypeVar, Union
 from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
 import httpx
 from fastapi import HTTPException
 
+from executors import current_pool, run_in_pool, submit
+from local_backend import LOCAL_BACKEND_URL, get_local_backend_transport
+from object_cache import invalidate_object, lookup_object, mark_validated, object_written, store_object
+
 logger = logging.getLogger("ecg-backend")
 
 REVIEW_PROCESSING_VERSION = "review_v7"
 SG_TIMEZONE = ZoneInfo("Asia/Singapore")
+STORAGE_IO_LIMIT = max(1, int(os.getenv("SUPABASE_STORAGE_CONCURRENCY") or 16))
+STORAGE_IO_SEMAPHORE = threading.BoundedSemaphore(STORAGE_IO_LIMIT)
+# Seconds before a slow object download gets a second, racing attempt; unset disables hedging.
+STORAGE_HEDGE_AFTER_S = float(os.getenv("SUPABASE_STORAGE_HEDGE_AFTER_S") or 0) or None
+SUPABASE_HTTP_MAX_CONNECTIONS = max(1, int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS") or 32))
+SUPABASE_HTTP_MAX_KEEPALIVE = max(0, int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE") or 16))
+SUPABASE_HTTP_KEEPALIVE_EXPIRY_S = float(os.getenv("SUPABASE_HTTP_KEEPALIVE_EXPIRY_S") or 30)
+# HTTP/2 needs the optional `h2` package; without it the client stays on HTTP/1.1 keep-alive.
+SUPABASE_HTTP2 = (os.getenv("SUPABASE_HTTP2") or "").lower() in {"1", "true", "yes"} and importlib.util.find_spec("h2") is not None
+# `local` serves the same REST and storage calls from SQLite and the filesystem (see local_backend.py).
+STORAGE_BACKEND = (os.getenv("STORAGE_BACKEND") or "supabase").lower()
+SUPABASE_HTTP_CLIENT: Optional[httpx.Client] = None
+SUPABASE_HTTP_CLIENT_LOCK = threading.Lock()
+# Async clients and semaphores are bound to the event loop that created them.
+SUPABASE_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+SUPABASE_ASYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+STORAGE_IO_ASYNC_SEMAPHORE: Optional[asyncio.Semaphore] = None
+SUPABASE_CONFIG_CACHE: Optional[Dict[str, str]] = None
+# record_id -> (fetched_at, processed row plus artifact keys). Upserts through this module invalidate it;
+# the TTL bounds staleness from writers in other processes such as reprocess.py.
+PROCESSED_METADATA_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
+PROCESSED_METADATA_CACHE_TTL_S = max(0.0, float(os.getenv("PROCESSED_METADATA_CACHE_TTL_S") or 60))
+PROCESSED_METADATA_LOCK = threading.Lock()
+SUPABASE_HEADERS_CACHE: Dict[bool, Dict[str, str]] = {}
+SUPABASE_HTTP_METRICS: Dict[str, float] = {
+    "requests": 0,
+    "in_flight": 0,
+    "failed": 0,
+    "http_errors": 0,
+    "total_ms": 0.0,
+    "max_ms": 0.0,
+    "hedged": 0,
+    "hedge_wins": 0,
+}
+SUPABASE_HTTP_METRICS_LOCK = threading.Lock()
+T = TypeVar("T")
+
+
+class SupabaseRequest(NamedTuple):
+    method: str
+    url: str
+    timeout: float
+    storage: bool
+    options: Dict[str, Any]
+
+
+class SupabaseCall(NamedTuple):
+    fn: Callable[..., Any]
+    args: tuple
+
+
+# Helpers are written once as generators that yield requests and receive responses,
+# then driven by the pooled sync client (threads, worker processes) or the async client.
+# Blocking local work (the object cache's disk tier) is yielded as a call, so the async driver keeps it off the loop.
+SupabasePlan = Generator[Union[SupabaseRequest, SupabaseCall], Any, T]
 
 
 def _sg_now_iso() -> str:
     return datetime.now(SG_TIMEZONE).isoformat()
 
 
+def _set_storage_io_limit(limit: int) -> None:
+    global STORAGE_IO_LIMIT, STORAGE_IO_SEMAPHORE
+    STORAGE_IO_LIMIT = max(1, int(limit))
+    STORAGE_IO_SEMAPHORE = threading.BoundedSemaphore(STORAGE_IO_LIMIT)
+
+
 def _get_supabase_config() -> Dict[str, str]:
+    global SUPABASE_CONFIG_CACHE
+    if SUPABASE_CONFIG_CACHE is not None:
+        return SUPABASE_CONFIG_CACHE
+    if STORAGE_BACKEND == "local":
+        bucket = os.getenv("EXPO_PUBLIC_SUPABASE_STORAGE_BUCKET") or os.getenv("SUPABASE_STORAGE_BUCKET") or "ecg-data"
+        SUPABASE_CONFIG_CACHE = {"url": LOCAL_BACKEND_URL, "key": "local", "bucket": bucket}
+        return SUPABASE_CONFIG_CACHE
     url = os.getenv("EXPO_PUBLIC_SUPABASE_URL") or os.getenv("SUPABASE_URL")
     key = (
         os.getenv("EXPO_PUBLIC_SUPABASE_ANON_KEY")
@@ -39,22 +116,218 @@ def _get_supabase_config() -> Dict[str, str]:
             status_code=500,
             detail="Missing Supabase env var: EXPO_PUBLIC_SUPABASE_STORAGE_BUCKET.",
         )
-    return {"url": url, "key": key, "bucket": bucket}
+    SUPABASE_CONFIG_CACHE = {"url": url, "key": key, "bucket": bucket}
+    return SUPABASE_CONFIG_CACHE
 
 
 def _supabase_headers(json_content: bool = True) -> Dict[str, str]:
-    config = _get_supabase_config()
-    headers = {
-        "apikey": config["key"],
-        "Authorization": f"Bearer {config['key']}",
+    cached = SUPABASE_HEADERS_CACHE.get(json_content)
+    if cached is None:
+        config = _get_supabase_config()
+        cached = {
+            "apikey": config["key"],
+            "Authorization": f"Bearer {config['key']}",
+        }
+        if json_content:
+            cached["Content-Type"] = "application/json"
+            cached["Accept"] = "application/json"
+        SUPABASE_HEADERS_CACHE[json_content] = cached
+    # Callers add Prefer/Accept per request, so hand out a copy.
+    return dict(cached)
+
+
+def _http_client_options() -> Dict[str, Any]:
+    if STORAGE_BACKEND == "local":
+        return {"transport": get_local_backend_transport(), "timeout": 30}
+    return {
+        "http2": SUPABASE_HTTP2,
+        "limits": httpx.Limits(
+            max_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=SUPABASE_HTTP_KEEPALIVE_EXPIRY_S,
+        ),
+        "timeout": 30,
     }
-    if json_content:
-        headers["Content-Type"] = "application/json"
-        headers["Accept"] = "application/json"
-    return headers
 
 
-def _fetch_recording_by_id(record_id: str) -> Dict[str, Any]:
+def _get_http_client() -> httpx.Client:
+    global SUPABASE_HTTP_CLIENT
+    client = SUPABASE_HTTP_CLIENT
+    if client is not None:
+        return client
+    with SUPABASE_HTTP_CLIENT_LOCK:
+        if SUPABASE_HTTP_CLIENT is None:
+            SUPABASE_HTTP_CLIENT = httpx.Client(**_http_client_options())
+            logger.info(
+                "[HTTP] client_started http2=%s max_connections=%s max_keepalive=%s",
+                SUPABASE_HTTP2,
+                SUPABASE_HTTP_MAX_CONNECTIONS,
+                SUPABASE_HTTP_MAX_KEEPALIVE,
+            )
+        return SUPABASE_HTTP_CLIENT
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    global SUPABASE_ASYNC_CLIENT, SUPABASE_ASYNC_LOOP, STORAGE_IO_ASYNC_SEMAPHORE
+    loop = asyncio.get_running_loop()
+    if SUPABASE_ASYNC_CLIENT is None or SUPABASE_ASYNC_LOOP is not loop:
+        SUPABASE_ASYNC_CLIENT = httpx.AsyncClient(**_http_client_options())
+        SUPABASE_ASYNC_LOOP = loop
+        STORAGE_IO_ASYNC_SEMAPHORE = asyncio.Semaphore(STORAGE_IO_LIMIT)
+        logger.info("[HTTP] async_client_started http2=%s", SUPABASE_HTTP2)
+    return SUPABASE_ASYNC_CLIENT
+
+
+def _request_started() -> float:
+    with SUPABASE_HTTP_METRICS_LOCK:
+        SUPABASE_HTTP_METRICS["requests"] += 1
+        SUPABASE_HTTP_METRICS["in_flight"] += 1
+    return time.perf_counter()
+
+
+def _request_finished(started_at: float, response: Optional[httpx.Response]) -> None:
+    elapsed_ms = (time.perf_counter() - started_at) * 1000.0
+    with SUPABASE_HTTP_METRICS_LOCK:
+        SUPABASE_HTTP_METRICS["in_flight"] -= 1
+        SUPABASE_HTTP_METRICS["total_ms"] += elapsed_ms
+        SUPABASE_HTTP_METRICS["max_ms"] = max(SUPABASE_HTTP_METRICS["max_ms"], elapsed_ms)
+        if response is None:
+            SUPABASE_HTTP_METRICS["failed"] += 1
+        elif response.status_code >= 400:
+            SUPABASE_HTTP_METRICS["http_errors"] += 1
+
+
+def _send(method: str, url: str, *, timeout: float, **kwargs: Any) -> httpx.Response:
+    started_at = _request_started()
+    response: Optional[httpx.Response] = None
+    try:
+        response = _get_http_client().request(method, url, timeout=timeout, **kwargs)
+        return response
+    finally:
+        _request_finished(started_at, response)
+
+
+async def _send_async(method: str, url: str, *, timeout: float, **kwargs: Any) -> httpx.Response:
+    client = _get_async_http_client()
+    started_at = _request_started()
+    response: Optional[httpx.Response] = None
+    try:
+        response = await client.request(method, url, timeout=timeout, **kwargs)
+        return response
+    finally:
+        _request_finished(started_at, response)
+
+
+def _request(method: str, url: str, *, timeout: float, storage: bool = False, **options: Any) -> SupabaseRequest:
+    return SupabaseRequest(method, url, timeout, storage, options)
+
+
+def _call(fn: Callable[..., Any], *args: Any) -> SupabaseCall:
+    return SupabaseCall(fn, args)
+
+
+def _send_request(request: SupabaseRequest) -> httpx.Response:
+    if not request.storage:
+        return _send(request.method, request.url, timeout=request.timeout, **request.options)
+    with STORAGE_IO_SEMAPHORE:
+        return _send(request.method, request.url, timeout=request.timeout, **request.options)
+
+
+async def _send_request_async(request: SupabaseRequest) -> httpx.Response:
+    if not request.storage:
+        return await _send_async(request.method, request.url, timeout=request.timeout, **request.options)
+    _get_async_http_client()
+    async with STORAGE_IO_ASYNC_SEMAPHORE:
+        return await _send_async(request.method, request.url, timeout=request.timeout, **request.options)
+
+
+def _run_plan(plan: SupabasePlan[T]) -> T:
+    try:
+        request = next(plan)
+        while True:
+            try:
+                if isinstance(request, SupabaseCall):
+                    response = request.fn(*request.args)
+                else:
+                    response = _send_request(request)
+            except Exception as exc:
+                # Raise at the helper's yield so its own except clauses map the failure.
+                request = plan.throw(exc)
+            else:
+                request = plan.send(response)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def _run_plan_async(plan: SupabasePlan[T]) -> T:
+    try:
+        request = next(plan)
+        while True:
+            try:
+                if isinstance(request, SupabaseCall):
+                    response = await run_in_pool("io", request.fn, *request.args)
+                else:
+                    response = await _send_request_async(request)
+            except Exception as exc:
+                request = plan.throw(exc)
+            else:
+                request = plan.send(response)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _start_http_client() -> None:
+    _get_http_client()
+
+
+def _close_http_client() -> None:
+    global SUPABASE_HTTP_CLIENT
+    with SUPABASE_HTTP_CLIENT_LOCK:
+        client, SUPABASE_HTTP_CLIENT = SUPABASE_HTTP_CLIENT, None
+    if client is not None:
+        client.close()
+        logger.info("[HTTP] client_closed")
+
+
+async def _close_async_http_client() -> None:
+    global SUPABASE_ASYNC_CLIENT, SUPABASE_ASYNC_LOOP, STORAGE_IO_ASYNC_SEMAPHORE
+    client, loop = SUPABASE_ASYNC_CLIENT, SUPABASE_ASYNC_LOOP
+    SUPABASE_ASYNC_CLIENT, SUPABASE_ASYNC_LOOP, STORAGE_IO_ASYNC_SEMAPHORE = None, None, None
+    # A client opened on another loop cannot be closed from this one; its sockets go with that loop.
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+        logger.info("[HTTP] async_client_closed")
+
+
+def _pool_connection_counts(client: Any) -> Dict[str, Optional[int]]:
+    # httpx does not expose pool state publicly; report it best-effort from the httpcore pool.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    try:
+        connections = list(getattr(pool, "connections", []) or [])
+        return {
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for connection in connections if connection.is_idle()),
+        }
+    except Exception:
+        return {"open_connections": None, "idle_connections": None}
+
+
+def _http_client_metrics() -> Dict[str, Any]:
+    with SUPABASE_HTTP_METRICS_LOCK:
+        snapshot: Dict[str, Any] = {
+            key: round(value, 3) if isinstance(value, float) else value for key, value in SUPABASE_HTTP_METRICS.items()
+        }
+    finished = snapshot["requests"] - snapshot["in_flight"]
+    snapshot["mean_ms"] = round(snapshot["total_ms"] / finished, 3) if finished else 0.0
+    snapshot["http2"] = SUPABASE_HTTP2
+    snapshot["max_connections"] = SUPABASE_HTTP_MAX_CONNECTIONS
+    snapshot["max_keepalive_connections"] = SUPABASE_HTTP_MAX_KEEPALIVE
+    snapshot.update(_pool_connection_counts(SUPABASE_HTTP_CLIENT))
+    snapshot["async"] = _pool_connection_counts(SUPABASE_ASYNC_CLIENT)
+    return snapshot
+
+
+def _fetch_recording_by_id_plan(record_id: str) -> SupabasePlan[Dict[str, Any]]:
     config = _get_supabase_config()
     logger.info("[FETCH] start record_id=%s", record_id)
     select_fields = ",".join(
@@ -83,10 +356,9 @@ def _fetch_recording_by_id(record_id: str) -> Dict[str, Any]:
     headers = _supabase_headers(json_content=False)
     headers["Accept"] = "application/json"
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("GET", url, headers=headers, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[FETCH] record_http_error record_id=%s status=%s body=%s",
@@ -112,7 +384,15 @@ def _fetch_recording_by_id(record_id: str) -> Dict[str, Any]:
     return data[0]
 
 
-def _fetch_latest_recording_id() -> Optional[str]:
+def _fetch_recording_by_id(record_id: str) -> Dict[str, Any]:
+    return _run_plan(_fetch_recording_by_id_plan(record_id))
+
+
+async def _fetch_recording_by_id_async(record_id: str) -> Dict[str, Any]:
+    return await _run_plan_async(_fetch_recording_by_id_plan(record_id))
+
+
+def _fetch_latest_recording_id_plan() -> SupabasePlan[Optional[str]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_recordings"
     params = {
@@ -123,10 +403,9 @@ def _fetch_latest_recording_id() -> Optional[str]:
     headers = _supabase_headers(json_content=False)
     headers["Accept"] = "application/json"
     try:
-        with httpx.Client(timeout=15) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("GET", url, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
     except Exception as exc:  # pragma: no cover - safeguard
         logger.error("[FETCH] latest_record_failed error=%s", exc)
         return None
@@ -135,7 +414,15 @@ def _fetch_latest_recording_id() -> Optional[str]:
     return data[0].get("id")
 
 
-def _fetch_storage_bytes(object_key: str) -> bytes:
+def _fetch_latest_recording_id() -> Optional[str]:
+    return _run_plan(_fetch_latest_recording_id_plan())
+
+
+async def _fetch_latest_recording_id_async() -> Optional[str]:
+    return await _run_plan_async(_fetch_latest_recording_id_plan())
+
+
+def _fetch_storage_bytes_plan(object_key: str, timeout: float = 60) -> SupabasePlan[bytes]:
     config = _get_supabase_config()
     normalized_object_key = (object_key or "").lstrip("/")
     encoded_object_key = quote(normalized_object_key, safe="/")
@@ -144,17 +431,26 @@ def _fetch_storage_bytes(object_key: str) -> bytes:
         "apikey": config["key"],
         "Authorization": f"Bearer {config['key']}",
     }
+    cached = yield _call(lookup_object, normalized_object_key)
+    if cached is not None and cached.fresh:
+        return cached.payload
+    if cached is not None and cached.etag:
+        headers["If-None-Match"] = cached.etag
     logger.info(
-        "[FETCH] storage raw_object_key=%r normalized_object_key=%r url=%s",
+        "[FETCH] storage raw_object_key=%r normalized_object_key=%r url=%s revalidate=%s",
         object_key,
         normalized_object_key,
         url,
+        cached is not None,
     )
     try:
-        with httpx.Client(timeout=60) as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.content
+        response = yield _request("GET", url, headers=headers, timeout=timeout, storage=True)
+        if cached is not None and response.status_code == 304:
+            mark_validated(normalized_object_key, cached)
+            return cached.payload
+        response.raise_for_status()
+        yield _call(store_object, normalized_object_key, response.content, response.headers.get("etag"))
+        return response.content
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[FETCH] storage_http_error raw_object_key=%r normalized_object_key=%r url=%s status=%s body=%s",
@@ -182,8 +478,179 @@ def _fetch_storage_bytes(object_key: str) -> bytes:
         ) from exc
 
 
-def _fetch_storage_json(object_key: str) -> Dict[str, Any]:
-    payload = _fetch_storage_bytes(object_key)
+def _fetch_storage_bytes(object_key: str) -> bytes:
+    return _run_plan(_fetch_storage_bytes_plan(object_key))
+
+
+async def _fetch_storage_bytes_async(object_key: str) -> bytes:
+    return await _run_plan_async(_fetch_storage_bytes_plan(object_key))
+
+
+def _count_hedge(won: bool) -> None:
+    with SUPABASE_HTTP_METRICS_LOCK:
+        SUPABASE_HTTP_METRICS["hedge_wins" if won else "hedged"] += 1
+
+
+def _first_successful_attempt(attempts: List[Future]) -> bytes:
+    pending = set(attempts)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                if future is not attempts[0]:
+                    _count_hedge(True)
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+async def _fetch_storage_object_hedged_async(object_key: str, timeout: float, hedge_after_s: Optional[float]) -> bytes:
+    first = asyncio.ensure_future(_run_plan_async(_fetch_storage_bytes_plan(object_key, timeout)))
+    if hedge_after_s is None:
+        return await first
+    done, _ = await asyncio.wait({first}, timeout=hedge_after_s)
+    if done:
+        return first.result()
+    _count_hedge(False)
+    hedge = asyncio.ensure_future(_run_plan_async(_fetch_storage_bytes_plan(object_key, timeout)))
+    pending = {first, hedge}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        _count_hedge(True)
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _fetch_storage_objects(
+    object_keys: Sequence[str],
+    *,
+    timeout: float = 60,
+    hedge_after_s: Optional[float] = None,
+) -> Dict[str, bytes]:
+    # Downloads run side by side on the io pool, so the caller waits for the slowest object, not the sum.
+    keys = list(dict.fromkeys(object_keys))
+    if current_pool() == "io":
+        # An io worker waiting on its own pool could wait forever once every worker does the same.
+        return {object_key: _run_plan(_fetch_storage_bytes_plan(object_key, timeout)) for object_key in keys}
+    attempts: Dict[str, List[Future]] = {
+        object_key: [submit("io", _run_plan, _fetch_storage_bytes_plan(object_key, timeout))] for object_key in keys
+    }
+    try:
+        if hedge_after_s is not None:
+            wait([futures[0] for futures in attempts.values()], timeout=hedge_after_s)
+            for object_key, futures in attempts.items():
+                if not futures[0].done():
+                    _count_hedge(False)
+                    futures.append(submit("io", _run_plan, _fetch_storage_bytes_plan(object_key, timeout)))
+        return {object_key: _first_successful_attempt(futures) for object_key, futures in attempts.items()}
+    finally:
+        # Sync requests cannot be interrupted; losing attempts that already started finish and are dropped.
+        for futures in attempts.values():
+            for future in futures:
+                future.cancel()
+
+
+async def _fetch_storage_objects_async(
+    object_keys: Sequence[str],
+    *,
+    timeout: float = 60,
+    hedge_after_s: Optional[float] = None,
+) -> Dict[str, bytes]:
+    keys = list(dict.fromkeys(object_keys))
+    payloads = await asyncio.gather(
+        *(_fetch_storage_object_hedged_async(object_key, timeout, hedge_after_s) for object_key in keys)
+    )
+    return dict(zip(keys, payloads))
+
+
+def _fetch_storage_range_plan(object_key: str, start: int, end: int) -> SupabasePlan[bytes]:
+    # `end` is exclusive; HTTP ranges are inclusive.
+    if end <= start:
+        return b""
+    cached = yield _call(lookup_object, (object_key or "").lstrip("/"))
+    if cached is not None and cached.fresh:
+        return cached.payload[start:end]
+    config = _get_supabase_config()
+    encoded_object_key = quote((object_key or "").lstrip("/"), safe="/")
+    url = f"{config['url']}/storage/v1/object/{config['bucket']}/{encoded_object_key}"
+    headers = {
+        "apikey": config["key"],
+        "Authorization": f"Bearer {config['key']}",
+        "Range": f"bytes={start}-{end - 1}",
+    }
+    try:
+        response = yield _request("GET", url, headers=headers, timeout=60, storage=True)
+        if response.status_code == 416:
+            return b""
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            "[FETCH] storage_range_http_error object_key=%s range=%s-%s status=%s body=%s",
+            object_key,
+            start,
+            end,
+            exc.response.status_code,
+            exc.response.text,
+        )
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase Storage error: {exc.response.status_code} {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        logger.error("[FETCH] storage_range_request_error object_key=%s range=%s-%s error=%s", object_key, start, end, exc)
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase Storage unreachable: {exc}",
+        ) from exc
+    if response.status_code == 206:
+        return response.content
+    # Server ignored the Range header and sent the whole object.
+    return response.content[start:end]
+
+
+def _fetch_storage_range(object_key: str, start: int, end: int) -> bytes:
+    return _run_plan(_fetch_storage_range_plan(object_key, start, end))
+
+
+async def _fetch_storage_range_async(object_key: str, start: int, end: int) -> bytes:
+    return await _run_plan_async(_fetch_storage_range_plan(object_key, start, end))
+
+
+def _storage_object_exists_plan(object_key: str) -> SupabasePlan[bool]:
+    config = _get_supabase_config()
+    encoded_object_key = quote((object_key or "").lstrip("/"), safe="/")
+    url = f"{config['url']}/storage/v1/object/{config['bucket']}/{encoded_object_key}"
+    headers = {
+        "apikey": config["key"],
+        "Authorization": f"Bearer {config['key']}",
+    }
+    try:
+        response = yield _request("HEAD", url, headers=headers, timeout=15, storage=True)
+    except httpx.RequestError as exc:
+        logger.error("[FETCH] storage_head_error object_key=%s error=%s", object_key, exc)
+        return False
+    return response.status_code == 200
+
+
+def _storage_object_exists(object_key: str) -> bool:
+    return _run_plan(_storage_object_exists_plan(object_key))
+
+
+async def _storage_object_exists_async(object_key: str) -> bool:
+    return await _run_plan_async(_storage_object_exists_plan(object_key))
+
+
+def _decode_storage_json(object_key: str, payload: bytes) -> Dict[str, Any]:
     try:
         return json.loads(payload.decode("utf-8"))
     except Exception as exc:
@@ -194,7 +661,20 @@ def _fetch_storage_json(object_key: str) -> Dict[str, Any]:
         ) from exc
 
 
-def _upload_storage_bytes(object_key: str, payload: bytes) -> None:
+def _fetch_storage_json_plan(object_key: str) -> SupabasePlan[Dict[str, Any]]:
+    payload = yield from _fetch_storage_bytes_plan(object_key)
+    return _decode_storage_json(object_key, payload)
+
+
+def _fetch_storage_json(object_key: str) -> Dict[str, Any]:
+    return _run_plan(_fetch_storage_json_plan(object_key))
+
+
+async def _fetch_storage_json_async(object_key: str) -> Dict[str, Any]:
+    return await _run_plan_async(_fetch_storage_json_plan(object_key))
+
+
+def _upload_storage_bytes_plan(object_key: str, payload: bytes) -> SupabasePlan[None]:
     config = _get_supabase_config()
     url = f"{config['url']}/storage/v1/object/{config['bucket']}/{object_key}"
     headers = {
@@ -204,9 +684,9 @@ def _upload_storage_bytes(object_key: str, payload: bytes) -> None:
         "x-upsert": "true",
     }
     try:
-        with httpx.Client(timeout=60) as client:
-            response = client.post(url, headers=headers, content=payload)
-            response.raise_for_status()
+        response = yield _request("POST", url, headers=headers, content=payload, timeout=60, storage=True)
+        response.raise_for_status()
+        yield _call(object_written, object_key.lstrip("/"), payload)
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[UPLOAD] storage_http_error object_key=%s status=%s body=%s",
@@ -226,7 +706,15 @@ def _upload_storage_bytes(object_key: str, payload: bytes) -> None:
         ) from exc
 
 
-def _upload_storage_json(object_key: str, payload: Dict[str, Any]) -> None:
+def _upload_storage_bytes(object_key: str, payload: bytes) -> None:
+    _run_plan(_upload_storage_bytes_plan(object_key, payload))
+
+
+async def _upload_storage_bytes_async(object_key: str, payload: bytes) -> None:
+    await _run_plan_async(_upload_storage_bytes_plan(object_key, payload))
+
+
+def _upload_storage_json_plan(object_key: str, payload: Dict[str, Any]) -> SupabasePlan[None]:
     config = _get_supabase_config()
     url = f"{config['url']}/storage/v1/object/{config['bucket']}/{object_key}"
     headers = {
@@ -237,9 +725,9 @@ def _upload_storage_json(object_key: str, payload: Dict[str, Any]) -> None:
     }
     body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
     try:
-        with httpx.Client(timeout=60) as client:
-            response = client.post(url, headers=headers, content=body)
-            response.raise_for_status()
+        response = yield _request("POST", url, headers=headers, content=body, timeout=60, storage=True)
+        response.raise_for_status()
+        yield _call(object_written, object_key.lstrip("/"), body)
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[UPLOAD] storage_json_http_error object_key=%s status=%s body=%s",
@@ -259,16 +747,71 @@ def _upload_storage_json(object_key: str, payload: Dict[str, Any]) -> None:
         ) from exc
 
 
-def _insert_recording_row(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _upload_storage_json(object_key: str, payload: Dict[str, Any]) -> None:
+    _run_plan(_upload_storage_json_plan(object_key, payload))
+
+
+def _delete_storage_objects_plan(object_keys: List[str]) -> SupabasePlan[None]:
+    if not object_keys:
+        return
+    config = _get_supabase_config()
+    url = f"{config['url']}/storage/v1/object/{config['bucket']}"
+    headers = _supabase_headers(json_content=True)
+    normalized_object_keys = [object_key.lstrip("/") for object_key in object_keys]
+    # Dropped up front: the objects are stale whether or not the delete gets through.
+    for object_key in normalized_object_keys:
+        yield _call(invalidate_object, object_key)
+    try:
+        # One bulk request; Storage skips keys that are already gone.
+        response = yield _request(
+            "DELETE",
+            url,
+            headers=headers,
+            json={"prefixes": normalized_object_keys},
+            timeout=60,
+            storage=True,
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            "[DELETE] storage_http_error objects=%s status=%s body=%s",
+            len(object_keys),
+            exc.response.status_code,
+            exc.response.text,
+        )
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase Storage delete error: {exc.response.status_code} {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        logger.error("[DELETE] storage_request_error objects=%s error=%s", len(object_keys), exc)
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase Storage delete unreachable: {exc}",
+        ) from exc
+
+
+def _delete_storage_objects(object_keys: List[str]) -> None:
+    _run_plan(_delete_storage_objects_plan(object_keys))
+
+
+async def _delete_storage_objects_async(object_keys: List[str]) -> None:
+    await _run_plan_async(_delete_storage_objects_plan(object_keys))
+
+
+async def _upload_storage_json_async(object_key: str, payload: Dict[str, Any]) -> None:
+    await _run_plan_async(_upload_storage_json_plan(object_key, payload))
+
+
+def _insert_recording_row_plan(payload: Dict[str, Any]) -> SupabasePlan[Dict[str, Any]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_recordings"
     headers = _supabase_headers(json_content=True)
     headers["Prefer"] = "return=representation"
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("POST", url, headers=headers, json=payload, timeout=30)
+        response.raise_for_status()
+        data = response.json()
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[DB] insert_http_error table=ecg_recordings status=%s body=%s",
@@ -291,15 +834,22 @@ def _insert_recording_row(payload: Dict[str, Any]) -> Dict[str, Any]:
     return data[0]
 
 
-def _update_recording_row(record_id: str, payload: Dict[str, Any]) -> None:
+def _insert_recording_row(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return _run_plan(_insert_recording_row_plan(payload))
+
+
+async def _insert_recording_row_async(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return await _run_plan_async(_insert_recording_row_plan(payload))
+
+
+def _update_recording_row_plan(record_id: str, payload: Dict[str, Any]) -> SupabasePlan[None]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_recordings?id=eq.{record_id}"
     headers = _supabase_headers(json_content=True)
     headers["Prefer"] = "return=minimal"
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.patch(url, headers=headers, json=payload)
-            response.raise_for_status()
+        response = yield _request("PATCH", url, headers=headers, json=payload, timeout=30)
+        response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[DB] update_http_error table=ecg_recordings record_id=%s status=%s body=%s",
@@ -319,16 +869,23 @@ def _update_recording_row(record_id: str, payload: Dict[str, Any]) -> None:
         ) from exc
 
 
-def _upsert_table_row(table: str, payload: Dict[str, Any], conflict_columns: str) -> List[Dict[str, Any]]:
+def _update_recording_row(record_id: str, payload: Dict[str, Any]) -> None:
+    _run_plan(_update_recording_row_plan(record_id, payload))
+
+
+async def _update_recording_row_async(record_id: str, payload: Dict[str, Any]) -> None:
+    await _run_plan_async(_update_recording_row_plan(record_id, payload))
+
+
+def _upsert_table_row_plan(table: str, payload: Dict[str, Any], conflict_columns: str) -> SupabasePlan[List[Dict[str, Any]]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/{table}?on_conflict={conflict_columns}"
     headers = _supabase_headers(json_content=True)
     headers["Prefer"] = "return=representation,resolution=merge-duplicates"
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json() or []
+        response = yield _request("POST", url, headers=headers, json=payload, timeout=30)
+        response.raise_for_status()
+        return response.json() or []
     except httpx.HTTPStatusError as exc:
         logger.error(
             "[DB] upsert_http_error table=%s status=%s body=%s",
@@ -348,7 +905,216 @@ def _upsert_table_row(table: str, payload: Dict[str, Any], conflict_columns: str
         ) from exc
 
 
-def _fetch_processed_record(record_id: str) -> Optional[Dict[str, Any]]:
+def _upsert_table_row(table: str, payload: Dict[str, Any], conflict_columns: str) -> List[Dict[str, Any]]:
+    return _run_plan(_upsert_table_row_plan(table, payload, conflict_columns))
+
+
+async def _upsert_table_row_async(table: str, payload: Dict[str, Any], conflict_columns: str) -> List[Dict[str, Any]]:
+    return await _run_plan_async(_upsert_table_row_plan(table, payload, conflict_columns))
+
+
+def _upsert_table_rows_plan(table: str, rows: List[Dict[str, Any]], conflict_columns: str) -> SupabasePlan[None]:
+    config = _get_supabase_config()
+    url = f"{config['url']}/rest/v1/{table}?on_conflict={conflict_columns}"
+    headers = _supabase_headers(json_content=True)
+    # PostgREST inserts a JSON array as one statement; skip echoing the rows back.
+    headers["Prefer"] = "return=minimal,resolution=merge-duplicates"
+    try:
+        response = yield _request("POST", url, headers=headers, json=rows, timeout=30)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            "[DB] bulk_upsert_http_error table=%s rows=%s status=%s body=%s",
+            table,
+            len(rows),
+            exc.response.status_code,
+            exc.response.text,
+        )
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase upsert error ({table}): {exc.response.status_code} {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        logger.error("[DB] bulk_upsert_request_error table=%s rows=%s error=%s", table, len(rows), exc)
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase upsert unreachable ({table}): {exc}",
+        ) from exc
+
+
+def _upsert_table_rows(table: str, rows: List[Dict[str, Any]], conflict_columns: str) -> None:
+    _run_plan(_upsert_table_rows_plan(table, rows, conflict_columns))
+
+
+async def _upsert_table_rows_async(table: str, rows: List[Dict[str, Any]], conflict_columns: str) -> None:
+    await _run_plan_async(_upsert_table_rows_plan(table, rows, conflict_columns))
+
+
+def _fetch_table_rows_plan(table: str, params: Dict[str, Any], page_size: int = 1000) -> SupabasePlan[List[Dict[str, Any]]]:
+    config = _get_supabase_config()
+    url = f"{config['url']}/rest/v1/{table}"
+    headers = _supabase_headers(json_content=False)
+    headers["Accept"] = "application/json"
+    rows: List[Dict[str, Any]] = []
+    offset = 0
+    try:
+        while True:
+            response = yield _request(
+                "GET",
+                url,
+                headers=headers,
+                params={**params, "limit": page_size, "offset": offset},
+                timeout=30,
+            )
+            response.raise_for_status()
+            page = response.json() or []
+            rows.extend(page)
+            if len(page) < page_size:
+                break
+            offset += page_size
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            "[DB] list_http_error table=%s status=%s body=%s",
+            table,
+            exc.response.status_code,
+            exc.response.text,
+        )
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase REST error ({table}): {exc.response.status_code} {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        logger.error("[DB] list_request_error table=%s error=%s", table, exc)
+        raise HTTPException(
+            status_code=502,
+            detail=f"Supabase REST unreachable ({table}): {exc}",
+        ) from exc
+    return rows
+
+
+def _fetch_table_rows(table: str, params: Dict[str, Any], page_size: int = 1000) -> List[Dict[str, Any]]:
+    return _run_plan(_fetch_table_rows_plan(table, params, page_size))
+
+
+async def _fetch_table_rows_async(table: str, params: Dict[str, Any], page_size: int = 1000) -> List[Dict[str, Any]]:
+    return await _run_plan_async(_fetch_table_rows_plan(table, params, page_size))
+
+
+def _fetch_processable_recording_ids_plan() -> SupabasePlan[List[str]]:
+    rows = yield from _fetch_table_rows_plan(
+        "ecg_recordings",
+        {
+            "select": "id",
+            "session_object_key": "not.is.null",
+            "calibration_object_key": "not.is.null",
+            "order": "created_at.asc,id.asc",
+        },
+    )
+    return [str(row["id"]) for row in rows if row.get("id")]
+
+
+def _fetch_processable_recording_ids() -> List[str]:
+    return _run_plan(_fetch_processable_recording_ids_plan())
+
+
+async def _fetch_processable_recording_ids_async() -> List[str]:
+    return await _run_plan_async(_fetch_processable_recording_ids_plan())
+
+
+def _fetch_processed_record_ids_plan(stale_only: bool = False) -> SupabasePlan[List[str]]:
+    params: Dict[str, Any] = {"select": "record_id", "order": "record_id.asc"}
+    if stale_only:
+        params["or"] = f"(processing_version.neq.{REVIEW_PROCESSING_VERSION},status.neq.ready)"
+    rows = yield from _fetch_table_rows_plan("ecg_processed_records", params)
+    return [str(row["record_id"]) for row in rows if row.get("record_id")]
+
+
+def _fetch_processed_record_ids(stale_only: bool = False) -> List[str]:
+    return _run_plan(_fetch_processed_record_ids_plan(stale_only))
+
+
+async def _fetch_processed_record_ids_async(stale_only: bool = False) -> List[str]:
+    return await _run_plan_async(_fetch_processed_record_ids_plan(stale_only))
+
+
+def _fetch_busy_processed_record_ids_plan(updated_since: str) -> SupabasePlan[List[str]]:
+    # Rows marked processing on the current version since `updated_since`; older ones were abandoned.
+    rows = yield from _fetch_table_rows_plan(
+        "ecg_processed_records",
+        {
+            "select": "record_id",
+            "status": "eq.processing",
+            "processing_version": f"eq.{REVIEW_PROCESSING_VERSION}",
+            "updated_at": f"gte.{updated_since}",
+            "order": "record_id.asc",
+        },
+    )
+    return [str(row["record_id"]) for row in rows if row.get("record_id")]
+
+
+def _fetch_busy_processed_record_ids(updated_since: str) -> List[str]:
+    return _run_plan(_fetch_busy_processed_record_ids_plan(updated_since))
+
+
+async def _fetch_busy_processed_record_ids_async(updated_since: str) -> List[str]:
+    return await _run_plan_async(_fetch_busy_processed_record_ids_plan(updated_since))
+
+
+def _fetch_processed_artifact_record_ids_plan(
+    artifact_type: str,
+    processing_version: str,
+    stale_only: bool = False,
+) -> SupabasePlan[List[str]]:
+    # stale_only selects artifacts written by any other processing version.
+    rows = yield from _fetch_table_rows_plan(
+        "ecg_processed_artifacts",
+        {
+            "select": "record_id",
+            "artifact_type": f"eq.{artifact_type}",
+            "processing_version": f"{'neq' if stale_only else 'eq'}.{processing_version}",
+            "order": "record_id.asc",
+        },
+    )
+    return [str(row["record_id"]) for row in rows if row.get("record_id")]
+
+
+def _fetch_processed_artifact_record_ids(
+    artifact_type: str,
+    processing_version: str,
+    stale_only: bool = False,
+) -> List[str]:
+    return _run_plan(_fetch_processed_artifact_record_ids_plan(artifact_type, processing_version, stale_only))
+
+
+async def _fetch_processed_artifact_record_ids_async(
+    artifact_type: str,
+    processing_version: str,
+    stale_only: bool = False,
+) -> List[str]:
+    return await _run_plan_async(_fetch_processed_artifact_record_ids_plan(artifact_type, processing_version, stale_only))
+
+
+def _fetch_session_chunk_rows_plan(record_id: str) -> SupabasePlan[List[Dict[str, Any]]]:
+    rows = yield from _fetch_table_rows_plan(
+        "ecg_session_chunks",
+        {
+            "select": "chunk_index,object_key,byte_offset,byte_length,packet_count",
+            "record_id": f"eq.{record_id}",
+            "order": "chunk_index.asc",
+        },
+    )
+    return rows
+
+
+def _fetch_session_chunk_rows(record_id: str) -> List[Dict[str, Any]]:
+    return _run_plan(_fetch_session_chunk_rows_plan(record_id))
+
+
+async def _fetch_session_chunk_rows_async(record_id: str) -> List[Dict[str, Any]]:
+    return await _run_plan_async(_fetch_session_chunk_rows_plan(record_id))
+
+
+def _fetch_processed_record_plan(record_id: str) -> SupabasePlan[Optional[Dict[str, Any]]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_processed_records"
     params = {
@@ -359,22 +1125,34 @@ def _fetch_processed_record(record_id: str) -> Optional[Dict[str, Any]]:
     headers = _supabase_headers(json_content=False)
     headers["Accept"] = "application/json"
     try:
-        with httpx.Client(timeout=15) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("GET", url, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
     except Exception as exc:  # pragma: no cover - safeguard
         logger.error("[PROCESSING] fetch_record failed record_id=%s error=%s", record_id, exc)
         return None
     return data[0] if data else None
 
 
-def _upsert_processed_record(
+def _fetch_processed_record(record_id: str) -> Optional[Dict[str, Any]]:
+    return _run_plan(_fetch_processed_record_plan(record_id))
+
+
+async def _fetch_processed_record_async(record_id: str) -> Optional[Dict[str, Any]]:
+    return await _run_plan_async(_fetch_processed_record_plan(record_id))
+
+
+def _invalidate_processed_metadata(record_id: str) -> None:
+    with PROCESSED_METADATA_LOCK:
+        PROCESSED_METADATA_CACHE.pop(record_id, None)
+
+
+def _upsert_processed_record_plan(
     record_id: str,
     status: str,
     error_message: Optional[str] = None,
-) -> None:
-    _upsert_table_row(
+) -> SupabasePlan[None]:
+    yield from _upsert_table_row_plan(
         "ecg_processed_records",
         {
             "record_id": record_id,
@@ -385,9 +1163,26 @@ def _upsert_processed_record(
         },
         "record_id",
     )
+    _invalidate_processed_metadata(record_id)
 
 
-def _fetch_processed_artifact_key(record_id: str, artifact_type: str) -> Optional[str]:
+def _upsert_processed_record(
+    record_id: str,
+    status: str,
+    error_message: Optional[str] = None,
+) -> None:
+    _run_plan(_upsert_processed_record_plan(record_id, status, error_message))
+
+
+async def _upsert_processed_record_async(
+    record_id: str,
+    status: str,
+    error_message: Optional[str] = None,
+) -> None:
+    await _run_plan_async(_upsert_processed_record_plan(record_id, status, error_message))
+
+
+def _fetch_processed_artifact_key_plan(record_id: str, artifact_type: str) -> SupabasePlan[Optional[str]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_processed_artifacts"
     params = {
@@ -399,10 +1194,9 @@ def _fetch_processed_artifact_key(record_id: str, artifact_type: str) -> Optiona
     headers = _supabase_headers(json_content=False)
     headers["Accept"] = "application/json"
     try:
-        with httpx.Client(timeout=15) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("GET", url, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
     except Exception as exc:  # pragma: no cover - safeguard
         logger.error(
             "[PROCESSING] fetch_artifact failed record_id=%s artifact_type=%s error=%s",
@@ -423,37 +1217,170 @@ def _fetch_processed_artifact_key(record_id: str, artifact_type: str) -> Optiona
     return object_key
 
 
-def _upsert_processed_artifact(record_id: str, artifact_type: str, object_key: str) -> None:
-    _upsert_table_row(
+def _fetch_processed_artifact_key(record_id: str, artifact_type: str) -> Optional[str]:
+    return _run_plan(_fetch_processed_artifact_key_plan(record_id, artifact_type))
+
+
+async def _fetch_processed_artifact_key_async(record_id: str, artifact_type: str) -> Optional[str]:
+    return await _run_plan_async(_fetch_processed_artifact_key_plan(record_id, artifact_type))
+
+
+def _fetch_processed_metadata_plan(record_id: str) -> SupabasePlan[Optional[Dict[str, Any]]]:
+    with PROCESSED_METADATA_LOCK:
+        cached = PROCESSED_METADATA_CACHE.get(record_id)
+    if cached is not None and time.monotonic() - cached[0] < PROCESSED_METADATA_CACHE_TTL_S:
+        return cached[1]
+    config = _get_supabase_config()
+    url = f"{config['url']}/rest/v1/ecg_recordings"
+    # Both tables reference ecg_recordings, so one embedded select returns the processed row and every artifact key.
+    params = {
+        "id": f"eq.{record_id}",
+        "select": (
+            "id,"
+            "ecg_processed_records(record_id,status,processing_version,updated_at,error_message),"
+            "ecg_processed_artifacts(artifact_type,object_key,processing_version,updated_at)"
+        ),
+        "limit": 1,
+    }
+    headers = _supabase_headers(json_content=False)
+    headers["Accept"] = "application/json"
+    try:
+        response = yield _request("GET", url, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+    except Exception as exc:  # pragma: no cover - safeguard
+        logger.error("[PROCESSING] fetch_metadata failed record_id=%s error=%s", record_id, exc)
+        return None
+    if not data:
+        return None
+    processed = data[0].get("ecg_processed_records")
+    # One-to-one embeds come back as an object; older PostgREST versions return a list.
+    if isinstance(processed, list):
+        processed = processed[0] if processed else None
+    metadata = {
+        "processed": processed,
+        "artifact_keys": {
+            row["artifact_type"]: row["object_key"]
+            for row in data[0].get("ecg_processed_artifacts") or []
+            if row.get("artifact_type") and row.get("object_key")
+        },
+    }
+    with PROCESSED_METADATA_LOCK:
+        PROCESSED_METADATA_CACHE[record_id] = (time.monotonic(), metadata)
+    return metadata
+
+
+def _fetch_processed_metadata(record_id: str) -> Optional[Dict[str, Any]]:
+    return _run_plan(_fetch_processed_metadata_plan(record_id))
+
+
+async def _fetch_processed_metadata_async(record_id: str) -> Optional[Dict[str, Any]]:
+    return await _run_plan_async(_fetch_processed_metadata_plan(record_id))
+
+
+def _upsert_processed_artifact_plan(
+    record_id: str,
+    artifact_type: str,
+    object_key: str,
+    processing_version: str = REVIEW_PROCESSING_VERSION,
+) -> SupabasePlan[None]:
+    yield from _upsert_table_row_plan(
         "ecg_processed_artifacts",
         {
             "record_id": record_id,
             "artifact_type": artifact_type,
             "object_key": object_key,
-            "processing_version": REVIEW_PROCESSING_VERSION,
+            "processing_version": processing_version,
             "updated_at": _sg_now_iso(),
         },
         "record_id,artifact_type",
     )
+    _invalidate_processed_metadata(record_id)
 
 
-def _insert_session_chunk_row(payload: Dict[str, Any]) -> None:
-    _upsert_table_row(
+def _upsert_processed_artifact(
+    record_id: str,
+    artifact_type: str,
+    object_key: str,
+    processing_version: str = REVIEW_PROCESSING_VERSION,
+) -> None:
+    _run_plan(_upsert_processed_artifact_plan(record_id, artifact_type, object_key, processing_version))
+
+
+async def _upsert_processed_artifact_async(
+    record_id: str,
+    artifact_type: str,
+    object_key: str,
+    processing_version: str = REVIEW_PROCESSING_VERSION,
+) -> None:
+    await _run_plan_async(_upsert_processed_artifact_plan(record_id, artifact_type, object_key, processing_version))
+
+
+def _insert_session_chunk_row_plan(payload: Dict[str, Any]) -> SupabasePlan[None]:
+    yield from _upsert_table_row_plan(
         "ecg_session_chunks",
         payload,
         "record_id,chunk_index",
     )
 
 
-def _upsert_live_preview_row(payload: Dict[str, Any]) -> None:
-    _upsert_table_row(
+def _insert_session_chunk_row(payload: Dict[str, Any]) -> None:
+    _run_plan(_insert_session_chunk_row_plan(payload))
+
+
+async def _insert_session_chunk_row_async(payload: Dict[str, Any]) -> None:
+    await _run_plan_async(_insert_session_chunk_row_plan(payload))
+
+
+def _insert_session_chunk_rows_plan(rows: List[Dict[str, Any]]) -> SupabasePlan[None]:
+    yield from _upsert_table_rows_plan(
+        "ecg_session_chunks",
+        rows,
+        "record_id,chunk_index",
+    )
+
+
+def _insert_session_chunk_rows(rows: List[Dict[str, Any]]) -> None:
+    _run_plan(_insert_session_chunk_rows_plan(rows))
+
+
+async def _insert_session_chunk_rows_async(rows: List[Dict[str, Any]]) -> None:
+    await _run_plan_async(_insert_session_chunk_rows_plan(rows))
+
+
+def _upsert_live_preview_row_plan(payload: Dict[str, Any]) -> SupabasePlan[None]:
+    yield from _upsert_table_row_plan(
         "ecg_live_preview",
         payload,
         "record_id",
     )
 
 
-def _fetch_live_preview_row(record_id: str) -> Optional[Dict[str, Any]]:
+def _upsert_live_preview_row(payload: Dict[str, Any]) -> None:
+    _run_plan(_upsert_live_preview_row_plan(payload))
+
+
+async def _upsert_live_preview_row_async(payload: Dict[str, Any]) -> None:
+    await _run_plan_async(_upsert_live_preview_row_plan(payload))
+
+
+def _upsert_live_preview_rows_plan(rows: List[Dict[str, Any]]) -> SupabasePlan[None]:
+    yield from _upsert_table_rows_plan(
+        "ecg_live_preview",
+        rows,
+        "record_id",
+    )
+
+
+def _upsert_live_preview_rows(rows: List[Dict[str, Any]]) -> None:
+    _run_plan(_upsert_live_preview_rows_plan(rows))
+
+
+async def _upsert_live_preview_rows_async(rows: List[Dict[str, Any]]) -> None:
+    await _run_plan_async(_upsert_live_preview_rows_plan(rows))
+
+
+def _fetch_live_preview_row_plan(record_id: str) -> SupabasePlan[Optional[Dict[str, Any]]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_live_preview"
     params = {
@@ -464,17 +1391,24 @@ def _fetch_live_preview_row(record_id: str) -> Optional[Dict[str, Any]]:
     headers = _supabase_headers(json_content=False)
     headers["Accept"] = "application/json"
     try:
-        with httpx.Client(timeout=15) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("GET", url, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
     except Exception as exc:  # pragma: no cover - safeguard
         logger.error("[PREVIEW] fetch_failed record_id=%s error=%s", record_id, exc)
         return None
     return data[0] if data else None
 
 
-def _fetch_latest_live_preview_row() -> Optional[Dict[str, Any]]:
+def _fetch_live_preview_row(record_id: str) -> Optional[Dict[str, Any]]:
+    return _run_plan(_fetch_live_preview_row_plan(record_id))
+
+
+async def _fetch_live_preview_row_async(record_id: str) -> Optional[Dict[str, Any]]:
+    return await _run_plan_async(_fetch_live_preview_row_plan(record_id))
+
+
+def _fetch_latest_live_preview_row_plan() -> SupabasePlan[Optional[Dict[str, Any]]]:
     config = _get_supabase_config()
     url = f"{config['url']}/rest/v1/ecg_live_preview"
     params = {
@@ -485,11 +1419,18 @@ def _fetch_latest_live_preview_row() -> Optional[Dict[str, Any]]:
     headers = _supabase_headers(json_content=False)
     headers["Accept"] = "application/json"
     try:
-        with httpx.Client(timeout=15) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = yield _request("GET", url, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
     except Exception as exc:  # pragma: no cover - safeguard
         logger.error("[PREVIEW] fetch_latest_failed error=%s", exc)
         return None
     return data[0] if data else None
+
+
+def _fetch_latest_live_preview_row() -> Optional[Dict[str, Any]]:
+    return _run_plan(_fetch_latest_live_preview_row_plan())
+
+
+async def _fetch_latest_live_preview_row_async() -> Optional[Dict[str, Any]]:
+    return await _run_plan_async(_fetch_latest_live_preview_row_plan())
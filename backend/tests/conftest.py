@@ -0,0 +1,24 @@
+import httpx
+import pytest
+
+import object_cache
+import supabase
+from local_backend import LocalBackendTransport
+
+
+@pytest.fixture
+def local_backend(monkeypatch, tmp_path):
+    transport = LocalBackendTransport(tmp_path)
+    monkeypatch.setattr(supabase, "STORAGE_BACKEND", "local")
+    monkeypatch.setattr(supabase, "SUPABASE_CONFIG_CACHE", None)
+    monkeypatch.setattr(supabase, "SUPABASE_HEADERS_CACHE", {})
+    monkeypatch.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=transport))
+    monkeypatch.setattr(supabase, "get_local_backend_transport", lambda: transport)
+    monkeypatch.setattr(supabase, "SUPABASE_ASYNC_CLIENT", None)
+    monkeypatch.setattr(supabase, "SUPABASE_ASYNC_LOOP", None)
+    monkeypatch.setattr(supabase, "PROCESSED_METADATA_CACHE", {})
+    monkeypatch.setattr(object_cache, "MEMORY_CACHE", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "DISK_INDEX_LOADED", True)
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_DISK_BYTES", 0)
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_REVALIDATE_S", 0.0)
+    return tmp_path
@@ -0,0 +1,51 @@
+import json
+
+import neurokit2 as nk
+import pytest
+
+import app
+from artifact_format import decode_artifact, encode_artifact, is_binary_artifact
+
+
+def _assert_close(decoded, original):
+    if isinstance(original, dict):
+        assert list(decoded) == list(original)
+        for key in original:
+            _assert_close(decoded[key], original[key])
+    elif isinstance(original, list):
+        assert len(decoded) == len(original)
+        for decoded_item, original_item in zip(decoded, original):
+            _assert_close(decoded_item, original_item)
+    elif isinstance(original, float):
+        assert decoded == pytest.approx(original, rel=1e-6, abs=1e-6)
+    else:
+        assert decoded == original and type(decoded) is type(original)
+
+
+def test_review_artifact_round_trips_through_columns():
+    samples = nk.ecg_simulate(duration=30, sampling_rate=500, random_state=1).tolist()
+    artifact = app._build_review_artifact(
+        record_id="rec-1",
+        channel="CH2",
+        calibration_key="calibration/c1.bin",
+        calibration_byte_length=2310,
+        calibration_samples=samples[:5000],
+        session_key="session/s1.bin",
+        session_byte_length=13860,
+        session_samples=samples,
+        sample_rate_hz=500,
+    )
+    payload = encode_artifact(artifact)
+
+    assert is_binary_artifact(payload)
+    assert len(payload) < len(json.dumps(artifact).encode()) / 2
+    _assert_close(decode_artifact(payload), artifact)
+
+
+def test_loader_reads_binary_and_legacy_json():
+    artifact = {"signal": {"full": [0.5] * 40, "r_peaks": list(range(40))}, "beats": {"items": [{"index": 1, "markers": {"R": [3]}}]}}
+
+    assert app._decode_review_artifact("processed/rec-1/review_ch2.npz", encode_artifact(artifact)) == artifact
+    assert app._decode_review_artifact("processed/rec-1/review_ch2.json", json.dumps(artifact).encode()) == artifact
+    with pytest.raises(app.HTTPException):
+        app._decode_review_artifact("processed/rec-1/review_ch2.npz", b"PK\x03\x04broken")
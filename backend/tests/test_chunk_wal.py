@@ -0,0 +1,173 @@
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+import chunk_wal
+import write_behind
+
+
+@pytest.fixture
+def wal_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_DIR", tmp_path)
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_ENABLED", True)
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_DRAIN_INTERVAL_S", 60.0)
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_METRICS", dict.fromkeys(chunk_wal.CHUNK_WAL_METRICS, 0))
+    # Tests drain explicitly; the drainer thread only waits to be stopped.
+    monkeypatch.setattr(chunk_wal, "_drain_loop", chunk_wal.CHUNK_WAL_STOP.wait)
+    yield tmp_path
+    chunk_wal.stop_chunk_wal()
+
+
+def _entry(index, record_id="rec-1"):
+    return {"record_id": record_id, "session_id": "s1", "chunk_index": index, "stats": {"packet_count": 1}}
+
+
+def test_appended_chunks_are_group_committed_and_shipped_in_order(wal_dir):
+    shipped = []
+
+    def ship(entry, payload):
+        shipped.append((entry["chunk_index"], payload))
+        future = Future()
+        future.set_result(None)
+        return future
+
+    chunk_wal.start_chunk_wal(lambda entry, payload: None, ship)
+    threads = [threading.Thread(target=chunk_wal.append_chunk, args=(_entry(i), bytes([i]) * 231)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = chunk_wal.chunk_wal_metrics()
+    assert metrics["appended"] == 8
+    assert 1 <= metrics["fsyncs"] <= 8
+    chunk_wal.drain_chunk_wal()
+    assert sorted(shipped) == [(i, bytes([i]) * 231) for i in range(8)]
+    assert chunk_wal.chunk_wal_metrics()["pending_segments"] == 1  # just the fresh active segment
+
+
+def test_failed_ship_keeps_segment_and_restart_replays_it(wal_dir):
+    def failing(entry, payload):
+        raise RuntimeError("storage down")
+
+    chunk_wal.start_chunk_wal(failing)
+    chunk_wal.append_chunk(_entry(0), b"a" * 231)
+    chunk_wal.append_chunk(_entry(1), b"b" * 231)
+    chunk_wal.drain_chunk_wal()
+    assert chunk_wal.chunk_wal_metrics()["ship_failures"] == 1
+    chunk_wal.stop_chunk_wal()
+    segment = sorted(wal_dir.glob("wal-*.log"))[-1]
+    # Simulate a crash halfway through a third append.
+    with segment.open("ab") as handle:
+        handle.write(chunk_wal.CHUNK_WAL_RECORD_HEADER.pack(20, 231, 0) + b"{")
+
+    shipped = []
+    chunk_wal.start_chunk_wal(lambda entry, payload: shipped.append(entry["chunk_index"]))
+    chunk_wal.drain_chunk_wal()
+
+    assert shipped == [0, 1]
+    metrics = chunk_wal.chunk_wal_metrics()
+    assert metrics["segments_replayed"] >= 1
+    assert metrics["torn_bytes_dropped"] == chunk_wal.CHUNK_WAL_RECORD_HEADER.size + 1
+    assert metrics["pending_segments"] == 1
+    assert not segment.exists()
+
+
+def test_segment_that_keeps_failing_is_quarantined_without_blocking_others(wal_dir, monkeypatch):
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_MAX_BACKOFF_S", 0.0)
+    shipped = []
+
+    def store(entry, payload):
+        if entry["record_id"] == "bad":
+            raise RuntimeError("400 invalid key")
+        shipped.append(entry["chunk_index"])
+
+    chunk_wal.start_chunk_wal(store)
+    chunk_wal.append_chunk(_entry(0, record_id="bad"), b"a" * 231)
+    chunk_wal.drain_chunk_wal()
+    chunk_wal.append_chunk(_entry(1), b"b" * 231)
+    chunk_wal.drain_chunk_wal()
+
+    assert shipped == [1]
+    metrics = chunk_wal.chunk_wal_metrics()
+    assert metrics["segments_quarantined"] == 1 and metrics["quarantined_segments"] == 1
+    assert metrics["pending_segments"] == 1
+
+
+def test_record_drain_ships_only_that_record_and_is_not_repeated(wal_dir):
+    stored = []
+    shipped = []
+
+    def store(entry, payload):
+        stored.append((entry["record_id"], entry["chunk_index"]))
+
+    def ship(entry, payload):
+        if entry["record_id"] == "rec-2":
+            raise RuntimeError("storage down")
+        shipped.append((entry["record_id"], entry["chunk_index"]))
+
+    chunk_wal.start_chunk_wal(store, ship)
+    chunk_wal.append_chunk(_entry(0), b"a" * 231)
+    chunk_wal.append_chunk(_entry(0, record_id="rec-2"), b"b" * 231)
+    chunk_wal.append_chunk(_entry(1), b"c" * 231)
+
+    chunk_wal.drain_chunk_wal("rec-1")
+    assert stored == [("rec-1", 0), ("rec-1", 1)]
+    chunk_wal.drain_chunk_wal()
+    assert shipped == []
+    assert chunk_wal.chunk_wal_metrics()["ship_failures"] == 1
+
+
+@pytest.mark.parametrize("record_id", [None, "rec-1"])
+def test_segment_survives_until_its_chunk_rows_are_written(wal_dir, monkeypatch, record_id):
+    monkeypatch.setattr(chunk_wal, "CHUNK_WAL_MAX_BACKOFF_S", 0.0)
+    inserted = []
+    insert_fails = True
+
+    def insert(rows):
+        if insert_fails:
+            raise RuntimeError("insert failed")
+        inserted.extend(row["chunk_index"] for row in rows)
+
+    monkeypatch.setattr(write_behind, "_insert_session_chunk_rows", insert)
+    monkeypatch.setattr(write_behind, "write_behind_running", lambda: True)
+    monkeypatch.setattr(write_behind, "PENDING_CHUNK_ROWS", {})
+    store = lambda entry, payload: write_behind.queue_chunk_row({**entry, "object_key": f"chunks/{entry['chunk_index']}.bin"})
+    commit = lambda record_id: write_behind.flush_write_behind(record_id, chunks_only=True)
+    chunk_wal.start_chunk_wal(store, commit=commit)
+    chunk_wal.append_chunk(_entry(0), b"a" * 231)
+
+    if record_id is None:
+        chunk_wal.drain_chunk_wal()
+    else:
+        with pytest.raises(RuntimeError):
+            chunk_wal.drain_chunk_wal(record_id)
+    assert chunk_wal.chunk_wal_metrics()["pending_segments"] == 2
+
+    insert_fails = False
+    chunk_wal.drain_chunk_wal()
+    assert inserted == [0]
+    assert chunk_wal.chunk_wal_metrics()["pending_segments"] == 1
+
+
+def test_second_process_cannot_share_the_wal_directory(wal_dir):
+    chunk_wal.start_chunk_wal(lambda entry, payload: None)
+    chunk_wal.append_chunk(_entry(0), b"a" * 231)
+    active = chunk_wal.CHUNK_WAL_SEGMENT
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import chunk_wal; chunk_wal.start_chunk_wal(lambda entry, payload: None)"],
+        cwd=Path(chunk_wal.__file__).parent,
+        env={**os.environ, "CHUNK_WAL_DIR": str(wal_dir), "CHUNK_WAL_ENABLED": "true"},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0 and "in use by another process" in result.stderr
+    assert active.exists() and chunk_wal.CHUNK_WAL_SEGMENT == active
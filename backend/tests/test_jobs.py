@@ -0,0 +1,50 @@
+import pytest
+
+from jobs import (
+    JobCancelled,
+    claim_job,
+    get_job,
+    raise_if_job_cancelled,
+    release_job,
+    set_job,
+)
+
+
+def test_duplicate_claim_attaches_to_running_job():
+    job_id, created, superseded = claim_job("review", "rec-dup", {"resample": True})
+    set_job(job_id, status="running")
+    again_id, again_created, again_superseded = claim_job("review", "rec-dup", {"resample": True})
+
+    assert created and superseded is None
+    assert again_id == job_id and not again_created and again_superseded is None
+    assert get_job(job_id)["coalesced_requests"] == 1
+
+    other_id, other_created, _ = claim_job("review", "rec-dup", {"resample": False})
+    assert other_created and other_id != job_id
+    release_job(job_id)
+    release_job(other_id)
+
+
+def test_force_claim_supersedes_running_job():
+    job_id, _, _ = claim_job("static_review", "rec-force", {"max_windows": None})
+    set_job(job_id, status="running")
+    new_id, created, superseded = claim_job("static_review", "rec-force", {"max_windows": None}, force=True)
+
+    assert created and superseded == job_id and new_id != job_id
+    with pytest.raises(JobCancelled):
+        raise_if_job_cancelled(job_id)
+    set_job(job_id, status="running")
+    assert get_job(job_id)["status"] == "superseded"
+
+    release_job(job_id)
+    assert claim_job("static_review", "rec-force", {"max_windows": None})[0] == new_id
+    release_job(new_id)
+
+
+def test_released_job_allows_new_claim():
+    job_id, _, _ = claim_job("review", "rec-done", {"resample": True})
+    set_job(job_id, status="ready")
+    release_job(job_id)
+    next_id, created, _ = claim_job("review", "rec-done", {"resample": True})
+    assert created and next_id != job_id
+    release_job(next_id)
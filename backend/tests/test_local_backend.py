@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+import supabase
+
+
+def test_rest_helpers_round_trip_through_sqlite(local_backend):
+    older = supabase._insert_recording_row({"user_id": "u1", "sample_rate_hz": 500, "created_at": "2026-01-01T00:00:00+08:00"})
+    record = supabase._insert_recording_row({"user_id": "u1", "notes": {"source": "bench"}})
+    record_id = record["id"]
+    assert record["notes"] == {"source": "bench"} and record["created_at"]
+
+    supabase._update_recording_row(record_id, {"session_object_key": "session/s1/session.bin", "byte_length": 462})
+    supabase._insert_session_chunk_rows(
+        [
+            {"record_id": record_id, "chunk_index": 1, "object_key": "session/s1/chunks/1.bin", "byte_length": 231},
+            {"record_id": record_id, "chunk_index": 0, "object_key": "session/s1/chunks/0.bin", "byte_length": 231},
+        ]
+    )
+    supabase._insert_session_chunk_rows([{"record_id": record_id, "chunk_index": 1, "object_key": "retry.bin", "byte_length": 231}])
+    supabase._upsert_processed_record(record_id, status="ready")
+    supabase._upsert_processed_artifact(record_id, "review_ch2", "processed/ch2.json")
+    supabase._upsert_processed_record(older["id"], status="error", error_message="boom")
+
+    assert supabase._fetch_recording_by_id(record_id)["byte_length"] == 462
+    assert supabase._fetch_latest_recording_id() == record_id
+    assert [row["object_key"] for row in supabase._fetch_session_chunk_rows(record_id)] == [
+        "session/s1/chunks/0.bin",
+        "retry.bin",
+    ]
+    assert supabase._fetch_processed_record_ids(stale_only=True) == [older["id"]]
+    metadata = asyncio.run(supabase._fetch_processed_metadata_async(record_id))
+    assert metadata["processed"]["status"] == "ready"
+    assert metadata["artifact_keys"] == {"review_ch2": "processed/ch2.json"}
+
+
+def test_storage_helpers_use_local_files(local_backend):
+    supabase._upload_storage_bytes("session/s1/session.bin", bytes(range(10)))
+    supabase._upload_storage_json("processed/ch2.json", {"ok": True})
+
+    assert (local_backend / "objects" / "ecg-data" / "session" / "s1" / "session.bin").read_bytes() == bytes(range(10))
+    assert supabase._fetch_storage_bytes("session/s1/session.bin") == bytes(range(10))
+    assert supabase._fetch_storage_range("session/s1/session.bin", 2, 5) == bytes([2, 3, 4])
+    assert supabase._fetch_storage_range("session/s1/session.bin", 20, 25) == b""
+    assert supabase._fetch_storage_json("processed/ch2.json") == {"ok": True}
+    assert supabase._storage_object_exists("processed/ch2.json")
+    assert not supabase._storage_object_exists("processed/ch3.json")
+    with pytest.raises(supabase.HTTPException):
+        supabase._fetch_storage_bytes("processed/ch3.json")
@@ -0,0 +1,111 @@
+import httpx
+import pytest
+
+import object_cache
+import supabase
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(object_cache, "MEMORY_CACHE", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "MEMORY_CACHE_BYTES", 0)
+    monkeypatch.setattr(object_cache, "DISK_INDEX", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "DISK_INDEX_BYTES", 0)
+    monkeypatch.setattr(object_cache, "DISK_INDEX_LOADED", False)
+    return tmp_path
+
+
+def test_fetch_is_read_through_revalidated_and_written_through(fresh_cache, monkeypatch):
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path, request.headers.get("if-none-match")))
+        if request.method == "POST":
+            return httpx.Response(200, json={"Key": request.url.path})
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"png-v1", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(supabase, "SUPABASE_CONFIG_CACHE", {"url": "https://db.test", "key": "k", "bucket": "b"})
+    monkeypatch.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_REVALIDATE_S", 300.0)
+
+    assert supabase._fetch_storage_bytes("review-static/rec-1/a.png") == b"png-v1"
+    assert supabase._fetch_storage_bytes("/review-static/rec-1/a.png") == b"png-v1"
+    assert supabase._fetch_storage_range("review-static/rec-1/a.png", 1, 3) == b"ng"
+    assert len(seen) == 1
+
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_REVALIDATE_S", 0.0)
+    assert supabase._fetch_storage_bytes("review-static/rec-1/a.png") == b"png-v1"
+    assert seen[-1] == ("GET", "/storage/v1/object/b/review-static/rec-1/a.png", '"v1"')
+    assert object_cache.OBJECT_CACHE_METRICS["revalidated"] >= 1
+
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_REVALIDATE_S", 300.0)
+    supabase._upload_storage_bytes("review-static/rec-1/b.png", b"png-b")
+    assert supabase._fetch_storage_bytes("review-static/rec-1/b.png") == b"png-b"
+    assert [method for method, _, _ in seen] == ["GET", "GET", "POST"]
+
+
+def test_disk_tier_survives_restart_and_stays_within_its_bound(fresh_cache, monkeypatch):
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_DISK_BYTES", 10)
+    object_cache.store_object("a", b"aaaa", '"a"')
+    object_cache.store_object("b", b"bbbb", '"b"')
+    assert object_cache.lookup_object("a").payload == b"aaaa"
+    object_cache.store_object("c", b"cccc")
+
+    monkeypatch.setattr(object_cache, "MEMORY_CACHE", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "DISK_INDEX", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "DISK_INDEX_BYTES", 0)
+    monkeypatch.setattr(object_cache, "DISK_INDEX_LOADED", False)
+
+    assert not object_cache.object_cached("b")
+    restored = object_cache.lookup_object("a")
+    assert restored.payload == b"aaaa" and restored.etag == '"a"'
+    # Anything read back from disk is revalidated before it is trusted.
+    assert not restored.fresh
+    assert object_cache.lookup_object("c").payload == b"cccc"
+    assert object_cache.object_cache_metrics()["disk_bytes"] == 8
+
+
+def test_write_through_is_limited_to_artifacts_and_keyed_by_content_etag(fresh_cache, monkeypatch):
+    stored = {}
+    seen = []
+
+    def handler(request):
+        path = request.url.path
+        if request.method == "POST":
+            stored[path] = request.content
+            return httpx.Response(200, json={"Key": path})
+        etag = object_cache.content_etag(stored[path])
+        seen.append(request.headers.get("if-none-match") == etag)
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=stored[path], headers={"ETag": etag})
+
+    monkeypatch.setattr(supabase, "SUPABASE_CONFIG_CACHE", {"url": "https://db.test", "key": "k", "bucket": "b"})
+    monkeypatch.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    object_cache.store_object("session/s1.bin", b"stale")
+
+    supabase._upload_storage_bytes("processed/rec-1/review_ch2.npz", b"artifact")
+    supabase._upload_storage_bytes("session/s1/chunks/0.bin", b"chunk")
+    supabase._upload_storage_bytes("session/s1.bin", b"fresh")
+
+    assert object_cache.object_cached("processed/rec-1/review_ch2.npz")
+    assert not object_cache.object_cached("session/s1/chunks/0.bin")
+    assert not object_cache.object_cached("session/s1.bin")
+    # Every hit is revalidated, and the written-through copy already carries the ETag storage will report.
+    assert supabase._fetch_storage_bytes("processed/rec-1/review_ch2.npz") == b"artifact"
+    stored["/storage/v1/object/b/processed/rec-1/review_ch2.npz"] = b"reprocessed"
+    assert supabase._fetch_storage_bytes("processed/rec-1/review_ch2.npz") == b"reprocessed"
+    assert seen == [True, False]
+
+
+def test_disk_entry_replaced_by_another_process_is_not_paired_with_a_stale_etag(fresh_cache):
+    object_cache.store_object("processed/a.npz", b"old-bytes", '"old"')
+    object_cache.MEMORY_CACHE.clear()
+    # Another process swapped the data file but has not replaced the metadata yet.
+    object_cache._disk_path("processed/a.npz").write_bytes(b"new-bytes")
+
+    assert object_cache.lookup_object("processed/a.npz") is None
+    assert not object_cache.object_cached("processed/a.npz")
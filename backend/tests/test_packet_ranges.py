@@ -0,0 +1,27 @@
+import random
+
+import app
+
+
+def test_sample_window_from_byte_range_matches_full_decode(monkeypatch):
+    rng = random.Random(7)
+    payload = bytes(rng.randrange(256) for _ in range(app.PACKET_BYTES * 40))
+    fetched = []
+
+    def fetch_range(object_key, start, end):
+        fetched.append((start, end))
+        return payload[start:end]
+
+    monkeypatch.setattr(app, "_fetch_storage_range", fetch_range)
+    monkeypatch.setattr(app, "SESSION_RANGE_CACHE", app.OrderedDict())
+    full = app._decode_ads1298_packets(payload)
+
+    for start, end in [(0, 25), (13, 260), (500, 1000), (990, 1200)]:
+        window = app._fetch_sample_window("session/s.bin", start, end)
+        assert window == app._window_channels(full, start, end)
+
+    assert fetched[1] == (0, 11 * app.PACKET_BYTES)
+    assert all(start % app.PACKET_BYTES == 0 and end % app.PACKET_BYTES == 0 for start, end in fetched)
+
+    app._fetch_sample_window("session/s.bin", 13, 260)
+    assert len(fetched) == 4
@@ -0,0 +1,43 @@
+import httpx
+
+import supabase
+
+
+def test_metadata_is_one_embedded_select_cached_until_upsert(monkeypatch):
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path))
+        if request.method == "POST":
+            return httpx.Response(201, json=[{}])
+        assert "ecg_processed_artifacts(" in request.url.params["select"]
+        return httpx.Response(
+            200,
+            json=[
+                {
+                    "id": "rec-1",
+                    "ecg_processed_records": [{"record_id": "rec-1", "status": "ready"}],
+                    "ecg_processed_artifacts": [
+                        {"artifact_type": "review_ch2", "object_key": "processed/rec-1/ch2.json"},
+                        {"artifact_type": "review_ch3", "object_key": None},
+                    ],
+                }
+            ],
+        )
+
+    monkeypatch.setattr(supabase, "SUPABASE_CONFIG_CACHE", {"url": "https://db.test", "key": "k", "bucket": "b"})
+    monkeypatch.setattr(supabase, "SUPABASE_HEADERS_CACHE", {})
+    monkeypatch.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(supabase, "PROCESSED_METADATA_CACHE", {})
+
+    metadata = supabase._fetch_processed_metadata("rec-1")
+    assert metadata == {
+        "processed": {"record_id": "rec-1", "status": "ready"},
+        "artifact_keys": {"review_ch2": "processed/rec-1/ch2.json"},
+    }
+    assert supabase._fetch_processed_metadata("rec-1") is metadata
+    assert seen == [("GET", "/rest/v1/ecg_recordings")]
+
+    supabase._upsert_processed_record("rec-1", status="processing")
+    supabase._fetch_processed_metadata("rec-1")
+    assert [method for method, _ in seen] == ["GET", "POST", "GET"]
@@ -0,0 +1,43 @@
+import render_service
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+MEAN_BEAT = {
+    "epoch_axis": [-0.2, -0.1, 0.0, 0.1, 0.2],
+    "mean_beats": {
+        "CH2": [0.0, 0.1, 0.6, 0.1, 0.0],
+        "CH3": [0.0, 0.05, 0.4, 0.05, 0.0],
+        "CH4": [0.0, -0.1, 0.3, -0.1, 0.0],
+    },
+}
+
+
+def test_inprocess_render_fallback(monkeypatch):
+    monkeypatch.setattr(render_service, "RENDER_WORKERS", 0)
+    payload = render_service.render_png(
+        "vector3d",
+        lead_x=[0.0, 0.2, 0.5],
+        lead_y=[0.0, 0.1, 0.2],
+        lead_z=[0.0, -0.1, 0.3],
+        markers={"R": [2]},
+        progress_percent=100,
+        y_min_mv=-1.0,
+        y_max_mv=1.0,
+    )
+    assert payload.startswith(PNG_MAGIC)
+
+
+def test_worker_process_renders_batch():
+    compare = {"calibration": MEAN_BEAT, "session": MEAN_BEAT, "window_label": "Window 1"}
+    try:
+        payloads = render_service.render_png_many(
+            [
+                ("waveform_compare", {**compare, "channel": "CH2"}),
+                ("vcg2d_compare", {**compare, "plane": "Frontal Plane", "x_channel": "CH2", "y_channel": "CH3"}),
+                ("vcg3d_compare", compare),
+            ]
+        )
+    finally:
+        render_service.shutdown_render_service()
+    assert len(payloads) == 3
+    assert all(payload.startswith(PNG_MAGIC) for payload in payloads)
+    assert render_service.render_metrics()["completed"] >= 3
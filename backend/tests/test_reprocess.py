@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+import app
+import jobs
+import reprocess
+import supabase
+from reprocess import find_stale_record_ids, load_completed
+
+
+@pytest.fixture
+def local_backend(local_backend, monkeypatch):
+    monkeypatch.setattr(app, "STATIC_REVIEW_MANIFEST_CACHE", app.OrderedDict())
+    return local_backend
+
+
+def _recording(name):
+    return supabase._insert_recording_row(
+        {
+            "user_id": "u1",
+            "session_object_key": f"session/{name}/session.bin",
+            "calibration_object_key": f"calibration/{name}.bin",
+        }
+    )["id"]
+
+
+def _manifest(record_id, processing_version, status="ready"):
+    manifest = {"record_id": record_id, "processing_version": processing_version, "status": status, "windows": []}
+    supabase._upload_storage_json(app._static_review_manifest_key(record_id), manifest)
+
+
+def test_load_completed_skips_errors_and_old_versions(tmp_path):
+    progress_path = tmp_path / "progress.jsonl"
+    entries = [
+        {"kind": "review", "record_id": "rec-a", "status": "ready", "processing_version": "review_v7"},
+        {"kind": "review", "record_id": "rec-b", "status": "error", "processing_version": "review_v7"},
+        {"kind": "review", "record_id": "rec-c", "status": "ready", "processing_version": "review_v6"},
+        {"kind": "static", "record_id": "rec-a", "status": "skipped", "processing_version": "static_v1"},
+    ]
+    progress_path.write_text("\n".join(json.dumps(entry) for entry in entries) + "\nnot json\n", encoding="utf-8")
+
+    completed = load_completed(progress_path, {"review": "review_v7", "static": "static_v1"})
+
+    assert completed == {("review", "rec-a"), ("static", "rec-a")}
+    assert load_completed(tmp_path / "missing.jsonl", {"review": "review_v7"}) == set()
+
+
+def test_find_stale_record_ids_selects_old_versions_and_skips_records_in_progress(local_backend, monkeypatch):
+    current, old, busy, abandoned, never = (_recording(name) for name in ("current", "old", "busy", "abandoned", "never"))
+    manifest_type = app.STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE
+    with monkeypatch.context() as patch:
+        patch.setattr(supabase, "REVIEW_PROCESSING_VERSION", "review_v0")
+        supabase._upsert_processed_record(old, status="ready")
+    supabase._upsert_processed_record(current, status="ready")
+    supabase._upsert_processed_record(busy, status="processing")
+    row = {"record_id": abandoned, "status": "processing", "processing_version": supabase.REVIEW_PROCESSING_VERSION}
+    supabase._run_plan(
+        supabase._upsert_table_row_plan(
+            "ecg_processed_records",
+            {**row, "updated_at": "2026-01-01T00:00:00+08:00"},
+            "record_id",
+        )
+    )
+    for record_id, version in ((current, app.STATIC_REVIEW_PROCESSING_VERSION), (old, "static_v0"), (busy, "static_v0")):
+        supabase._upsert_processed_artifact(record_id, manifest_type, app._static_review_manifest_key(record_id), version)
+
+    assert find_stale_record_ids("review") == sorted([old, abandoned])
+    assert find_stale_record_ids("review", include_processing=True) == sorted([old, busy, abandoned])
+    assert find_stale_record_ids("review", include_unprocessed=True) == sorted([old, abandoned]) + [never]
+    # A review row in progress says nothing about the static manifest.
+    assert find_stale_record_ids("static") == sorted([old, busy])
+    assert find_stale_record_ids("static", include_unprocessed=True) == sorted([old, busy]) + [abandoned, never]
+
+
+def test_reprocess_static_record_registers_current_manifest_without_rendering(local_backend, monkeypatch):
+    record_id = _recording("current")
+    _manifest(record_id, app.STATIC_REVIEW_PROCESSING_VERSION)
+    monkeypatch.setattr(app, "_static_review_job", lambda job_id, record_id: pytest.fail("should not render"))
+
+    assert reprocess._reprocess_static_record(record_id) == "skipped"
+    metadata = supabase._fetch_processed_metadata(record_id)
+    assert metadata["artifact_keys"][app.STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE] == app._static_review_manifest_key(record_id)
+
+
+@pytest.mark.parametrize("job_status", ["ready", "error"])
+def test_reprocess_static_record_runs_the_job_for_stale_manifests(local_backend, monkeypatch, job_status):
+    record_id = _recording("old")
+    _manifest(record_id, "static_v0")
+    rendered = []
+
+    def job(job_id, record_id):
+        rendered.append(record_id)
+        jobs.set_job(job_id, status=job_status, error="render failed" if job_status == "error" else None)
+
+    monkeypatch.setattr(app, "_static_review_job", job)
+
+    if job_status == "ready":
+        assert reprocess._reprocess_static_record(record_id) == "ready"
+    else:
+        with pytest.raises(RuntimeError, match="render failed"):
+            reprocess._reprocess_static_record(record_id)
+    assert rendered == [record_id]
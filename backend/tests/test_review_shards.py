@@ -0,0 +1,94 @@
+import asyncio
+import json
+
+import neurokit2 as nk
+import pytest
+
+import app
+import supabase
+
+
+@pytest.fixture
+def local_backend(local_backend, monkeypatch):
+    monkeypatch.setattr(app, "REVIEW_ARTIFACT_CACHE", {})
+    monkeypatch.setattr(app, "REVIEW_SHARD_CACHE", app.OrderedDict())
+    monkeypatch.setattr(app, "REVIEW_SHARD_CACHE_USED_BYTES", 0)
+    return local_backend
+
+
+def _artifact(record_id):
+    samples = nk.ecg_simulate(duration=30, sampling_rate=500, random_state=2).tolist()
+    return app._build_review_artifact(
+        record_id=record_id,
+        channel="CH2",
+        calibration_key="calibration/c1.bin",
+        calibration_byte_length=2310,
+        calibration_samples=samples[:5000],
+        session_key="session/s1.bin",
+        session_byte_length=13860,
+        session_samples=samples,
+        sample_rate_hz=500,
+    )
+
+
+def test_window_endpoints_read_only_their_shard(local_backend):
+    record_id = supabase._insert_recording_row({"user_id": "u1"})["id"]
+    artifact = _artifact(record_id)
+    assert app._upload_review_shards(record_id, "CH2", artifact) == 16
+    # No full artifact in storage: the endpoints must get by on the summary or index and one shard.
+    supabase._upsert_processed_artifact(record_id, "review_ch2", f"processed/{record_id}/review_ch2.npz")
+    supabase._upsert_processed_record(record_id, status="ready")
+
+    window = asyncio.run(app.review_window(record_id, section="session", channel="CH2", window_index=99))
+    session_window = asyncio.run(app.review_session_window(record_id, channel="CH2", session_window_index=2))
+    # The beat list for the whole section stays in the summary, which only /review/{record_id} reads.
+    assert sorted(key[-1] for key in app.REVIEW_SHARD_CACHE) == ["index", "session/00002", "session/00003", "session/intervals"]
+    summary = asyncio.run(app.review_record(record_id, channel="CH2"))
+
+    expected = app._build_review_window_section(artifact["session"], 500, 3)
+    assert summary.session.window_count == 3
+    assert summary.session.beats.count == artifact["session"]["beats"]["count"]
+    assert window.window.window_index == 3
+    assert window.window.signal.r_peaks == expected["signal"]["r_peaks"]
+    assert window.window.signal.full == pytest.approx(expected["signal"]["full"], abs=1e-5)
+    assert window.window.beats.count == expected["beats"]["count"]
+    assert session_window.session.window_start_sample == 5001
+    assert session_window.session.beat_count_total == artifact["session"]["beat_count_total"]
+    assert len(session_window.session.interval_related_rows) == len(artifact["session"]["interval_related_rows"])
+    overview = asyncio.run(app.review_envelope(record_id, section="session", channel="CH2", pixel_width=100))
+    zoomed = asyncio.run(app.review_envelope(record_id, channel="CH2", start_sample=4990, end_sample=5100))
+    # Only the selected level is fetched, never the whole pyramid.
+    assert [key[-1] for key in app.REVIEW_SHARD_CACHE if "envelope" in key[-1]] == ["session/envelope/64"]
+    assert (overview.factor, overview.start_sample, overview.end_sample) == (64, 0, 15000)
+    assert max(overview.max) == pytest.approx(max(artifact["session"]["signal"]["full"]), abs=1e-5)
+    assert zoomed.factor == 1
+    assert zoomed.min == pytest.approx(artifact["session"]["signal"]["full"][4990:5100], abs=1e-5)
+    assert app.REVIEW_ARTIFACT_CACHE == {}
+
+
+def test_records_built_before_sharding_use_the_full_artifact(local_backend):
+    record_id = supabase._insert_recording_row({"user_id": "u1"})["id"]
+    artifact = _artifact(record_id)
+    object_key = f"processed/{record_id}/review_ch2.json"
+    supabase._upload_storage_bytes(object_key, json.dumps(artifact).encode())
+    supabase._upsert_processed_artifact(record_id, "review_ch2", object_key)
+    supabase._upsert_processed_record(record_id, status="ready")
+
+    window = asyncio.run(app.review_window(record_id, section="calibration", channel="CH2", window_index=1))
+
+    assert window.window.signal.full == artifact["calibration"]["signal"]["full"]
+
+
+def test_shard_cache_is_bounded_by_bytes(monkeypatch):
+    monkeypatch.setattr(app, "REVIEW_SHARD_CACHE", app.OrderedDict())
+    monkeypatch.setattr(app, "REVIEW_SHARD_CACHE_USED_BYTES", 0)
+    monkeypatch.setattr(app, "REVIEW_SHARD_CACHE_BYTES", 1000)
+
+    for index, size in enumerate((400, 400, 300)):
+        app._remember_review_shard(("rec-a", "CH2", "v1", f"session/{index}"), {}, size)
+    app._remember_review_shard(("rec-b", "CH2", "v1", "index"), {}, 450)
+
+    assert [key[-1] for key in app.REVIEW_SHARD_CACHE] == ["session/2", "index"]
+    assert app.REVIEW_SHARD_CACHE_USED_BYTES == 750
+    app._forget_review_shards("rec-a")
+    assert app.REVIEW_SHARD_CACHE_USED_BYTES == 450
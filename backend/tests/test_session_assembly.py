@@ -0,0 +1,25 @@
+import pytest
+from fastapi import HTTPException
+
+import app
+
+
+def _chunk(index, session_id="sess-1"):
+    return {"chunk_index": index, "object_key": f"session/{session_id}/chunks/{index}.bin", "byte_length": 10}
+
+
+def test_ordered_session_chunks_dedupes_and_skips_other_sessions():
+    rows = [_chunk(1), _chunk(0), _chunk(1), _chunk(2, session_id="sess-0")]
+
+    assert [row["chunk_index"] for row in app._ordered_session_chunks(rows, "sess-1")] == [0, 1]
+
+
+def test_ordered_session_chunks_reports_gaps_and_missing_tail():
+    rows = [_chunk(0), _chunk(2)]
+
+    with pytest.raises(HTTPException) as excinfo:
+        app._ordered_session_chunks(rows, "sess-1", expected_chunk_count=5)
+
+    assert excinfo.value.status_code == 409
+    assert excinfo.value.detail["code"] == "session_chunks_missing"
+    assert excinfo.value.detail["missing_chunk_indices"] == [1, 3, 4]
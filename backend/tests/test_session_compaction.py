@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+import app
+import supabase
+
+
+@pytest.fixture
+def local_backend(local_backend, monkeypatch):
+    monkeypatch.setattr(app, "SESSION_SEGMENT_CHUNKS", 3)
+    return local_backend / "objects" / "ecg-data" / "session" / "s1"
+
+
+def test_compaction_merges_whole_segments_and_assembly_reads_them(local_backend):
+    record_id = supabase._insert_recording_row({"user_id": "u1"})["id"]
+    chunks = [bytes([index]) * 231 for index in range(7)]
+    for index, chunk in enumerate(chunks):
+        supabase._upload_storage_bytes(f"session/s1/chunks/{index}.bin", chunk)
+    supabase._insert_session_chunk_rows(
+        [
+            {"record_id": record_id, "chunk_index": index, "object_key": f"session/s1/chunks/{index}.bin", "byte_length": 231}
+            for index in range(7)
+        ]
+    )
+
+    assert app._compact_session_chunks(record_id, "s1") == 2
+    assert app._compact_session_chunks(record_id, "s1") == 0
+
+    assert sorted(path.name for path in (local_backend / "chunks").iterdir()) == ["6.bin"]
+    assert sorted(path.name for path in (local_backend / "segments").iterdir()) == ["000000-000002.bin", "000003-000005.bin"]
+    rows = supabase._fetch_session_chunk_rows(record_id)
+    assert [(row["object_key"].rsplit("/", 1)[-1], row["byte_offset"]) for row in rows[3:]] == [
+        ("000003-000005.bin", 0),
+        ("000003-000005.bin", 231),
+        ("000003-000005.bin", 462),
+        ("6.bin", None),
+    ]
+    assert asyncio.run(app._assemble_session_payload(record_id, "s1", b"tail", 7)) == b"".join(chunks) + b"tail"
@@ -0,0 +1,62 @@
+import neurokit2 as nk
+import numpy as np
+import pytest
+
+import app
+from shared_arrays import PUBLISHED_ARRAYS, attached_array, publish_arrays, release_arrays, shared_arrays
+
+
+def test_published_arrays_are_shared_and_refcounted():
+    channels = {"CH2": [0.5, -1.25, 2.0], "CH3": []}
+    first = publish_arrays("rec-shared", channels)
+    second = publish_arrays("rec-shared", channels)
+    assert first == second
+
+    with attached_array(first["CH2"]) as samples:
+        assert samples.tolist() == [0.5, -1.25, 2.0]
+        with pytest.raises(ValueError):
+            samples[0] = 1.0
+    with attached_array(first["CH3"]) as samples:
+        assert samples.size == 0
+
+    release_arrays("rec-shared")
+    assert "rec-shared" in PUBLISHED_ARRAYS
+    release_arrays("rec-shared")
+    assert "rec-shared" not in PUBLISHED_ARRAYS
+    with pytest.raises(FileNotFoundError):
+        with attached_array(first["CH2"]):
+            pass
+
+
+def test_shared_arrays_context_releases_on_error():
+    with pytest.raises(RuntimeError):
+        with shared_arrays("rec-error", {"CH4": np.arange(4.0)}) as handles:
+            assert handles["CH4"].length == 4
+            raise RuntimeError("boom")
+    assert "rec-error" not in PUBLISHED_ARRAYS
+
+
+def test_review_artifact_builds_from_read_only_views(caplog):
+    calibration = nk.ecg_simulate(duration=10, sampling_rate=500, random_state=1)
+    session = nk.ecg_simulate(duration=25, sampling_rate=500, random_state=2)
+    build_kwargs = {
+        "record_id": "rec-views",
+        "channel": "CH2",
+        "calibration_key": "calibration/c1.bin",
+        "calibration_byte_length": 231,
+        "session_key": "session/s1.bin",
+        "session_byte_length": 462,
+        "sample_rate_hz": 500,
+    }
+    expected = app._build_review_artifact(
+        calibration_samples=calibration.tolist(),
+        session_samples=session.tolist(),
+        **build_kwargs,
+    )
+
+    with shared_arrays("rec-views", {"calibration": calibration, "session": session}) as handles:
+        artifact = app._build_review_artifact_from_shared(handles["calibration"], handles["session"], **build_kwargs)
+
+    assert artifact == expected
+    assert type(artifact["session"]["signal"]["full"][0]) is float
+    assert "close_deferred" not in caplog.text
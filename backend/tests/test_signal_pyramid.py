@@ -0,0 +1,38 @@
+import numpy as np
+
+from signal_pyramid import build_envelope_pyramid, envelope_buckets, minmax_downsample, select_envelope_factor
+
+
+def test_pyramid_levels_match_brute_force_and_keep_spikes():
+    samples = np.sin(np.arange(10_001) / 50.0).tolist()
+    samples[7_777] = 9.0
+    pyramid = build_envelope_pyramid(samples)
+
+    for factor in pyramid["factors"]:
+        level = pyramid["levels"][str(factor)]
+        expected_max = [max(samples[start : start + factor]) for start in range(0, len(samples), factor)]
+        assert level["max"] == expected_max
+        assert level["min"][0] == min(samples[:factor])
+        assert max(level["max"]) == 9.0
+
+
+def test_range_query_picks_coarsest_level_for_pixel_width():
+    pyramid = build_envelope_pyramid([float(value) for value in range(100_000)])
+
+    assert select_envelope_factor(pyramid, 0, 100_000, 1000) == 64
+    assert select_envelope_factor(pyramid, 0, 100_000, 50) == 1024
+    assert select_envelope_factor(pyramid, 500, 2_000, 1000) == 1
+    envelope = envelope_buckets(pyramid, 16, 100, 330)
+    assert (envelope["start_sample"], envelope["end_sample"]) == (96, 336)
+    assert envelope["min"][0] == 96.0 and envelope["max"][-1] == 335.0
+
+
+def test_live_downsample_keeps_peaks():
+    values = [0.0] * 2000
+    values[1001] = 5.0
+    values[1500] = -3.0
+
+    downsampled = minmax_downsample(values, 1000)
+
+    assert len(downsampled) == 1000
+    assert 5.0 in downsampled and -3.0 in downsampled
@@ -0,0 +1,92 @@
+import app
+
+
+def _window(index, status="ready"):
+    return {
+        "window_index": index,
+        "status": status,
+        "images": {name: f"static/rec/windows/window_{index:04d}/{name}.png" for name in ("waveform", "vcg2d", "vcg3d")}
+        if status == "ready"
+        else {},
+    }
+
+
+def test_reusable_windows_require_matching_inputs_and_present_images(monkeypatch):
+    missing = "static/rec/windows/window_0002/vcg3d.png"
+    monkeypatch.setattr(app, "_storage_object_exists", lambda object_key: object_key != missing)
+    existing = {
+        "processing_version": app.STATIC_REVIEW_PROCESSING_VERSION,
+        "session_object_key": "sessions/rec.bin",
+        "calibration_object_key": "calibration/rec.bin",
+        "session_byte_length": 2310,
+        "sample_rate_hz": 500,
+        "window_samples": 10000,
+        "windows": [_window(1), _window(2), _window(3, status="error"), _window(4)],
+    }
+    inputs = {
+        "session_key": "sessions/rec.bin",
+        "calibration_key": "calibration/rec.bin",
+        "session_byte_length": 2310,
+        "sample_rate_hz": 500,
+        "window_samples": 10000,
+        "target_window_count": 3,
+    }
+
+    assert sorted(app._reusable_static_review_windows(existing, **inputs)) == [1]
+    assert app._reusable_static_review_windows(existing, **{**inputs, "session_byte_length": 4620}) == {}
+    assert app._reusable_static_review_windows({**existing, "processing_version": "old"}, **inputs) == {}
+
+
+def test_running_manifest_is_flushed_every_n_windows(monkeypatch):
+    uploads = []
+    samples = [0.0] * (25 * app.STATIC_REVIEW_WINDOW_SAMPLES)
+    monkeypatch.setattr(app, "STATIC_REVIEW_MANIFEST_CACHE", app.OrderedDict())
+    monkeypatch.setattr(app, "STATIC_REVIEW_MANIFEST_FLUSH_WINDOWS", 10)
+    monkeypatch.setattr(
+        app,
+        "_fetch_recording_by_id",
+        lambda record_id: {"session_object_key": "sessions/rec.bin", "calibration_object_key": "calibration/rec.bin"},
+    )
+    monkeypatch.setattr(app, "_fetch_recording_binaries", lambda session_key, calibration_key: (b"s", b"c"))
+    monkeypatch.setattr(app, "_decode_ads1298_packets", lambda payload: {"CH2": samples, "CH3": samples, "CH4": samples})
+    monkeypatch.setattr(app, "_static_review_calibration_result", lambda window, sample_rate_hz: {})
+    monkeypatch.setattr(
+        app,
+        "_iter_static_review_session_results",
+        lambda share_key, channels, zero_indices, window_samples, sample_rate_hz: ((index, {}) for index in zero_indices),
+    )
+    monkeypatch.setattr(
+        app,
+        "_start_static_review_window_entry",
+        lambda record_id, zero_index, *args: app.PendingWindowEntry({"window_index": zero_index + 1}, {}, None, {}),
+    )
+    monkeypatch.setattr(
+        app,
+        "_upload_static_manifest",
+        lambda record_id, manifest: uploads.append((manifest["status"], manifest["completed_window_count"])),
+    )
+    monkeypatch.setattr(app, "_upsert_processed_artifact", lambda *args, **kwargs: None)
+
+    job_id, _, _ = app.claim_job("static_review", "rec-flush", {"max_windows": None}, force=True)
+    app._static_review_job(job_id, "rec-flush", force=True)
+
+    assert uploads == [("running", 0), ("running", 10), ("running", 20), ("ready", 25)]
+    manifest = app.get_job(job_id)["details"]
+    assert [window["window_index"] for window in manifest["windows"]] == list(range(1, 26))
+    # Once the job is done, readers go back to storage.
+    assert "rec-flush" not in app.STATIC_REVIEW_MANIFEST_CACHE
+
+
+def test_manifest_cache_is_bounded_and_only_holds_running_manifests(monkeypatch):
+    monkeypatch.setattr(app, "STATIC_REVIEW_MANIFEST_CACHE", app.OrderedDict())
+    monkeypatch.setattr(app, "STATIC_REVIEW_MANIFEST_CACHE_SIZE", 2)
+    stored = {"record_id": "rec-stored", "status": "ready", "windows": []}
+    monkeypatch.setattr(app, "_fetch_storage_json", lambda object_key: stored)
+
+    for record_id in ("rec-a", "rec-b", "rec-c"):
+        app._cache_static_manifest(record_id, {"record_id": record_id, "status": "running", "windows": []})
+
+    assert list(app.STATIC_REVIEW_MANIFEST_CACHE) == ["rec-b", "rec-c"]
+    assert app._load_static_review_manifest("rec-c")["status"] == "running"
+    assert app._load_static_review_manifest("rec-stored") is stored
+    assert "rec-stored" not in app.STATIC_REVIEW_MANIFEST_CACHE
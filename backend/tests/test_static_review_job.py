@@ -0,0 +1,89 @@
+from concurrent.futures import Future
+
+import neurokit2 as nk
+import pytest
+from fastapi import HTTPException
+
+import app
+import render_service
+import supabase
+
+
+@pytest.fixture
+def local_backend(local_backend, monkeypatch):
+    monkeypatch.setattr(render_service, "RENDER_WORKERS", 0)
+    monkeypatch.setattr(app, "STATIC_REVIEW_MANIFEST_CACHE", app.OrderedDict())
+    return local_backend / "objects" / "ecg-data"
+
+
+def _packets(seconds, random_state):
+    samples = nk.ecg_simulate(duration=seconds, sampling_rate=500, random_state=random_state)
+    counts = [round(value / 1000.0 / (app.ADS1298_VREF / app.ADS1298_GAIN) * app.ADS1298_MAX_CODE) for value in samples]
+    payload = bytearray()
+    for start in range(0, len(counts) - app.SAMPLES_PER_PACKET + 1, app.SAMPLES_PER_PACKET):
+        payload += bytes(app.STATUS_BYTES)
+        for _ in app.CHANNEL_LABELS:
+            for count in counts[start : start + app.SAMPLES_PER_PACKET]:
+                payload += count.to_bytes(3, "big", signed=True)
+        payload += bytes(app.ELAPSED_TIME_BYTES)
+    return bytes(payload)
+
+
+def _run_inline(fn, *args):
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_static_review_job_renders_every_window(local_backend, monkeypatch, shared):
+    monkeypatch.setattr(app, "process_pool_enabled", lambda: shared)
+    # Runs the worker function on this thread, against the same shared memory segment a worker would attach to.
+    monkeypatch.setattr(app, "submit_process", _run_inline)
+    supabase._upload_storage_bytes("session/s1/session.bin", _packets(45, random_state=3))
+    supabase._upload_storage_bytes("calibration/c1.bin", _packets(20, random_state=4))
+    record_id = supabase._insert_recording_row(
+        {
+            "user_id": "u1",
+            "sample_rate_hz": 500,
+            "session_object_key": "session/s1/session.bin",
+            "calibration_object_key": "calibration/c1.bin",
+        }
+    )["id"]
+
+    job_id, _, _ = app.claim_job("static_review", record_id, {"max_windows": None}, force=True)
+    app._static_review_job(job_id, record_id, force=True)
+
+    job = app.get_job(job_id)
+    assert job["status"] == "ready", job["error"]
+    manifest = supabase._fetch_storage_json(app._static_review_manifest_key(record_id))
+    assert manifest["status"] == "ready" and manifest["completed_window_count"] == 2
+    assert [window["window_index"] for window in manifest["windows"]] == [1, 2]
+    for window in manifest["windows"]:
+        assert window["status"] == "ready"
+        assert sorted(window["images"]) == ["ch2", "ch3", "ch4", "frontal", "sagittal", "transverse", "vcg3d"]
+        for object_key in window["images"].values():
+            assert (local_backend / object_key).read_bytes().startswith(b"\x89PNG")
+    metadata = supabase._fetch_processed_metadata(record_id)
+    assert metadata["artifact_keys"][app.STATIC_REVIEW_MANIFEST_ARTIFACT_TYPE] == app._static_review_manifest_key(record_id)
+
+
+def test_window_recompute_is_refused_while_the_manifest_has_a_writer(monkeypatch):
+    monkeypatch.setattr(app, "_rewrite_static_review_window", lambda record_id, window_index: {"window_index": window_index})
+    job_id, _, _ = app.claim_job("static_review", "rec-busy", {"max_windows": 5})
+
+    with pytest.raises(HTTPException) as queued:
+        app._recompute_static_review_window("rec-busy", 1)
+    assert queued.value.status_code == 409 and queued.value.detail["job_id"] == job_id
+
+    # A superseded job keeps writing until it notices the cancel; its slot is gone but its claim is not.
+    app.set_job(job_id, status="superseded")
+    app.release_job(job_id)
+    assert app._claim_static_manifest_writer("rec-busy", wait=False)
+    with pytest.raises(HTTPException) as running:
+        app._recompute_static_review_window("rec-busy", 1)
+    assert running.value.status_code == 409
+    app._release_static_manifest_writer("rec-busy")
+
+    assert app._recompute_static_review_window("rec-busy", 1) == {"window_index": 1}
+    assert "rec-busy" not in app.STATIC_REVIEW_MANIFEST_WRITERS
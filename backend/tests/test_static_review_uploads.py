@@ -0,0 +1,45 @@
+from concurrent.futures import Future
+
+from fastapi import HTTPException
+
+import app
+
+
+def _done(value=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(value)
+    return future
+
+
+def test_image_uploads_retry_transient_failures(monkeypatch):
+    calls = []
+
+    def upload(object_key, payload):
+        calls.append(object_key)
+        if len(calls) < 3:
+            raise HTTPException(status_code=502, detail="Supabase Storage upload unreachable")
+
+    monkeypatch.setattr(app, "_upload_storage_bytes", upload)
+    monkeypatch.setattr(app.time, "sleep", lambda seconds: None)
+
+    assert app._upload_static_review_image("review-static/rec/w/ch2.png", b"png") == "review-static/rec/w/ch2.png"
+    assert len(calls) == 3
+
+
+def test_window_is_ready_only_when_every_upload_succeeded():
+    entry = {"window_index": 4, "start_sample": 30000, "end_sample": 40000, "start_sec": 60.0, "end_sec": 80.0}
+    session_result = {"raw_beat_counts": {"CH2": 20}, "kept_beat_counts": {"CH2": 18}}
+    ready = app.PendingWindowEntry(entry, {"ch2": _done("a.png"), "ch3": _done("b.png")}, None, session_result)
+    failed = ready._replace(uploads={"ch2": _done("a.png"), "ch3": _done(error=HTTPException(status_code=502, detail="down"))})
+
+    assert app._finish_static_review_window_entry("rec", ready) == {
+        **entry,
+        "status": "ready",
+        "images": {"ch2": "a.png", "ch3": "b.png"},
+        "raw_beat_counts": {"CH2": 20},
+        "kept_beat_counts": {"CH2": 18},
+    }
+    assert app._finish_static_review_window_entry("rec", failed)["status"] == "error"
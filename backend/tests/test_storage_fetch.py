@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import executors
+import object_cache
+import supabase
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setattr(supabase, "SUPABASE_CONFIG_CACHE", {"url": "https://db.test", "key": "k", "bucket": "b"})
+    monkeypatch.setattr(supabase, "SUPABASE_ASYNC_CLIENT", None)
+    monkeypatch.setattr(supabase, "SUPABASE_ASYNC_LOOP", None)
+    monkeypatch.setattr(supabase, "SUPABASE_HTTP_METRICS", dict.fromkeys(supabase.SUPABASE_HTTP_METRICS, 0))
+    monkeypatch.setattr(object_cache, "MEMORY_CACHE", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "DISK_INDEX_LOADED", True)
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_DISK_BYTES", 0)
+    return monkeypatch
+
+
+def test_sync_fetch_hedges_the_slow_object(storage):
+    release = threading.Event()
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path.endswith("/session/s1.bin") and calls.count(request.url.path) == 1:
+            release.wait(5)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    storage.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    try:
+        objects = supabase._fetch_storage_objects(
+            ["session/s1.bin", "calibration/c1.bin", "session/s1.bin"],
+            hedge_after_s=0.05,
+        )
+    finally:
+        release.set()
+    # The losing attempt finishes in the background; let it settle before the fixture restores the metrics.
+    deadline = time.monotonic() + 5
+    while supabase.SUPABASE_HTTP_METRICS["in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert objects == {
+        "session/s1.bin": b"/storage/v1/object/b/session/s1.bin",
+        "calibration/c1.bin": b"/storage/v1/object/b/calibration/c1.bin",
+    }
+    assert supabase.SUPABASE_HTTP_METRICS["hedged"] == 1
+    assert supabase.SUPABASE_HTTP_METRICS["hedge_wins"] == 1
+
+
+def test_async_fetch_cancels_the_losing_attempt(storage):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if request.url.path.endswith("/session/s1.bin") and calls.count(request.url.path) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    storage.setattr(supabase, "_http_client_options", lambda: {"transport": httpx.MockTransport(handler)})
+
+    async def run():
+        objects = await supabase._fetch_storage_objects_async(["session/s1.bin", "calibration/c1.bin"], hedge_after_s=0.05)
+        await supabase._close_async_http_client()
+        return objects
+
+    objects = asyncio.run(asyncio.wait_for(run(), timeout=2))
+
+    assert sorted(objects) == ["calibration/c1.bin", "session/s1.bin"]
+    assert supabase.SUPABASE_HTTP_METRICS["hedge_wins"] == 1
+    assert supabase.SUPABASE_HTTP_METRICS["in_flight"] == 0
+
+
+def test_fetch_from_an_io_worker_does_not_wait_on_its_own_pool(storage):
+    storage.setattr(executors, "EXECUTOR_POOL_SIZES", {**executors.EXECUTOR_POOL_SIZES, "io": 1})
+    storage.setattr(executors, "EXECUTOR_POOLS", {})
+    storage.setattr(executors, "EXECUTOR_METRICS", {})
+    handler = lambda request: httpx.Response(200, content=request.url.path.encode())
+    storage.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+
+    future = executors.submit("io", supabase._fetch_storage_objects, ["session/s1.bin", "calibration/c1.bin"])
+    try:
+        objects = future.result(timeout=5)
+    finally:
+        executors.EXECUTOR_POOLS["io"].shutdown(wait=False, cancel_futures=True)
+
+    assert sorted(objects) == ["calibration/c1.bin", "session/s1.bin"]
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+import object_cache
+import supabase
+
+
+def _handler(request):
+    if request.url.path.endswith("/missing.bin"):
+        return httpx.Response(404, text="not found")
+    if request.url.path.startswith("/storage/"):
+        return httpx.Response(200, content=b'{"ok": true}')
+    return httpx.Response(200, json=[{"id": "rec-1"}])
+
+
+@pytest.fixture
+def mock_supabase(monkeypatch):
+    monkeypatch.setattr(supabase, "SUPABASE_CONFIG_CACHE", {"url": "https://db.test", "key": "k", "bucket": "b"})
+    monkeypatch.setattr(supabase, "SUPABASE_HEADERS_CACHE", {})
+    monkeypatch.setattr(supabase, "SUPABASE_HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(_handler)))
+    monkeypatch.setattr(supabase, "_http_client_options", lambda: {"transport": httpx.MockTransport(_handler)})
+    monkeypatch.setattr(supabase, "SUPABASE_ASYNC_CLIENT", None)
+    monkeypatch.setattr(supabase, "SUPABASE_ASYNC_LOOP", None)
+    monkeypatch.setattr(object_cache, "MEMORY_CACHE", object_cache.OrderedDict())
+    monkeypatch.setattr(object_cache, "DISK_INDEX_LOADED", True)
+    monkeypatch.setattr(object_cache, "OBJECT_CACHE_DISK_BYTES", 0)
+
+
+def test_async_helpers_match_sync_helpers(mock_supabase):
+    async def run_async():
+        results = await asyncio.gather(
+            supabase._fetch_recording_by_id_async("rec-1"),
+            supabase._fetch_storage_json_async("processed/rec-1/ch2.json"),
+            supabase._storage_object_exists_async("processed/rec-1/missing.bin"),
+        )
+        with pytest.raises(HTTPException) as excinfo:
+            await supabase._fetch_storage_bytes_async("processed/rec-1/missing.bin")
+        await supabase._close_async_http_client()
+        return results, excinfo.value.status_code
+
+    async_results, async_status = asyncio.run(run_async())
+
+    assert async_results == [
+        supabase._fetch_recording_by_id("rec-1"),
+        supabase._fetch_storage_json("processed/rec-1/ch2.json"),
+        supabase._storage_object_exists("processed/rec-1/missing.bin"),
+    ]
+    assert async_results == [{"id": "rec-1"}, {"ok": True}, False]
+    with pytest.raises(HTTPException) as excinfo:
+        supabase._fetch_storage_bytes("processed/rec-1/missing.bin")
+    assert excinfo.value.status_code == async_status == 502
+
+
+def test_async_driver_keeps_object_cache_disk_work_off_the_event_loop(mock_supabase, monkeypatch):
+    cache_threads = []
+
+    def recording(fn):
+        def wrapper(*args):
+            cache_threads.append(threading.current_thread())
+            return fn(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(supabase, "lookup_object", recording(object_cache.lookup_object))
+    monkeypatch.setattr(supabase, "store_object", recording(object_cache.store_object))
+
+    async def run_async():
+        loop_thread = threading.current_thread()
+        await supabase._fetch_storage_bytes_async("processed/rec-1/ch2.json")
+        await supabase._fetch_storage_objects_async(["processed/rec-1/ch3.json"])
+        await supabase._close_async_http_client()
+        return loop_thread
+
+    loop_thread = asyncio.run(run_async())
+
+    assert len(cache_threads) == 4
+    assert loop_thread not in cache_threads
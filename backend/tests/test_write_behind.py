@@ -0,0 +1,96 @@
+import pytest
+
+import write_behind
+
+
+def _row(record_id, chunk_index, packets=20):
+    return {"record_id": record_id, "chunk_index": chunk_index, "packet_count": packets}
+
+
+def test_flush_batches_chunk_rows_and_collapses_recording_updates(monkeypatch):
+    inserted = []
+    updated = []
+    monkeypatch.setattr(write_behind, "_insert_session_chunk_rows", lambda rows: inserted.append(list(rows)))
+    monkeypatch.setattr(write_behind, "_update_recording_row", lambda record_id, payload: updated.append((record_id, payload)))
+    monkeypatch.setattr(write_behind, "write_behind_running", lambda: True)
+    monkeypatch.setattr(write_behind, "PENDING_CHUNK_ROWS", {})
+    monkeypatch.setattr(write_behind, "PENDING_RECORDING_UPDATES", {})
+
+    for index in (2, 0, 1):
+        write_behind.queue_chunk_row(_row("rec-a", index))
+        write_behind.queue_recording_update("rec-a", {"packet_count": (index + 1) * 20, "sample_count": index})
+    write_behind.queue_chunk_row(_row("rec-a", 1, packets=19))
+    write_behind.queue_chunk_row(_row("rec-b", 0))
+
+    write_behind.flush_write_behind("rec-a")
+
+    assert inserted == [[_row("rec-a", 0), _row("rec-a", 1, packets=19), _row("rec-a", 2)]]
+    assert updated == [("rec-a", {"packet_count": 40, "sample_count": 1})]
+    assert list(write_behind.PENDING_CHUNK_ROWS) == [("rec-b", 0)]
+
+
+def test_failed_flush_requeues_without_overwriting_newer_updates(monkeypatch):
+    def fail(record_id, payload):
+        write_behind.PENDING_RECORDING_UPDATES["rec-a"] = {"sample_count": 99}
+        raise RuntimeError("supabase down")
+
+    monkeypatch.setattr(write_behind, "_insert_session_chunk_rows", lambda rows: None)
+    monkeypatch.setattr(write_behind, "_update_recording_row", fail)
+    monkeypatch.setattr(write_behind, "write_behind_running", lambda: True)
+    monkeypatch.setattr(write_behind, "PENDING_CHUNK_ROWS", {})
+    monkeypatch.setattr(write_behind, "PENDING_RECORDING_UPDATES", {})
+
+    write_behind.queue_chunk_row(_row("rec-a", 0))
+    write_behind.queue_recording_update("rec-a", {"packet_count": 20, "sample_count": 5})
+    with pytest.raises(RuntimeError):
+        write_behind.flush_write_behind()
+
+    assert write_behind.PENDING_CHUNK_ROWS == {}
+    assert write_behind.PENDING_RECORDING_UPDATES == {"rec-a": {"packet_count": 20, "sample_count": 99}}
+
+
+def test_live_previews_are_coalesced_rate_limited_and_bounded(monkeypatch):
+    written = []
+    built = []
+
+    def build_row(record_id):
+        built.append(record_id)
+        return {"record_id": record_id}
+
+    monkeypatch.setattr(write_behind, "_upsert_live_preview_rows", lambda rows: written.append([row["record_id"] for row in rows]))
+    monkeypatch.setattr(write_behind, "write_behind_running", lambda: True)
+    monkeypatch.setattr(write_behind, "PENDING_LIVE_PREVIEWS", write_behind.OrderedDict())
+    monkeypatch.setattr(write_behind, "LIVE_PREVIEW_LAST_WRITE", {"rec-b": write_behind.time.monotonic()})
+    monkeypatch.setattr(write_behind, "LIVE_PREVIEW_MAX_PENDING", 2)
+    monkeypatch.setattr(write_behind, "LIVE_PREVIEW_PERSIST_INTERVAL_S", 60.0)
+
+    for record_id in ("rec-a", "rec-a", "rec-b", "rec-a", "rec-b"):
+        write_behind.queue_live_preview(record_id, build_row)
+    write_behind.flush_write_behind()
+
+    assert written == [["rec-a"]]
+    assert list(write_behind.PENDING_LIVE_PREVIEWS) == ["rec-b"]
+
+    write_behind.queue_live_preview("rec-c", build_row)
+    write_behind.queue_live_preview("rec-d", build_row)
+    assert list(write_behind.PENDING_LIVE_PREVIEWS) == ["rec-c", "rec-d"]
+
+    write_behind.flush_write_behind("rec-d")
+    assert written == [["rec-a"], ["rec-d"]]
+    assert built == ["rec-a", "rec-d"]
+
+
+def test_timed_flush_forgets_records_past_their_preview_interval(monkeypatch):
+    now = write_behind.time.monotonic()
+    monkeypatch.setattr(write_behind, "write_behind_running", lambda: True)
+    monkeypatch.setattr(write_behind, "PENDING_CHUNK_ROWS", {})
+    monkeypatch.setattr(write_behind, "PENDING_RECORDING_UPDATES", {})
+    monkeypatch.setattr(write_behind, "PENDING_LIVE_PREVIEWS", write_behind.OrderedDict())
+    monkeypatch.setattr(write_behind, "LIVE_PREVIEW_LAST_WRITE", {"ended": now - 61.0, "live": now - 1.0})
+    monkeypatch.setattr(write_behind, "LIVE_PREVIEW_PERSIST_INTERVAL_S", 60.0)
+
+    write_behind.flush_write_behind("other")
+    assert sorted(write_behind.LIVE_PREVIEW_LAST_WRITE) == ["ended", "live"]
+
+    write_behind.flush_write_behind()
+    assert list(write_behind.LIVE_PREVIEW_LAST_WRITE) == ["live"]
@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, Optional
 
+from signal_pyramid import minmax_downsample
+
 logger = logging.getLogger("ecg-backend")
 
 LIVE_SESSION_STATE: Dict[str, Dict[str, Any]] = {}
@@ -35,11 +37,7 @@ def _downsample_series(values: list[float], target_count: int) -> list[float]:
         return list(values)
     if target_count == 1:
         return [values[-1]]
-    last_index = len(values) - 1
-    return [
-        values[(index * last_index) // (target_count - 1)]
-        for index in range(target_count)
-    ]
+    return minmax_downsample(values, target_count)
 
 
 def trim_live_visual_snapshot(
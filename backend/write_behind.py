@@ -0,0 +1,254 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from supabase import _insert_session_chunk_rows, _update_recording_row, _upsert_live_preview_rows
+
+logger = logging.getLogger("ecg-backend")
+
+WRITE_BEHIND_FLUSH_INTERVAL_S = max(0.1, float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL_S") or 2.0))
+WRITE_BEHIND_MAX_ROWS = max(1, int(os.getenv("WRITE_BEHIND_MAX_ROWS") or 100))
+# PostgREST handles large arrays fine, but keep each request body bounded.
+WRITE_BEHIND_BATCH_ROWS = 500
+LIVE_PREVIEW_PERSIST_INTERVAL_S = max(0.0, float(os.getenv("LIVE_PREVIEW_PERSIST_INTERVAL_S") or 5.0))
+LIVE_PREVIEW_MAX_PENDING = max(1, int(os.getenv("LIVE_PREVIEW_MAX_PENDING") or 256))
+
+LivePreviewBuilder = Callable[[str], Optional[Dict[str, Any]]]
+
+# Chunk rows keyed by (record_id, chunk_index) so a retried chunk replaces its pending row.
+PENDING_CHUNK_ROWS: Dict[Tuple[str, int], Dict[str, Any]] = {}
+# Latest merged ecg_recordings patch per record.
+PENDING_RECORDING_UPDATES: Dict[str, Dict[str, Any]] = {}
+# Live previews store a builder, not a row: the arrays are copied and serialized only when written.
+PENDING_LIVE_PREVIEWS: "OrderedDict[str, LivePreviewBuilder]" = OrderedDict()
+LIVE_PREVIEW_LAST_WRITE: Dict[str, float] = {}
+WRITE_BEHIND_LOCK = threading.Lock()
+# Serializes flushes so an older batch never lands after a newer one.
+WRITE_BEHIND_FLUSH_LOCK = threading.Lock()
+WRITE_BEHIND_WAKE = threading.Event()
+WRITE_BEHIND_STOP = threading.Event()
+WRITE_BEHIND_THREAD: Optional[threading.Thread] = None
+WRITE_BEHIND_METRICS: Dict[str, float] = {
+    "chunk_rows_queued": 0,
+    "recording_updates_queued": 0,
+    "live_previews_queued": 0,
+    "chunk_rows_written": 0,
+    "recording_updates_written": 0,
+    "live_previews_written": 0,
+    "live_previews_superseded": 0,
+    "live_previews_dropped": 0,
+    "requests": 0,
+    "flushes": 0,
+    "failed_flushes": 0,
+    "total_flush_ms": 0.0,
+}
+
+
+def write_behind_running() -> bool:
+    return WRITE_BEHIND_THREAD is not None and WRITE_BEHIND_THREAD.is_alive()
+
+
+def queue_chunk_row(row: Dict[str, Any]) -> None:
+    with WRITE_BEHIND_LOCK:
+        PENDING_CHUNK_ROWS[(str(row["record_id"]), int(row["chunk_index"]))] = row
+        WRITE_BEHIND_METRICS["chunk_rows_queued"] += 1
+        pending = len(PENDING_CHUNK_ROWS)
+    if not write_behind_running():
+        # No flusher (scripts, tests, worker processes): behave as a write-through.
+        flush_write_behind(str(row["record_id"]))
+    elif pending >= WRITE_BEHIND_MAX_ROWS:
+        WRITE_BEHIND_WAKE.set()
+
+
+def queue_recording_update(record_id: str, payload: Dict[str, Any]) -> None:
+    with WRITE_BEHIND_LOCK:
+        PENDING_RECORDING_UPDATES.setdefault(record_id, {}).update(payload)
+        WRITE_BEHIND_METRICS["recording_updates_queued"] += 1
+    if not write_behind_running():
+        flush_write_behind(record_id)
+
+
+def queue_live_preview(record_id: str, build_row: LivePreviewBuilder) -> None:
+    dropped: Optional[str] = None
+    with WRITE_BEHIND_LOCK:
+        WRITE_BEHIND_METRICS["live_previews_queued"] += 1
+        if record_id in PENDING_LIVE_PREVIEWS:
+            WRITE_BEHIND_METRICS["live_previews_superseded"] += 1
+        elif len(PENDING_LIVE_PREVIEWS) >= LIVE_PREVIEW_MAX_PENDING:
+            dropped, _ = PENDING_LIVE_PREVIEWS.popitem(last=False)
+            WRITE_BEHIND_METRICS["live_previews_dropped"] += 1
+        PENDING_LIVE_PREVIEWS[record_id] = build_row
+    if dropped is not None:
+        logger.warning("[WRITE_BEHIND] live_preview_dropped record_id=%s pending=%s", dropped, LIVE_PREVIEW_MAX_PENDING)
+    if not write_behind_running():
+        flush_write_behind(record_id)
+
+
+def _take_pending(
+    record_id: Optional[str],
+    chunks_only: bool = False,
+) -> Tuple[List[Dict[str, Any]], Dict[str, LivePreviewBuilder], Dict[str, Dict[str, Any]]]:
+    now = time.monotonic()
+    with WRITE_BEHIND_LOCK:
+        chunk_keys = [key for key in PENDING_CHUNK_ROWS if record_id is None or key[0] == record_id]
+        chunk_rows = [PENDING_CHUNK_ROWS.pop(key) for key in chunk_keys]
+        if chunks_only:
+            return chunk_rows, {}, {}
+        if record_id is None:
+            # An entry past its interval reads the same as no entry, so timed flushes drop them.
+            expired = [key for key, written_at in LIVE_PREVIEW_LAST_WRITE.items() if now - written_at >= LIVE_PREVIEW_PERSIST_INTERVAL_S]
+            for key in expired:
+                del LIVE_PREVIEW_LAST_WRITE[key]
+        # A forced flush writes its record's preview now; timed flushes wait out the per-record interval.
+        preview_keys = [
+            key
+            for key in PENDING_LIVE_PREVIEWS
+            if key == record_id
+            or (record_id is None and now - LIVE_PREVIEW_LAST_WRITE.get(key, 0.0) >= LIVE_PREVIEW_PERSIST_INTERVAL_S)
+        ]
+        previews = {key: PENDING_LIVE_PREVIEWS.pop(key) for key in preview_keys}
+        update_keys = [key for key in PENDING_RECORDING_UPDATES if record_id is None or key == record_id]
+        updates = {key: PENDING_RECORDING_UPDATES.pop(key) for key in update_keys}
+    return chunk_rows, previews, updates
+
+
+def _requeue(
+    chunk_rows: List[Dict[str, Any]],
+    previews: Dict[str, LivePreviewBuilder],
+    updates: Dict[str, Dict[str, Any]],
+) -> None:
+    with WRITE_BEHIND_LOCK:
+        for row in chunk_rows:
+            PENDING_CHUNK_ROWS.setdefault((str(row["record_id"]), int(row["chunk_index"])), row)
+        for record_id, build_row in previews.items():
+            PENDING_LIVE_PREVIEWS.setdefault(record_id, build_row)
+        for record_id, payload in updates.items():
+            # Anything queued since the failed flush is newer and wins.
+            PENDING_RECORDING_UPDATES[record_id] = {**payload, **PENDING_RECORDING_UPDATES.get(record_id, {})}
+
+
+def flush_write_behind(record_id: Optional[str] = None, chunks_only: bool = False) -> None:
+    # chunks_only lands just the chunk rows, leaving previews and counters to their timed flush.
+    with WRITE_BEHIND_FLUSH_LOCK:
+        chunk_rows, previews, updates = _take_pending(record_id, chunks_only)
+        if not chunk_rows and not previews and not updates:
+            return
+        started_at = time.perf_counter()
+        requests = 0
+        written_rows = 0
+        previews_written = False
+        preview_rows: List[Dict[str, Any]] = []
+        written_updates: List[str] = []
+        try:
+            chunk_rows.sort(key=lambda row: (str(row["record_id"]), int(row["chunk_index"])))
+            while written_rows < len(chunk_rows):
+                batch = chunk_rows[written_rows : written_rows + WRITE_BEHIND_BATCH_ROWS]
+                _insert_session_chunk_rows(batch)
+                requests += 1
+                written_rows += len(batch)
+            for preview_record_id, build_row in previews.items():
+                row = build_row(preview_record_id)
+                if row is not None:
+                    preview_rows.append(row)
+            if preview_rows:
+                _upsert_live_preview_rows(preview_rows)
+                requests += 1
+            previews_written = True
+            written_at = time.monotonic()
+            with WRITE_BEHIND_LOCK:
+                for preview_record_id in previews:
+                    LIVE_PREVIEW_LAST_WRITE[preview_record_id] = written_at
+                if record_id is not None and not chunks_only:
+                    # Forced flushes come from session end; nothing more is timed for this record.
+                    LIVE_PREVIEW_LAST_WRITE.pop(record_id, None)
+            for pending_record_id, payload in updates.items():
+                _update_recording_row(pending_record_id, payload)
+                requests += 1
+                written_updates.append(pending_record_id)
+        except Exception as exc:
+            _requeue(
+                chunk_rows[written_rows:],
+                {} if previews_written else previews,
+                {key: payload for key, payload in updates.items() if key not in written_updates},
+            )
+            logger.warning(
+                "[WRITE_BEHIND] flush_failed record_id=%s rows_left=%s previews_left=%s updates_left=%s error=%s",
+                record_id,
+                len(chunk_rows) - written_rows,
+                0 if previews_written else len(previews),
+                len(updates) - len(written_updates),
+                exc,
+            )
+            raise
+        finally:
+            failed = written_rows < len(chunk_rows) or not previews_written or len(written_updates) < len(updates)
+            with WRITE_BEHIND_LOCK:
+                WRITE_BEHIND_METRICS["flushes"] += 1
+                WRITE_BEHIND_METRICS["requests"] += requests
+                WRITE_BEHIND_METRICS["chunk_rows_written"] += written_rows
+                WRITE_BEHIND_METRICS["live_previews_written"] += len(preview_rows) if previews_written else 0
+                WRITE_BEHIND_METRICS["recording_updates_written"] += len(written_updates)
+                WRITE_BEHIND_METRICS["total_flush_ms"] += (time.perf_counter() - started_at) * 1000.0
+                if failed:
+                    WRITE_BEHIND_METRICS["failed_flushes"] += 1
+        logger.info(
+            "[WRITE_BEHIND] flushed record_id=%s chunk_rows=%s live_previews=%s recording_updates=%s requests=%s",
+            record_id,
+            written_rows,
+            len(preview_rows),
+            len(written_updates),
+            requests,
+        )
+
+
+def _flush_loop() -> None:
+    while not WRITE_BEHIND_STOP.is_set():
+        WRITE_BEHIND_WAKE.wait(WRITE_BEHIND_FLUSH_INTERVAL_S)
+        WRITE_BEHIND_WAKE.clear()
+        try:
+            flush_write_behind()
+        except Exception:
+            # Rows were requeued; the next tick retries them.
+            pass
+
+
+def start_write_behind() -> None:
+    global WRITE_BEHIND_THREAD
+    if write_behind_running():
+        return
+    WRITE_BEHIND_STOP.clear()
+    WRITE_BEHIND_THREAD = threading.Thread(target=_flush_loop, name="ecg-write-behind", daemon=True)
+    WRITE_BEHIND_THREAD.start()
+
+
+def stop_write_behind() -> None:
+    global WRITE_BEHIND_THREAD
+    thread, WRITE_BEHIND_THREAD = WRITE_BEHIND_THREAD, None
+    if thread is not None:
+        WRITE_BEHIND_STOP.set()
+        WRITE_BEHIND_WAKE.set()
+        thread.join(timeout=WRITE_BEHIND_FLUSH_INTERVAL_S + 30)
+    with WRITE_BEHIND_LOCK:
+        # Shutdown writes every pending preview regardless of its interval.
+        LIVE_PREVIEW_LAST_WRITE.clear()
+    try:
+        flush_write_behind()
+    except Exception:
+        logger.exception("[WRITE_BEHIND] final_flush_failed")
+
+
+def write_behind_metrics() -> Dict[str, Any]:
+    with WRITE_BEHIND_LOCK:
+        snapshot: Dict[str, Any] = {
+            key: round(value, 3) if isinstance(value, float) else value for key, value in WRITE_BEHIND_METRICS.items()
+        }
+        snapshot["pending_chunk_rows"] = len(PENDING_CHUNK_ROWS)
+        snapshot["pending_live_previews"] = len(PENDING_LIVE_PREVIEWS)
+        snapshot["pending_recording_updates"] = len(PENDING_RECORDING_UPDATES)
+    queued = snapshot["chunk_rows_queued"] + snapshot["recording_updates_queued"] + snapshot["live_previews_queued"]
+    # Writes the per-chunk path would have made for each request actually sent.
+    snapshot["writes_per_request"] = round(queued / snapshot["requests"], 2) if snapshot["requests"] else 0.0
+    return snapshot
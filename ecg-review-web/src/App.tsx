@@ -105,8 +105,10 @@ type ReviewProcessingJob = {
   record_id: string;
   details?: {
     resample?: boolean;
+    stage?: string;
   };
   error?: string | null;
+  superseded_by?: string | null;
 };
 
 type ReviewArtifactsNotReadyDetail = {
@@ -206,6 +208,7 @@ type StaticReviewJob = {
   record_id: string;
   details?: Record<string, unknown>;
   error?: string | null;
+  superseded_by?: string | null;
 };
 
 const CHANNELS = ["CH2", "CH3", "CH4"] as const;
@@ -213,6 +216,9 @@ const REVIEW_MODES = ["CH2", "CH3", "CH4", "2D Vectorcardiography", "3D Vectorgr
 const DEFAULT_ECG_Y_MAX_MV = 0.6;
 const DEFAULT_ECG_Y_MIN_MV = -0.3;
 const LIVE_VISUAL_BUFFER_SAMPLES = 1000;
+// EventSource reconnects on its own; after this many errors in a row the page polls instead.
+const SSE_MAX_CONSECUTIVE_ERRORS = 3;
+const SSE_FALLBACK_POLL_MS = 2000;
 const BEAT_MARKER_COLORS: Record<keyof BeatMarkers, string> = {
   P: "#1f7aec",
   Q: "#9a3412",
@@ -1653,50 +1659,109 @@ function ReviewPage({ currentPath }: { currentPath: string }) {
       return;
     }
     let active = true;
-    let timeoutId: number | undefined;
+    let consecutiveErrors = 0;
+    let pollTimer: number | null = null;
     const jobId = processingJob.job_id;
+    const url = `/api/review/process/${jobId}/events`;
+    console.log(`[REVIEW_PROCESS] sse connect url=${url}`);
+    const eventSource = new EventSource(url);
+
+    function stop() {
+      eventSource.close();
+      if (pollTimer !== null) {
+        window.clearInterval(pollTimer);
+        pollTimer = null;
+      }
+    }
+
+    function applyJob(payload: ReviewProcessingJob) {
+      consecutiveErrors = 0;
+      console.log(
+        `[REVIEW_PROCESS] status jobId=${payload.job_id} recordId=${payload.record_id} status=${payload.status} stage=${String(payload.details?.stage ?? "")} resample=${String(payload.details?.resample)}`,
+      );
+      if (payload.status === "ready") {
+        stop();
+        setProcessingJob(payload);
+        setProcessActionPending(false);
+        setArtifactsNotReady(null);
+        setReviewRefreshToken((value) => value + 1);
+        return;
+      }
+      if (payload.status === "superseded" && payload.superseded_by) {
+        // A newer request for this record took over; follow its job instead.
+        stop();
+        console.log(`[REVIEW_PROCESS] superseded jobId=${payload.job_id} next=${payload.superseded_by}`);
+        setProcessingJob({ ...payload, job_id: payload.superseded_by, status: "queued", error: null });
+        return;
+      }
+      if (payload.status === "error" || payload.status === "superseded") {
+        stop();
+        setProcessingJob(payload);
+        setProcessActionPending(false);
+        if (payload.status === "error") {
+          setError(payload.error || "Processing failed.");
+        }
+        return;
+      }
+      setProcessingJob((current) =>
+        current && current.job_id === payload.job_id && current.status === payload.status ? current : payload,
+      );
+    }
+
+    function giveUp(message: string) {
+      stop();
+      setProcessingJob(null);
+      setProcessActionPending(false);
+      setError(message);
+    }
 
     async function poll() {
-      const url = `/api/review/process/${jobId}`;
-      console.log(`[REVIEW_PROCESS] GET ${url}`);
       try {
-        const response = await fetch(url);
+        const response = await fetch(`/api/review/process/${jobId}`);
         if (!response.ok) {
           const text = await response.text();
-          throw new Error(`Process status failed: ${response.status} ${text}`);
+          throw new Error(`Processing status fetch failed: ${response.status} ${text}`);
         }
         const payload = (await response.json()) as ReviewProcessingJob;
         if (!active) return;
-        console.log(
-          `[REVIEW_PROCESS] status jobId=${payload.job_id} recordId=${payload.record_id} status=${payload.status} resample=${String(payload.details?.resample)}`,
-        );
-        setProcessingJob(payload);
-        if (payload.status === "ready") {
-          setProcessActionPending(false);
-          setArtifactsNotReady(null);
-          setReviewRefreshToken((value) => value + 1);
-          return;
-        }
-        if (payload.status === "error") {
-          setProcessActionPending(false);
-          setError(payload.error || "Processing failed.");
-          return;
-        }
-        timeoutId = window.setTimeout(poll, 1000);
+        applyJob(payload);
       } catch (err) {
         if (!active) return;
-        console.error("[REVIEW_PROCESS] poll error", err);
-        setProcessActionPending(false);
-        setError(err instanceof Error ? err.message : "Unknown processing status error");
+        consecutiveErrors += 1;
+        console.warn(`[REVIEW_PROCESS] poll error jobId=${jobId} attempt=${consecutiveErrors}`, err);
+        if (consecutiveErrors >= SSE_MAX_CONSECUTIVE_ERRORS) {
+          giveUp(err instanceof Error ? err.message : "Lost track of the processing job.");
+        }
       }
     }
 
-    timeoutId = window.setTimeout(poll, 1000);
+    eventSource.addEventListener("job", (event) => {
+      if (!active) return;
+      let payload: ReviewProcessingJob;
+      try {
+        payload = JSON.parse((event as MessageEvent).data) as ReviewProcessingJob;
+      } catch {
+        console.warn("[REVIEW_PROCESS] sse malformed job event");
+        return;
+      }
+      applyJob(payload);
+    });
+    eventSource.onerror = () => {
+      if (!active || pollTimer !== null) return;
+      consecutiveErrors += 1;
+      console.warn(`[REVIEW_PROCESS] sse error jobId=${jobId} attempt=${consecutiveErrors}`);
+      if (consecutiveErrors >= SSE_MAX_CONSECUTIVE_ERRORS) {
+        console.warn(`[REVIEW_PROCESS] sse closed, polling jobId=${jobId}`);
+        eventSource.close();
+        consecutiveErrors = 0;
+        pollTimer = window.setInterval(() => void poll(), SSE_FALLBACK_POLL_MS);
+        void poll();
+      }
+    };
+
     return () => {
       active = false;
-      if (timeoutId !== undefined) {
-        window.clearTimeout(timeoutId);
-      }
+      stop();
     };
   }, [processingJob]);
 
@@ -2231,40 +2296,104 @@ function StaticReviewPage({ currentPath }: { currentPath: string }) {
   useEffect(() => {
     if (!job || !["queued", "running"].includes(job.status)) return;
     let active = true;
-    let timeoutId: number | undefined;
+    let completedWindowCount = -1;
+    let consecutiveErrors = 0;
+    let pollTimer: number | null = null;
     const jobId = job.job_id;
+    const jobStatus = job.status;
+    const eventSource = new EventSource(`/api/review_static/process/${jobId}/events`);
+
+    function stop() {
+      eventSource.close();
+      if (pollTimer !== null) {
+        window.clearInterval(pollTimer);
+        pollTimer = null;
+      }
+    }
+
+    function applyJob(payload: StaticReviewJob) {
+      consecutiveErrors = 0;
+      if (payload.status === "ready") {
+        stop();
+        setJob(payload);
+        setProcessing(false);
+        void loadManifest(payload.record_id, true);
+        return;
+      }
+      if (payload.status === "superseded" && payload.superseded_by) {
+        // A newer request for this record took over; follow its job instead.
+        stop();
+        setJob({ ...payload, job_id: payload.superseded_by, status: "queued", error: null });
+        return;
+      }
+      if (payload.status === "error" || payload.status === "superseded") {
+        stop();
+        setJob(payload);
+        setProcessing(false);
+        if (payload.status === "error") {
+          setError(payload.error || "Static review plot generation failed.");
+        }
+        return;
+      }
+      if (payload.status !== jobStatus) {
+        setJob(payload);
+      }
+      const nextCompleted = Number(payload.details?.completed_window_count ?? 0);
+      if (nextCompleted !== completedWindowCount) {
+        completedWindowCount = nextCompleted;
+        void loadManifest(payload.record_id, true);
+      }
+    }
+
     async function poll() {
       try {
         const response = await fetch(`/api/review_static/process/${jobId}`);
         if (!response.ok) {
           const text = await response.text();
-          throw new Error(`Static review job poll failed: ${response.status} ${text}`);
+          throw new Error(`Static review status fetch failed: ${response.status} ${text}`);
         }
         const payload = (await response.json()) as StaticReviewJob;
         if (!active) return;
-        setJob(payload);
-        await loadManifest(payload.record_id, true);
-        if (payload.status === "ready") {
-          setProcessing(false);
-          await loadManifest(payload.record_id, true);
-          return;
-        }
-        if (payload.status === "error") {
-          setProcessing(false);
-          setError(payload.error || "Static review plot generation failed.");
-          return;
-        }
-        timeoutId = window.setTimeout(poll, 1800);
+        applyJob(payload);
       } catch (err) {
         if (!active) return;
-        setProcessing(false);
-        setError(err instanceof Error ? err.message : "Unknown static review job error");
+        consecutiveErrors += 1;
+        console.warn(`[STATIC_REVIEW] poll error jobId=${jobId} attempt=${consecutiveErrors}`, err);
+        if (consecutiveErrors >= SSE_MAX_CONSECUTIVE_ERRORS) {
+          stop();
+          setJob(null);
+          setProcessing(false);
+          setError(err instanceof Error ? err.message : "Lost track of the static review job.");
+        }
       }
     }
-    timeoutId = window.setTimeout(poll, 900);
+
+    eventSource.addEventListener("job", (event) => {
+      if (!active) return;
+      let payload: StaticReviewJob;
+      try {
+        payload = JSON.parse((event as MessageEvent).data) as StaticReviewJob;
+      } catch {
+        console.warn("[STATIC_REVIEW] sse malformed job event");
+        return;
+      }
+      applyJob(payload);
+    });
+    eventSource.onerror = () => {
+      if (!active || pollTimer !== null) return;
+      consecutiveErrors += 1;
+      console.warn(`[STATIC_REVIEW] sse error jobId=${jobId} attempt=${consecutiveErrors}`);
+      if (consecutiveErrors >= SSE_MAX_CONSECUTIVE_ERRORS) {
+        console.warn(`[STATIC_REVIEW] sse closed, polling jobId=${jobId}`);
+        eventSource.close();
+        consecutiveErrors = 0;
+        pollTimer = window.setInterval(() => void poll(), SSE_FALLBACK_POLL_MS);
+        void poll();
+      }
+    };
     return () => {
       active = false;
-      if (timeoutId) window.clearTimeout(timeoutId);
+      stop();
     };
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [job?.job_id, job?.status]);
@@ -2501,6 +2630,8 @@ function LiveSessionPage({ currentPath }: { currentPath: string }) {
     let stopped = false;
     let inFlight = false;
     let eventSource: EventSource | null = null;
+    let consecutiveErrors = 0;
+    let pollTimer: number | null = null;
 
     async function load() {
       if (!active || stopped || inFlight) {
@@ -2566,6 +2697,10 @@ function LiveSessionPage({ currentPath }: { currentPath: string }) {
         setError(null);
         if (payload.status === "ended") {
           stopped = true;
+          if (pollTimer !== null) {
+            window.clearInterval(pollTimer);
+            pollTimer = null;
+          }
           setPollingStopped(true);
         } else {
           setPollingStopped(false);
@@ -2597,6 +2732,7 @@ function LiveSessionPage({ currentPath }: { currentPath: string }) {
       if (!active || stopped) {
         return;
       }
+      consecutiveErrors = 0;
       try {
         const payload = JSON.parse((event as MessageEvent).data) as {
           record_id?: string;
@@ -2621,15 +2757,24 @@ function LiveSessionPage({ currentPath }: { currentPath: string }) {
       void load();
     });
     eventSource.onerror = () => {
-      if (!active || stopped) {
+      if (!active || stopped || pollTimer !== null) {
         return;
       }
-      console.warn(`[LIVE] sse error recordId=${recordId || "latest"}`);
+      consecutiveErrors += 1;
+      console.warn(`[LIVE] sse error recordId=${recordId || "latest"} attempt=${consecutiveErrors}`);
+      if (consecutiveErrors >= SSE_MAX_CONSECUTIVE_ERRORS && eventSource) {
+        console.warn(`[LIVE] sse closed, polling recordId=${recordId || "latest"}`);
+        eventSource.close();
+        pollTimer = window.setInterval(() => void load(), SSE_FALLBACK_POLL_MS);
+      }
       void load();
     };
 
     return () => {
       active = false;
+      if (pollTimer !== null) {
+        window.clearInterval(pollTimer);
+      }
       if (eventSource) {
         console.log(`[LIVE] sse close recordId=${recordId || "latest"}`);
         eventSource.close();
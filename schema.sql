@@ -46,6 +46,7 @@ create table if not exists public.ecg_session_chunks (
   record_id uuid not null references public.ecg_recordings(id) on delete cascade,
   chunk_index integer not null,
   object_key text not null,
+  byte_offset integer,
   byte_length integer,
   packet_count integer,
   sample_count integer,
@@ -54,6 +55,9 @@ create table if not exists public.ecg_session_chunks (
   primary key (record_id, chunk_index)
 );
 
+-- Set once compaction has merged the chunk into a segment object.
+alter table public.ecg_session_chunks add column if not exists byte_offset integer;
+
 create index if not exists idx_ecg_session_chunks_created_at
   on public.ecg_session_chunks (created_at desc);
 